@@ -0,0 +1,54 @@
+import argparse
+import datetime
+import json
+import platform
+import sys
+from _benchmarks_chinese_checkers import _bench_board, _bench_game
+
+
+def compare(results: list, baseline_file: str, threshold: float) -> bool:
+    """
+    This function compares results with the results of a previous run and prints the changes.
+    :param results: The results of this run.
+    :param baseline_file: A JSON file written by a previous run.
+    :param threshold: The relative slowdown that counts as a regression, e.g. 0.1 for 10%.
+    :return: True if no benchmark regressed.
+    """
+    with open(baseline_file) as file:
+        baseline = {result["name"]: result for result in json.load(file)["results"]}
+    ok = True
+    for result in results:
+        old = baseline.get(result["name"])
+        if old is None:
+            continue
+        ratio = result["ops_per_sec"] / old["ops_per_sec"]
+        regressed = ratio < 1 - threshold
+        ok = ok and not regressed
+        print(f"{result['name']:<40} {ratio:6.2f}x {'REGRESSION' if regressed else ''}")
+    return ok
+
+
+def run_benchmarks() -> None:
+    """
+    Runs the benchmarks, prints the results, saves them as JSON and optionally compares them to a baseline.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark move generation, move application and full games.")
+    parser.add_argument("--output", default="bench_results.json", help="the JSON file to save the results to")
+    parser.add_argument("--compare", default=None, help="a JSON file of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown that fails the comparison")
+    parser.add_argument("--min-time", type=float, default=0.5, help="about how many seconds every benchmark runs")
+    args = parser.parse_args()
+
+    results = _bench_board.benchmarks(args.min_time) + _bench_game.benchmarks(args.min_time)
+    for result in results:
+        print(f"{result['name']:<40} {result['ops_per_sec']:>12.1f} ops/sec {result['peak_alloc_bytes']:>10} bytes")
+    with open(args.output, "w") as file:
+        json.dump({"timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                   "python": platform.python_version(), "platform": platform.platform(),
+                   "results": results}, file, indent=2)
+    if args.compare is not None and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,93 @@
+from typing import List
+from chinese_checkers.board import Board, CELLS
+from chinese_checkers.piece import Piece
+from chinese_checkers.game_state import GameState, GameConfig
+from chinese_checkers.ai import SearchAI
+from _benchmarks_chinese_checkers._harness import measure, Result
+
+
+def opening_position() -> GameState:
+    """
+    :return: A 2 player game at its starting position.
+    """
+    return GameState(GameConfig(2))
+
+
+def played_position(num_of_players: int, plies: int) -> GameState:
+    """
+    This function plays a game with shallow computer players, so the position is the same on every run.
+    :param num_of_players: The number of players.
+    :param plies: The number of moves to play.
+    :return: The game after the moves.
+    """
+    state = GameState(GameConfig(num_of_players, time_budget=60, max_depth=1, max_plies=plies))
+    state.run()
+    return state
+
+
+def busiest_piece(board: Board) -> Piece:
+    """
+    This function returns a copy of the piece with the most moves. The copy is not on the board,
+    so optional_moves searches its moves every time instead of returning the cached ones.
+    :param board: The board to search.
+    :return: A Piece object.
+    """
+    piece = max(board.pieces.values(), key=lambda p: (len(board.optional_moves(p)), p.get_location()))
+    return Piece(piece.get_color(), piece.get_id(), piece.get_location())
+
+
+def jump_lattice() -> Board:
+    """
+    :return: A board with a piece on every cell of the odd rows, so a piece on an even row has long jump chains.
+    """
+    board = Board()
+    for i, cell in enumerate(CELLS):
+        if cell[0] % 2 == 1:
+            board.add_piece(Piece((255, 0, 0), f"(255, 0, 0){i}", cell))
+    return board
+
+
+def benchmarks(min_time: float) -> List[Result]:
+    """
+    This function runs the board benchmarks.
+    :param min_time: About how many seconds every benchmark runs for.
+    :return: The results.
+    """
+    results = []
+    positions = [("opening", opening_position()), ("midgame", played_position(2, 40)),
+                 ("crowded endgame", played_position(6, 150))]
+    for name, state in positions:
+        board = state.get_board()
+        piece = busiest_piece(board)
+        results.append(measure(f"optional_moves {name}", lambda: board.optional_moves(piece), min_time))
+        player = state.get_current_player()
+        results.append(measure(f"legal_moves cached {name}", lambda: board.legal_moves(player), min_time))
+
+    lattice = jump_lattice()
+    results.append(measure("hops long chains", lambda: lattice.hops((2, 10), (1, 11)), min_time))
+
+    board = opening_position().get_board()
+
+    def move_and_back() -> None:
+        board.move_piece((3, 9), (4, 8))
+        board.move_piece((4, 8), (3, 9))
+
+    results.append(measure("move_piece x2", move_and_back, min_time))
+
+    def apply_and_undo() -> None:
+        board.apply_move((3, 9), (4, 8))
+        board.undo_move((3, 9), (4, 8))
+
+    results.append(measure("apply_move+undo_move", apply_and_undo, min_time))
+    state = played_position(2, 40)
+    players = list(state.get_players().values())
+    # A new SearchAI on every run, so no run starts from the transposition table of the runs before it
+    results.append(measure("SearchAI depth 2 midgame",
+                           lambda: SearchAI(time_budget=60, max_depth=2).choose_move(state.get_board(), players, 0),
+                           min_time))
+    for batch in (False, True):
+        name = "batch" if batch else "one by one"
+        results.append(measure(f"SearchAI depth 3 midgame {name}",
+                               lambda batch=batch: SearchAI(time_budget=60, max_depth=3, batch=batch).choose_move(
+                                   state.get_board(), players, 0), min_time))
+    return results
@@ -0,0 +1,54 @@
+import os
+import tempfile
+from typing import List
+from chinese_checkers.game_state import GameState, GameConfig
+from chinese_checkers.batch_eval import HAS_NUMPY
+from _benchmarks_chinese_checkers._harness import measure, Result
+from _benchmarks_chinese_checkers._bench_board import played_position
+
+
+def full_game(num_of_players: int) -> None:
+    """
+    This function plays a headless game between shallow computer players.
+    :param num_of_players: The number of players.
+    """
+    GameState(GameConfig(num_of_players, time_budget=60, max_depth=1, max_plies=2000, seed=0)).run()
+
+
+def replay_log(file_name: str) -> int:
+    """
+    This function loads a logged game the way a reloaded Game does, without drawing it.
+    :param file_name: The name of the log file.
+    :return: The number of replayed turns.
+    """
+    state = GameState(log_file=file_name)
+    state.load_settings()
+    state.place_pieces_on_board()
+    state.add_targets_to_players()
+    state.change_turn()
+    return state.load_game()
+
+
+def benchmarks(min_time: float) -> List[Result]:
+    """
+    This function runs the game benchmarks.
+    :param min_time: About how many seconds every benchmark runs for.
+    :return: The results.
+    """
+    results = []
+    state = played_position(2, 40)
+    results.append(measure("is_end_game midgame", state.is_end_game, min_time))
+    for num_of_players in (2, 6):
+        results.append(measure(f"full headless game {num_of_players} players",
+                               lambda: full_game(num_of_players), min_time * 4, rounds=3))
+    if HAS_NUMPY:
+        from chinese_checkers.simulation import BatchSimulation
+        results.append(measure("100 greedy games 2 players in lockstep",
+                               lambda: BatchSimulation(100, 2, "greedy", seed=0).run(), min_time * 4, rounds=3))
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "game.txt")
+        logged = GameState(GameConfig(6, time_budget=60, max_depth=1, max_plies=2000, log_file=file_name, seed=0))
+        logged.run()
+        logged.close_log()
+        results.append(measure(f"replay {logged.ply} turn log", lambda: replay_log(file_name), min_time))
+    return results
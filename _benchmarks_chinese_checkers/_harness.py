@@ -0,0 +1,40 @@
+import time
+import tracemalloc
+from typing import Callable, Dict, Union
+
+Result = Dict[str, Union[str, float, int]]
+
+
+def measure(name: str, func: Callable[[], object], min_time: float = 0.5, rounds: int = 5) -> Result:
+    """
+    This function times a benchmark and measures the memory it allocates.
+    :param name: The name of the benchmark.
+    :param func: The code to measure, called with no arguments.
+    :param min_time: About how many seconds all the timed rounds take together.
+    :param rounds: The number of timed rounds, the fastest one is reported.
+    :return: A dictionary with the name, ops/sec, seconds per op and peak allocated bytes of a single call.
+    """
+    func()  # warm up caches
+    round_time = min_time / rounds
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= round_time / 4:
+            break
+        number *= 2
+    number = max(1, round(number * round_time / elapsed))
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"name": name, "ops_per_sec": 1 / best, "seconds_per_op": best, "calls_per_round": number,
+            "peak_alloc_bytes": peak}
@@ -0,0 +1,73 @@
+import threading
+import time
+from chinese_checkers.ai import SearchAI
+from chinese_checkers.board import Board
+from chinese_checkers.piece import Piece
+from chinese_checkers.player import Player
+from chinese_checkers.constants import RED, GREEN
+from chinese_checkers.game_state import GameState, GameConfig
+
+
+def make_position(red_locs, green_locs, red_targets, green_targets):
+    board = Board()
+    players = [Player("Player1", RED, True), Player("Player2", GREEN, True)]
+    for player, locs, targets in zip(players, [red_locs, green_locs], [red_targets, green_targets]):
+        for i, loc in enumerate(locs):
+            piece = Piece(player.get_color(), f"{player.get_color()}{i}", loc)
+            board.add_piece(piece)
+            player.add_piece(piece)
+        for loc in targets:
+            player.add_target_loc(loc)
+    return board, players
+
+
+def test_choose_move_takes_the_win():
+    board, players = make_position([(15, 11)], [(0, 12)], [(16, 12)], [(2, 12)])
+    ai = SearchAI(time_budget=5, max_depth=3)
+    assert ai.choose_move(board, players, 0) == ((15, 11), (16, 12))
+
+
+def test_choose_move_restores_position():
+    board, players = make_position([(3, 9), (3, 11), (4, 10)], [(13, 9), (12, 10)],
+                                   [(16, 12)], [(0, 12)])
+    before = dict(board.pieces)
+    move = SearchAI(time_budget=5, max_depth=3).choose_move(board, players, 0)
+    assert move in board.legal_moves(players[0])
+    assert board.pieces == before
+    assert set(players[0].get_pieces()) == {(3, 9), (3, 11), (4, 10)}
+
+
+def test_choose_move_without_moves():
+    board, players = make_position([], [(0, 12)], [], [])
+    assert SearchAI().choose_move(board, players, 0) is None
+
+
+def test_choose_move_stops_when_asked():
+    state = GameState(GameConfig(2, time_budget=60, max_depth=1, max_plies=20, seed=0))
+    state.run()
+    players = list(state.get_players().values())
+    stop = threading.Event()
+    stop.set()
+    start = time.perf_counter()
+    move = SearchAI(time_budget=60, max_depth=30).choose_move(state.board, players, 0, stop)
+    assert time.perf_counter() - start < 5
+    assert move in state.board.legal_moves(players[0])
+
+
+def test_ponder_fills_the_table():
+    state = GameState(GameConfig(2, time_budget=60, max_depth=1, max_plies=20, seed=0))
+    state.run()
+    players = list(state.get_players().values())
+    key = state.board.hash_key
+    ai = SearchAI(time_budget=60, max_depth=3)
+    ai.ponder(state.board, players, 0, threading.Event())
+    assert len(ai.table) > 0
+    assert state.board.hash_key == key
+    # The search after the reply that was pondered the most reuses the table
+    reply = ai.ordered_moves(0)[0]
+    state.board.apply_move(*reply)
+    players[0].move_piece(*reply)
+    ai.choose_move(state.board, players, 1)
+    fresh = SearchAI(time_budget=60, max_depth=3)
+    fresh.choose_move(state.board, players, 1)
+    assert ai.nodes < fresh.nodes
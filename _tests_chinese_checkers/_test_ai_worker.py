@@ -0,0 +1,75 @@
+import time
+import pygame
+from chinese_checkers.ai import SearchAI
+from chinese_checkers.ai_worker import AIWorker, AI_MOVE_EVENT, copy_position
+from chinese_checkers.game_state import GameState, GameConfig
+
+pygame.display.init()
+
+
+def played_state(plies):
+    state = GameState(GameConfig(2, time_budget=60, max_depth=1, max_plies=plies, seed=0))
+    state.run()
+    return state, list(state.get_players().values())
+
+
+def wait_for_move():
+    event = pygame.event.wait(30000)
+    while event.type != AI_MOVE_EVENT:
+        event = pygame.event.wait(30000)
+    return event
+
+
+def test_copy_position():
+    state, players = played_state(10)
+    board, copies = copy_position(state.board, players)
+    assert board.hash_key == state.board.hash_key
+    for player, copy in zip(players, copies):
+        assert set(copy.get_pieces()) == set(player.get_pieces())
+        assert copy.get_target_locs() == player.get_target_locs()
+    move = board.legal_moves(copies[0])[0]
+    board.apply_move(*move)
+    copies[0].move_piece(*move)
+    assert move[0] in players[0].get_pieces()
+    assert state.board.get_piece(move[0]) in players[0].get_pieces().values()
+
+
+def test_request_move():
+    state, players = played_state(10)
+    worker = AIWorker(SearchAI(time_budget=60, max_depth=2))
+    pygame.event.clear()
+    worker.request_move(state.board, players, 0, state.ply)
+    event = wait_for_move()
+    board, copies = copy_position(state.board, players)
+    assert event.ply == state.ply
+    assert event.move == SearchAI(time_budget=60, max_depth=2).choose_move(board, copies, 0)
+    assert not worker.is_searching_move(state.ply)
+    assert event.move in state.board.legal_moves(players[0])
+    assert not pygame.event.peek(AI_MOVE_EVENT)  # Every move is posted once, and kept nowhere else
+
+
+def test_cancel():
+    state, players = played_state(10)
+    worker = AIWorker(SearchAI(time_budget=60, max_depth=30))
+    pygame.event.clear()
+    worker.request_move(state.board, players, 0, state.ply)
+    assert worker.is_searching_move(state.ply)
+    start = time.perf_counter()
+    worker.cancel()
+    assert time.perf_counter() - start < 5
+    assert not worker.is_searching_move(state.ply)
+    assert not pygame.event.peek(AI_MOVE_EVENT)
+
+
+def test_ponder():
+    state, players = played_state(10)
+    ai = SearchAI(time_budget=60, max_depth=30)
+    worker = AIWorker(ai)
+    worker.ponder(state.board, players, 0, state.ply)
+    assert worker.is_pondering(state.ply)
+    time.sleep(0.2)
+    worker.request_move(state.board, players, 1, state.ply)
+    assert not worker.is_pondering(state.ply)
+    worker.cancel()
+    assert len(ai.table) > 0
+    assert not pygame.event.peek(AI_MOVE_EVENT)
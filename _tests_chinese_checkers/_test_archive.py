@@ -0,0 +1,80 @@
+import pytest
+from chinese_checkers.archive import ArchiveWriter, Archive, archive_logs
+from chinese_checkers.game_record import RecordedGame
+from chinese_checkers.game_state import GameState, GameConfig
+from chinese_checkers.constants import RED, GREEN
+
+PLAYERS = [("Alice", RED, False), ("Computer 1", GREEN, True)]
+
+
+def test_write_and_read(tmp_path):
+    file_name = str(tmp_path / "games.cca")
+    writer = ArchiveWriter(file_name)
+    for k in range(100):
+        assert writer.add_game(RecordedGame(PLAYERS, [(k, k + 1)] * k, [(k, "Game Over")], 1700000000 + k)) == k
+    writer.close()
+    with Archive(file_name) as archive:
+        assert len(archive) == 100
+        game = archive.get_game(42)
+        assert game.moves == [(42, 43)] * 42
+        assert game.messages == [(42, "Game Over")]
+        assert game.players == PLAYERS
+        assert game.start_time == 1700000042
+        assert archive.get_moves(0) == []
+        assert [(game_id, len(moves)) for game_id, moves in archive.iter_games(97)] == [(97, 97), (98, 98), (99, 99)]
+        with pytest.raises(IndexError):
+            archive.get_record(100)
+
+
+def test_empty_and_invalid(tmp_path):
+    file_name = str(tmp_path / "games.cca")
+    ArchiveWriter(file_name).close()
+    with Archive(file_name) as archive:
+        assert len(archive) == 0
+        assert list(archive.iter_games()) == []
+    with open(file_name, "wb") as file:
+        file.write(b"not an archive at all, but long enough")
+    with pytest.raises(ValueError):
+        Archive(file_name)
+
+
+def test_archive_logs(tmp_path):
+    log_files = []
+    for seed in range(2):
+        log_file = str(tmp_path / f"game{seed}.txt")
+        state = GameState(GameConfig(2, time_budget=0.05, max_depth=1, max_plies=20 + seed, log_file=log_file,
+                                     seed=seed))
+        state.run()
+        state.close_log()
+        log_files.append(log_file)
+    archive_file = str(tmp_path / "games.cca")
+    assert archive_logs(log_files, archive_file) == 2
+    with Archive(archive_file) as archive:
+        assert [len(moves) for _, moves in archive.iter_games()] == [20, 21]
+
+
+def test_record_outlives_the_archive(tmp_path):
+    file_name = str(tmp_path / "games.cca")
+    writer = ArchiveWriter(file_name)
+    writer.add_game(RecordedGame(PLAYERS, [(0, 1)], [], 1700000000))
+    writer.close()
+    archive = Archive(file_name)
+    record = archive.get_record(0)
+    archive.close()
+    assert isinstance(record, bytes)
+    assert record == open(file_name, "rb").read()[5:5 + len(record)]
+
+
+def test_truncated(tmp_path):
+    file_name = str(tmp_path / "games.cca")
+    writer = ArchiveWriter(file_name)
+    for k in range(3):
+        writer.add_game(RecordedGame(PLAYERS, [(k, k + 1)], [], 1700000000))
+    writer.close()
+    data = open(file_name, "rb").read()
+    truncated = str(tmp_path / "truncated.cca")
+    for size in range(len(data)):
+        with open(truncated, "wb") as file:
+            file.write(data[:size])
+        with pytest.raises(ValueError):
+            Archive(truncated)
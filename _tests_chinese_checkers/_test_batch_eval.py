@@ -0,0 +1,63 @@
+import pytest
+from chinese_checkers.ai import SearchAI, WIN_SCORE
+from chinese_checkers.board import Board, CELL_INDEX
+from chinese_checkers.distances import distance_tables
+from chinese_checkers.game_state import GameState, GameConfig
+
+np = pytest.importorskip("numpy")
+from chinese_checkers.batch_eval import BatchEvaluator  # noqa: E402
+
+
+def played_state(num_of_players, plies):
+    state = GameState(GameConfig(num_of_players, time_budget=60, max_depth=1, max_plies=plies, seed=0))
+    state.run()
+    return state, list(state.get_players().values())
+
+
+def score_after(board, players, player_index, root_index, move):
+    player = players[player_index]
+    board.apply_move(*move)
+    player.move_piece(*move)
+    try:
+        if player.check_if_winner():
+            return WIN_SCORE if player_index == root_index else -WIN_SCORE
+        progress = [-sum(distance_tables(p.get_target_locs()).to_apex[CELL_INDEX[loc]] for loc in p.get_pieces())
+                    for p in players]
+        own = progress.pop(root_index)
+        return own - max(progress)
+    finally:
+        player.move_piece(move[1], move[0])
+        board.undo_move(*move)
+
+
+@pytest.mark.parametrize("num_of_players", [2, 3, 6])
+def test_scores_match_one_by_one(num_of_players):
+    state, players = played_state(num_of_players, 30)
+    evaluator = BatchEvaluator(players)
+    for player_index in range(num_of_players):
+        moves = state.board.legal_moves(players[player_index])
+        for root_index in range(num_of_players):
+            scores = evaluator.scores(players, player_index, root_index, moves, WIN_SCORE).tolist()
+            assert scores == [score_after(state.board, players, player_index, root_index, move) for move in moves]
+
+
+def test_winning_move():
+    state, players = played_state(2, 0)
+    player = players[0]
+    targets = sorted(player.get_target_locs())
+    state.restore_snapshot(0, player.get_name(), [targets[1:] + [(12, 10)], [(4, col) for col in range(0, 20, 2)]])
+    moves = state.board.legal_moves(player)
+    scores = BatchEvaluator(players).scores(players, 0, 0, moves, WIN_SCORE).tolist()
+    assert [move for move, score in zip(moves, scores) if score == WIN_SCORE] == [((12, 10), targets[0])]
+    assert scores == [score_after(state.board, players, 0, 0, move) for move in moves]
+
+
+def test_search_is_unchanged(monkeypatch):
+    # Moves with equal scores are searched in the order of legal_moves, which depends on its cache
+    legal_moves = Board.legal_moves
+    monkeypatch.setattr(Board, "legal_moves", lambda board, player: sorted(legal_moves(board, player)))
+    for num_of_players in (2, 3):
+        state, players = played_state(num_of_players, 20)
+        for depth in (2, 3):
+            assert SearchAI(60, depth, batch=True).choose_move(state.board, players, 0) == \
+                   SearchAI(60, depth, batch=False).choose_move(state.board, players, 0)
@@ -0,0 +1,57 @@
+import random
+from chinese_checkers.board import Board
+from chinese_checkers.piece import Piece
+from chinese_checkers.player import Player
+from chinese_checkers.bitboard import BitBoard, CELL_INDEX, mask_of, cells_of
+from chinese_checkers.constants import RED, GREEN
+
+
+def random_position(seed):
+    rng = random.Random(seed)
+    board = Board()
+    players = [Player("Player1", RED), Player("Player2", GREEN)]
+    locations = rng.sample(board.cell_list(), rng.randint(2, 60))
+    for i, loc in enumerate(locations):
+        player = players[i % 2]
+        piece = Piece(player.get_color(), f"{player.get_color()}{i}", loc)
+        board.add_piece(piece)
+        player.add_piece(piece)
+    return board, players
+
+
+def test_mask_round_trip():
+    cells = [(0, 12), (4, 0), (16, 12), (8, 12)]
+    assert sorted(cells_of(mask_of(cells))) == sorted(cells)
+    assert mask_of([]) == 0
+
+
+def test_moves_match_board():
+    for seed in range(30):
+        board, players = random_position(seed)
+        state = BitBoard.from_board(board, players)
+        for index, player in enumerate(players):
+            expected = {(CELL_INDEX[loc], CELL_INDEX[dst]) for loc, piece in player.get_pieces().items()
+                        for dst in board.optional_moves(piece)}
+            assert set(state.legal_moves(index)) == expected
+
+
+def test_play_and_convert():
+    board, players = random_position(7)
+    for loc in board.cell_list()[:10]:
+        players[0].add_target_loc(loc)
+    state = BitBoard.from_board(board, players)
+    src, dst = state.legal_moves(0)[0]
+    after = state.play(0, src, dst)
+    assert after.occupied == state.occupied ^ (1 << src) ^ (1 << dst)
+    assert state.play(0, src, dst) == after
+    new_board, new_players = after.to_board(players)
+    assert BitBoard.from_board(new_board, new_players) == after
+    assert new_players[0].get_target_locs().keys() == players[0].get_target_locs().keys()
+    assert [p.get_name() for p in new_players] == ["Player1", "Player2"]
+
+
+def test_is_winner():
+    targets = mask_of([(0, 12), (1, 11), (1, 13)])
+    state = BitBoard([targets, 0])
+    assert state.is_winner(0, targets)
+    assert not state.is_winner(1, targets)
@@ -1,7 +1,11 @@
 import pytest
-from chinese_checkers.board import Board
+import random
+import pygame
+from pygame import Surface
+from chinese_checkers.board import Board, CELLS, NEIGHBORS, JUMPS, zobrist_key
 from chinese_checkers.piece import Piece
-from chinese_checkers.constants import RED
+from chinese_checkers.player import Player
+from chinese_checkers.constants import RED, GREEN, WIDTH, HEIGHT
 
 
 def test_get_piece(board, location, expected):
@@ -144,6 +148,79 @@ def test_board():
     test_get_piece_by_coordinates(board2, (1, 11), piece2)
     test_get_piece_by_coordinates(board2, (2, 14), piece3)
 
+def test_static_tables():
+    assert len(CELLS) == 121
+    assert CELLS == tuple(Board().cell_list())
+    assert set(NEIGHBORS[(0, 12)]) == {(1, 11), (1, 13)}
+    assert set(JUMPS[(0, 12)]) == {((1, 11), (2, 10)), ((1, 13), (2, 14))}
+    assert len(NEIGHBORS[(8, 12)]) == 6
+    assert len(JUMPS[(8, 12)]) == 6
+    board = Board()
+    assert board.get_piece((1, 4)) is None
+    assert board.get_piece((-1, 12)) is None
+    assert board.cell_content((17, 12)) is None
+
+def test_apply_and_undo_move():
+    board = Board()
+    piece = Piece(RED, str(RED) + "1", (0, 12))
+    board.add_piece(piece)
+    assert board.apply_move((0, 12), (1, 11)) is piece
+    assert piece.get_location() == (1, 11)
+    assert board.get_piece((1, 11)) is piece
+    assert board.get_piece((0, 12)) == 0
+    assert list(board.pieces) == [(1, 11)]
+    assert board.undo_move((0, 12), (1, 11)) is piece
+    assert piece.get_location() == (0, 12)
+    assert board.get_piece((1, 11)) == 0
+    assert board.get_piece_by_coordinates((0, 12)) is piece
+
+def test_legal_moves_stay_up_to_date():
+    rng = random.Random(3)
+    board = Board()
+    players = [Player("Player1", RED), Player("Player2", GREEN)]
+    for i, loc in enumerate(rng.sample(board.cell_list(), 40)):
+        player = players[i % 2]
+        piece = Piece(player.get_color(), f"{player.get_color()}{i}", loc)
+        board.add_piece(piece)
+        player.add_piece(piece)
+    for turn in range(200):
+        player = players[turn % 2]
+        moves = board.legal_moves(player)
+        fresh = Board()
+        for loc, piece in board.pieces.items():
+            fresh.add_piece(Piece(piece.get_color(), piece.get_id(), loc))
+        expected = {(loc, dst) for loc in player.get_pieces() for dst in fresh.optional_moves(fresh.get_piece(loc))}
+        assert set(moves) == expected
+        piece_loc, destination = rng.choice(moves)
+        board.apply_move(piece_loc, destination)
+        player.move_piece(piece_loc, destination)
+
+def test_hash_key():
+    board = Board()
+    assert board.hash_key == 0
+    piece = Piece(RED, str(RED) + "1", (0, 12))
+    board.add_piece(piece)
+    assert board.hash_key == zobrist_key((0, 12), RED)
+    assert zobrist_key((0, 12), RED) != zobrist_key((0, 12), GREEN)
+    board.move_piece((0, 12), (1, 11))
+    assert board.hash_key == zobrist_key((1, 11), RED)
+    board.undo_move((0, 12), (1, 11))
+    assert board.hash_key == zobrist_key((0, 12), RED)
+
+def test_draw_changes():
+    board = Board()
+    for i, loc in enumerate([(0, 12), (1, 11), (1, 13)]):
+        board.add_piece(Piece(RED, str(RED) + str(i), loc))
+    win = Surface((WIDTH, HEIGHT))
+    assert board.draw_changes(win) is None
+    assert board.draw_changes(win) == []
+    board.move_piece((1, 11), (2, 10))
+    board.mark_dirty([(8, 12)])
+    assert set(board.draw_changes(win)) == {(1, 11), (2, 10), (8, 12)}
+    expected = Surface((WIDTH, HEIGHT))
+    board.draw(expected)
+    assert pygame.image.tobytes(win, "RGB") == pygame.image.tobytes(expected, "RGB")
+
 if __name__ == '__main__':
     test_board()
 
@@ -0,0 +1,38 @@
+from chinese_checkers.distances import hex_distance, target_apex, distance_tables
+from chinese_checkers.board import CELLS, CELL_INDEX
+from chinese_checkers.game_state import GameState, GameConfig
+from chinese_checkers.player import Player
+from chinese_checkers.constants import RED
+
+
+def test_hex_distance():
+    assert hex_distance((0, 12), (0, 12)) == 0
+    assert hex_distance((0, 12), (1, 11)) == 1
+    assert hex_distance((4, 0), (4, 24)) == 12
+    assert hex_distance((0, 12), (16, 12)) == 16
+
+
+def test_target_apex():
+    player = Player("Player1", RED)
+    assert target_apex(player) is None
+    for loc in [(13, 9), (13, 11), (14, 10), (16, 12), (15, 11)]:
+        player.add_target_loc(loc)
+    assert target_apex(player) == (16, 12)
+
+
+def test_distance_tables():
+    state = GameState(GameConfig(6))
+    for player in state.get_players().values():
+        targets = player.get_target_locs()
+        tables = distance_tables(targets)
+        assert tables is distance_tables(list(targets))
+        assert tables.apex == target_apex(player)
+        for cell in CELLS:
+            index = CELL_INDEX[cell]
+            assert tables.to_apex[index] == hex_distance(cell, tables.apex)
+            assert tables.steps[index] == min(hex_distance(cell, target) for target in targets)
+            assert (tables.steps[index] + 1) // 2 <= tables.hops[index] <= tables.steps[index]
+            assert (tables.steps[index] == 0) == (cell in targets)
+    tables = distance_tables([(16, 12)])
+    assert tables.steps[CELL_INDEX[(0, 12)]] == 16
+    assert tables.hops[CELL_INDEX[(0, 12)]] == 8
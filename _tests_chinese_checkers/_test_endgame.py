@@ -0,0 +1,71 @@
+from chinese_checkers.endgame import EndgameTable, Tablebase
+from chinese_checkers.game_state import GameState, GameConfig
+from chinese_checkers.ai import SearchAI
+
+
+def endgame_state(stragglers):
+    """
+    A 2 player game where the first player has filled its target except for the number of stragglers,
+    and the pieces of the second player are out of the way.
+    """
+    state = GameState(GameConfig(2, time_budget=0.05, max_depth=1))
+    player, opponent = state.get_players().values()
+    targets = sorted(player.get_target_locs())
+    opponent_cells = [(4, col) for col in range(0, 20, 2)]
+    state.restore_snapshot(0, player.get_name(), [targets[len(stragglers):] + stragglers, opponent_cells])
+    return state, player
+
+
+def test_table():
+    state, player = endgame_state([])
+    table = EndgameTable(player.get_target_locs(), 1)
+    assert len(table) == 1 + 10 * 111
+    assert table.distances.count(255) == 0
+    targets = sorted(player.get_target_locs())
+    assert table.distance(targets) == 0
+    assert table.distance(targets[1:] + [(12, 10)]) == 1
+    assert table.distance(targets[1:] + [(8, 12)]) > 1
+    assert table.distance(targets[2:] + [(8, 12), (8, 10)]) is None
+    assert EndgameTable(player.get_target_locs(), 1, table.distances).distances == table.distances
+
+
+def test_tablebase_files(tmp_path):
+    state, player = endgame_state([(8, 12)])
+    assert Tablebase(str(tmp_path), 1, build=False).distance(player) is None
+    distance = Tablebase(str(tmp_path), 1).distance(player)
+    assert len(list(tmp_path.iterdir())) == 1
+    assert Tablebase(str(tmp_path), 1, build=False).distance(player) == distance
+
+
+def test_closes_out_the_game(tmp_path):
+    state, player = endgame_state([(8, 12)])
+    tablebase = Tablebase(str(tmp_path), 1)
+    distance = tablebase.distance(player)
+    ai = SearchAI(time_budget=0.05, max_depth=1, endgame=tablebase)
+    moves = 0
+    while not player.check_if_winner():
+        piece_loc, destination = ai.choose_move(state.board, list(state.get_players().values()), 0)
+        state.board.apply_move(piece_loc, destination)
+        player.move_piece(piece_loc, destination)
+        moves += 1
+        assert tablebase.distance(player) == distance - moves
+    assert moves == distance
+
+
+def test_no_move_outside_the_tables(tmp_path):
+    state, player = endgame_state([(8, 12), (8, 10)])
+    tablebase = Tablebase(str(tmp_path), 1)
+    assert tablebase.choose_move(state.board, player) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_tablebase_rebuilds_a_truncated_file(tmp_path):
+    state, player = endgame_state([(8, 12)])
+    distance = Tablebase(str(tmp_path), 1).distance(player)
+    file_name, = tmp_path.iterdir()
+    data = file_name.read_bytes()
+    file_name.write_bytes(data[:len(data) // 2])
+    assert Tablebase(str(tmp_path), 1, build=False).distance(player) is None
+    assert Tablebase(str(tmp_path), 1).distance(player) == distance
+    assert list(tmp_path.iterdir()) == [file_name]
+    assert file_name.read_bytes() == data
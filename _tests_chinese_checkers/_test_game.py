@@ -2,7 +2,9 @@ import pytest
 import unittest
 from unittest.mock import patch
 from chinese_checkers.game import Game
-from chinese_checkers.constants import WIDTH, HEIGHT, RED, GREEN
+from chinese_checkers.game_state import GameState
+from chinese_checkers.ai_worker import AI_MOVE_EVENT
+from chinese_checkers.constants import WIDTH, HEIGHT, RED, GREEN, SQUARE_SIZE
 import pygame
 
 mock_win = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -40,5 +42,80 @@ class TestGameInitialization(unittest.TestCase):
         assert computer1_pieces[(14, 10)].get_color() == GREEN
 
 
+class TestGameUpdate(unittest.TestCase):
+
+    @patch('builtins.input', side_effect=["no", "no", "2", "1", "Player1"])
+    def test_update_redraws_only_changes(self, mock_input):
+        pygame.font.init()
+        game = Game(mock_win)
+        with patch('pygame.display.update') as mock_update:
+            game.update()
+            mock_update.assert_called_once_with()
+            mock_update.reset_mock()
+            game.update()
+            mock_update.assert_not_called()
+            game.select((3, 11))
+            game.update()
+            rects = mock_update.call_args[0][0]
+            assert len(rects) == len(game.valid_moves)
+            mock_update.reset_mock()
+            game.select(next(iter(game.valid_moves)))
+            game.update()
+            # The cleared highlights, the cell the piece left and the name of the next player
+            assert len(mock_update.call_args[0][0]) == len(rects) + 2
+
+    @patch('builtins.input', side_effect=["no", "no", "2", "1", "Player1"])
+    def test_load_game_passes_the_index(self, mock_input):
+        game = Game(mock_win)
+        index = object()
+        with patch.object(GameState, 'load_game', return_value=5) as mock_load_game:
+            assert game.load_game(5, index=index) == 5
+        mock_load_game.assert_called_once_with(5, index)
+
+
+class TestGamePlay(unittest.TestCase):
+
+    @staticmethod
+    def click(loc):
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1,
+                                  pos=(loc[1] * SQUARE_SIZE + SQUARE_SIZE // 2, loc[0] * SQUARE_SIZE + SQUARE_SIZE // 2))
+
+    @patch('builtins.input', side_effect=["no", "no", "2", "1", "Player1"])
+    def test_play_one_event_at_a_time(self, mock_input):
+        game = Game(mock_win)
+        assert not game.is_computer_turn()
+        game.play(self.click((3, 11)))
+        assert game.get_selected_piece().get_location() == (3, 11)
+        destination = next(iter(game.valid_moves))
+        game.play(self.click(destination))
+        assert game.board.get_piece(destination).get_color() == RED
+        assert game.is_computer_turn()
+        game.play()
+        assert game.ply == 2
+        assert not game.is_computer_turn()
+
+    @patch('builtins.input', side_effect=["no", "no", "2", "1", "Player1"])
+    def test_play_move_of_the_worker(self, mock_input):
+        game = Game(mock_win)
+        game.play(self.click((3, 11)))
+        game.play(self.click(next(iter(game.valid_moves))))
+        pygame.event.clear()
+        game.think_in_background()
+        assert game.worker.is_searching_move(1)
+        event = pygame.event.wait(30000)
+        while event.type != AI_MOVE_EVENT:
+            event = pygame.event.wait(30000)
+        ply, move = event.ply, event.move
+        game.play(pygame.event.Event(AI_MOVE_EVENT, move=move, ply=0))
+        assert game.ply == 1  # A move found for an older position is ignored
+        game.play(pygame.event.Event(AI_MOVE_EVENT, move=move, ply=ply))
+        assert game.ply == 2
+        assert game.board.get_piece(move[1]).get_color() == GREEN
+        game.think_in_background()
+        assert game.worker.is_pondering(2)
+        game.stop_thinking()
+        assert not game.worker.is_pondering(2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,112 @@
+import pytest
+from chinese_checkers.game_log import GameLogWriter, LogIndex, find_last_snapshot, read_log_lines
+
+
+def test_batches_lines(tmp_path):
+    file_name = str(tmp_path / "log.txt")
+    log = GameLogWriter(file_name, "w", flush_every=3, flush_interval=60)
+    log.write("a\n")
+    log.write("b\n")
+    assert open(file_name).read() == ""
+    log.write("c\n")
+    assert open(file_name).read() == "a\nb\nc\n"
+    log.write("d\n")
+    log.close()
+    assert open(file_name).read() == "a\nb\nc\nd\n"
+    assert log.is_closed()
+    with pytest.raises(ValueError):
+        log.write("e\n")
+
+
+def test_flush_interval(tmp_path):
+    file_name = str(tmp_path / "log.txt")
+    log = GameLogWriter(file_name, "w", flush_every=100, flush_interval=0)
+    log.write("a\n")
+    assert open(file_name).read() == "a\n"
+    log.close()
+
+
+def test_flush_if_due(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("chinese_checkers.game_log.time.monotonic", lambda: now[0])
+    file_name = str(tmp_path / "log.txt")
+    log = GameLogWriter(file_name, "w", flush_every=100, flush_interval=1.0)
+    assert log.flush_if_due() is None
+    now[0] += 0.5
+    log.write("a\n")
+    assert log.flush_if_due() == pytest.approx(0.5)
+    assert open(file_name).read() == ""
+    now[0] += 0.5  # No line is written after the first one, the tick alone writes it
+    assert log.flush_if_due() is None
+    assert open(file_name).read() == "a\n"
+    log.close()
+
+
+@pytest.mark.parametrize("durability, expected", [("none", ""), ("flush", "a\n"), ("fsync", "a\n")])
+def test_durability_on_game_end(tmp_path, durability, expected):
+    file_name = str(tmp_path / "log.txt")
+    log = GameLogWriter(file_name, "w", flush_every=100, flush_interval=60, durability=durability)
+    log.write("a\n")
+    log.end_game()
+    assert open(file_name).read() == expected
+    log.close()
+    assert open(file_name).read() == "a\n"
+
+
+def test_append_and_invalid_durability(tmp_path):
+    file_name = str(tmp_path / "log.txt")
+    with open(file_name, "w") as file:
+        file.write("old\n")
+    log = GameLogWriter(file_name)
+    log.write("new\n")
+    log.close()
+    assert open(file_name).read() == "old\nnew\n"
+    with pytest.raises(ValueError):
+        GameLogWriter(file_name, durability="sometimes")
+
+
+def test_timestamp_format(tmp_path):
+    log = GameLogWriter(str(tmp_path / "log.txt"), "w")
+    assert len(log.timestamp()) == len("2024-01-01 00:00:00")
+    log.close()
+
+
+def write_lines(tmp_path, lines):
+    file_name = str(tmp_path / "game.txt")
+    with open(file_name, "w") as file:
+        file.writelines(lines)
+    return file_name
+
+
+def test_find_last_snapshot(tmp_path):
+    lines = ["2024-01-01 00:00:00+Snapshot+0+A+0/1+Snapshot\n"] + ["2024-01-01 00:00:00+A+id+(0, 12)+(1, 11)+Turn\n"] * 20
+    lines += ["2024-01-01 00:00:00+Snapshot+20+A+2/3+Snapshot\n", "2024-01-01 00:00:00+A+id+(1, 11)+(2, 10)+Turn\n"]
+    file_name = write_lines(tmp_path, lines)
+    offset = sum(len(line) for line in lines[:21])
+    for block_size in list(range(1, 120)) + [1 << 16]:
+        assert find_last_snapshot(file_name, block_size) == offset
+    assert find_last_snapshot(write_lines(tmp_path, lines[1:21]), 7) is None
+    assert find_last_snapshot(write_lines(tmp_path, lines[:1]), 7) == 0
+
+
+def test_find_last_snapshot_reads_every_byte_once(tmp_path):
+    lines = ["2024-01-01 00:00:00+Snapshot+0+A+0/1+Snapshot\n"]
+    lines += ["2024-01-01 00:00:00+A+id+(0, 12)+(1, 11)+Turn\n"] * 20000
+    file_name = write_lines(tmp_path, lines)
+    # Searching again all the bytes read before would take minutes with small blocks
+    assert find_last_snapshot(file_name, 16) == 0
+    assert find_last_snapshot(write_lines(tmp_path, lines[1:]), 16) is None
+
+
+def test_log_index(tmp_path):
+    turn = "2024-01-01 00:00:00+A+id+(0, 12)+({}, 11)+Turn\n"
+    lines = [turn.format(i) for i in range(3)] + ["2024-01-01 00:00:00+Snapshot+3+A+0/1+Snapshot\n"]
+    lines += [turn.format(i) for i in range(3, 5)]
+    index = LogIndex(write_lines(tmp_path, lines))
+    assert len(index) == 5
+    assert index.read_turn(4) == turn.format(4)
+    snapshot_offset = sum(len(line) for line in lines[:3])
+    assert index.snapshot_before(2) == 0
+    assert index.snapshot_before(3) == snapshot_offset
+    assert index.snapshot_before(5) == snapshot_offset
+    assert [line for _, line in read_log_lines(index.file_name, snapshot_offset)] == lines[3:]
@@ -0,0 +1,82 @@
+import os
+import pytest
+from chinese_checkers.game_state import GameState, GameConfig
+from chinese_checkers.game_record import (RecordedGame, GameRecordWriter, encode_game, decode_game,
+                                          read_game_record, text_log_to_record, record_to_text_log,
+                                          text_log_to_game, game_to_text_log)
+from chinese_checkers.constants import RED, GREEN
+
+PLAYERS = [("Alice", RED, False), ("Computer 1", GREEN, True)]
+
+
+def test_encode_decode():
+    game = RecordedGame(PLAYERS, [(0, 1), (120, 119)], [(2, "Quit Game")], 1700000000)
+    data = encode_game(game)
+    assert len(data) == 11 + (1 + 5 + 4) + (1 + 10 + 4) + 2 * 2 + 2
+    decoded = decode_game(data)
+    assert decoded.players == PLAYERS
+    assert decoded.moves == [(0, 1), (120, 119)]
+    assert decoded.messages == [(2, "Quit Game")]
+    assert decoded.start_time == 1700000000
+    assert decoded.get_cell_moves() == [((0, 12), (1, 11)), ((16, 12), (15, 13))]
+
+
+def test_long_name():
+    assert decode_game(encode_game(RecordedGame([("é" * 127, RED, False)]))).players == [("é" * 127, RED, False)]
+    with pytest.raises(ValueError):
+        encode_game(RecordedGame([("é" * 128, RED, False)]))
+
+
+def test_empty_text_log(tmp_path):
+    log_file = tmp_path / "empty.txt"
+    log_file.write_text("")
+    with pytest.raises(ValueError):
+        text_log_to_game(str(log_file))
+
+
+def test_writer(tmp_path):
+    file_name = str(tmp_path / "game.ccr")
+    writer = GameRecordWriter(file_name, PLAYERS, 1700000000)
+    writer.write_move((3, 9), (4, 8))
+    writer.write_end("Game Over")
+    writer.close()
+    game = read_game_record(file_name)
+    assert game.get_cell_moves() == [((3, 9), (4, 8))]
+    assert game.messages == [(1, "Game Over")]
+
+
+def test_text_log_round_trip(tmp_path):
+    log_file = str(tmp_path / "game.txt")
+    state = GameState(GameConfig(2, time_budget=0.05, max_depth=1, max_plies=1000, log_file=log_file))
+    state.run()
+    state.close_log()
+    record_file = str(tmp_path / "game.ccr")
+    game = text_log_to_record(log_file, record_file)
+    assert len(game.moves) == state.ply
+    assert os.path.getsize(record_file) < os.path.getsize(log_file) / 20
+    converted_file = str(tmp_path / "converted.txt")
+    record_to_text_log(record_file, converted_file)
+    original = [line[19:] for line in open(log_file) if not line.endswith("Snapshot\n")]
+    converted = [line[19:] for line in open(converted_file)]
+    assert converted == original
+
+
+def test_text_log_keeps_the_passes(tmp_path):
+    log_file = str(tmp_path / "game.txt")
+    state = GameState(GameConfig(3, time_budget=0.05, max_depth=1, max_plies=4, log_file=log_file))
+    state.run()
+    state.pass_turn()
+    state.max_plies = 6
+    state.run()
+    state.close_log()
+    copy_file = str(tmp_path / "copy.txt")
+    game_to_text_log(text_log_to_game(log_file), copy_file)
+    assert sum(line.endswith("+Pass\n") for line in open(copy_file)) == 1
+    reloaded = GameState(log_file=copy_file)
+    reloaded.load_settings()
+    reloaded.place_pieces_on_board()
+    reloaded.add_targets_to_players()
+    reloaded.change_turn()
+    assert reloaded.load_game() == 6
+    assert reloaded.board.hash_key == state.board.hash_key
+    assert reloaded.get_current_player().get_name() == state.get_current_player().get_name()
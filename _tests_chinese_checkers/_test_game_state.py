@@ -0,0 +1,155 @@
+import pytest
+from chinese_checkers.game_state import GameState, GameConfig
+from chinese_checkers.game_log import LogIndex
+from chinese_checkers.constants import RED, GREEN
+
+
+def test_setup_from_config():
+    state = GameState(GameConfig(2, 1, ["Alice"]))
+    assert list(state.get_players()) == ["Alice", "Computer 1"]
+    assert state.get_current_player().get_name() == "Alice"
+    assert state.get_player_by_name("Alice").get_color() == RED
+    assert state.get_player_by_name("Computer 1").get_color() == GREEN
+    assert state.board.get_piece((0, 12)).get_color() == RED
+    assert len(state.board.pieces) == 20
+    assert len(state.get_player_by_name("Alice").get_target_locs()) == 10
+
+
+def test_invalid_config():
+    with pytest.raises(ValueError):
+        GameState(GameConfig(5))
+    with pytest.raises(ValueError):
+        GameState(GameConfig(2, 3))
+
+
+def test_run_stops_for_human_player():
+    state = GameState(GameConfig(2, 1))
+    assert state.run() is None
+    assert state.ply == 0
+    assert state.select((3, 9))
+    assert state.select((4, 8))
+    assert state.ply == 1
+    assert state.get_current_player().get_name() == "Computer 1"
+
+
+def test_run_max_plies():
+    state = GameState(GameConfig(3, time_budget=0.01, max_depth=1, max_plies=5))
+    assert state.run() is None
+    assert state.ply == 5
+
+
+def test_run_full_game():
+    state = GameState(GameConfig(2, time_budget=0.05, max_depth=1, max_plies=1000))
+    winner = state.run()
+    assert winner is not None
+    assert winner.check_if_winner()
+    assert state.get_scores()[winner.get_name()] == {"wins": 1, "losses": 0}
+
+
+def test_logged_game(tmp_path):
+    file_name = str(tmp_path / "game.txt")
+    state = GameState(GameConfig(2, time_budget=0.05, max_depth=1, max_plies=1000, log_file=file_name))
+    state.run()
+    state.is_end_game()
+    state.close_log()
+    lines = open(file_name).read().splitlines()
+    assert lines[0].endswith("+2+2+Game Settings")
+    assert lines[1].endswith("+Computer 1+(255, 0, 0)+True+Players Info")
+    assert sum(line.endswith("+Turn") for line in lines) == state.ply
+    assert lines[-1].endswith("+Game Over")
+    assert sum(line.endswith("Game Over") for line in lines) == 1
+
+
+def reloaded_state(file_name):
+    state = GameState(log_file=file_name)
+    state.load_settings()
+    state.place_pieces_on_board()
+    state.add_targets_to_players()
+    state.change_turn()
+    return state
+
+
+def test_load_game(tmp_path):
+    file_name = str(tmp_path / "game.txt")
+    state = GameState(GameConfig(3, time_budget=0.05, max_depth=1, max_plies=31, log_file=file_name))
+    state.run()
+    state.close_log()
+    reloaded = reloaded_state(file_name)
+    assert reloaded.load_game() == 31
+    assert reloaded.ply == 31
+    assert reloaded.board.hash_key == state.board.hash_key
+    assert reloaded.get_current_player().get_name() == state.get_current_player().get_name()
+    for name, player in state.get_players().items():
+        assert set(reloaded.get_player_by_name(name).get_pieces()) == set(player.get_pieces())
+
+
+def test_load_game_after_a_pass(tmp_path):
+    file_name = str(tmp_path / "game.txt")
+    state = GameState(GameConfig(3, time_budget=0.05, max_depth=1, max_plies=5, log_file=file_name))
+    state.run()
+    passed = state.get_current_player().get_name()
+    state.pass_turn()
+    state.close_log()
+    assert open(file_name).readlines()[-1].endswith(f"+{passed}+Pass\n")
+    for stop_at in (None, 5):
+        reloaded = reloaded_state(file_name)
+        assert reloaded.load_game(stop_at=stop_at) == 5
+        assert reloaded.get_current_player().get_name() == state.get_current_player().get_name() != passed
+
+
+def test_load_game_stop_at(tmp_path):
+    file_name = str(tmp_path / "game.txt")
+    state = GameState(GameConfig(2, time_budget=0.05, max_depth=1, max_plies=10, log_file=file_name))
+    state.run()
+    state.close_log()
+    reloaded = reloaded_state(file_name)
+    assert reloaded.load_game(stop_at=5) == 5
+    assert reloaded.get_current_player().get_name() == "Computer 2"
+
+
+def test_load_game_from_snapshots(tmp_path):
+    file_name = str(tmp_path / "game.txt")
+    state = GameState(GameConfig(3, time_budget=0.05, max_depth=1, max_plies=47, log_file=file_name,
+                                 snapshot_interval=10))
+    state.run()
+    state.close_log()
+    assert sum(line.endswith("Snapshot\n") for line in open(file_name)) == 4
+    reloaded = reloaded_state(file_name)
+    assert reloaded.load_game() == 47
+    assert reloaded.board.hash_key == state.board.hash_key
+    assert reloaded.get_current_player().get_name() == state.get_current_player().get_name()
+    for name, player in state.get_players().items():
+        reloaded_player = reloaded.get_player_by_name(name)
+        assert {loc: piece.get_id() for loc, piece in reloaded_player.get_pieces().items()} == \
+               {loc: piece.get_id() for loc, piece in player.get_pieces().items()}
+        assert reloaded_player.get_target_locs().keys() == player.get_target_locs().keys()
+
+
+def test_seek_with_index(tmp_path):
+    file_name = str(tmp_path / "game.txt")
+    state = GameState(GameConfig(2, time_budget=0.05, max_depth=1, max_plies=25, log_file=file_name,
+                                 snapshot_interval=10))
+    state.run()
+    state.close_log()
+    index = LogIndex(file_name)
+    assert len(index) == 25
+    replayed = reloaded_state(file_name)
+    for ply in range(26):
+        seeked = reloaded_state(file_name)
+        assert seeked.load_game(stop_at=ply, index=index) == ply
+        assert seeked.board.hash_key == replayed.board.hash_key
+        assert seeked.get_current_player().get_name() == replayed.get_current_player().get_name()
+        if ply < 25:
+            player_name, _, piece_loc, destination = replayed.parse_log_line(index.read_turn(ply))
+            replayed.update_game_state(player_name, piece_loc, destination)
+            replayed.change_turn()
+
+
+def test_play_move():
+    state = GameState(GameConfig(2, num_of_computers=0))
+    assert not state.play_move((13, 9), (12, 8))  # Not the current player's piece
+    assert not state.play_move((3, 11), (6, 12))
+    assert state.ply == 0
+    assert state.play_move((3, 11), (4, 10))
+    assert state.history == [((3, 11), (4, 10))]
+    assert state.get_current_player().get_name() == "Player 2"
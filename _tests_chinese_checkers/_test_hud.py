@@ -0,0 +1,31 @@
+from pygame import Surface
+from chinese_checkers.hud import TextRenderer
+from chinese_checkers.constants import RED, GREEN
+
+
+def test_render_is_cached():
+    text = TextRenderer()
+    surface = text.render("Current Player: Alice", RED, 36)
+    assert text.render("Current Player: Alice", RED, 36) is surface
+    assert text.render("Current Player: Alice", GREEN, 36) is not surface
+    assert text.render("Current Player: Alice", RED, 20).get_height() < surface.get_height()
+    assert text.font(36) is text.font(36)
+    assert len(text) == 3
+
+
+def test_least_recently_used_dropped():
+    text = TextRenderer(max_texts=2)
+    first = text.render("first", RED, 20)
+    second = text.render("second", RED, 20)
+    assert text.render("first", RED, 20) is first
+    text.render("third", RED, 20)
+    assert len(text) == 2
+    assert text.render("first", RED, 20) is first
+    assert text.render("second", RED, 20) is not second
+
+
+def test_draw():
+    win = Surface((200, 100))
+    rect = TextRenderer().draw(win, "Game Over", RED, 36, (100, 50))
+    assert rect.center == (100, 50)
+    assert any(win.get_at((x, rect.centery))[:3] == RED for x in range(rect.left, rect.right))
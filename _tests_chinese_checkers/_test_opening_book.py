@@ -0,0 +1,70 @@
+import pytest
+from chinese_checkers.opening_book import OpeningBook, build_from_self_play, build_from_archive, starting_board
+from chinese_checkers.board import zobrist_turn_key
+from chinese_checkers.archive import archive_logs
+from chinese_checkers.ai import SearchAI
+from chinese_checkers.game_state import GameState, GameConfig
+from chinese_checkers.constants import RED, GREEN
+
+PLAYERS = [("Alice", RED, False), ("Bob", GREEN, False)]
+
+
+def test_add_game_and_choose_move():
+    book = OpeningBook(max_plies=2)
+    book.add_game(PLAYERS, [((3, 9), (4, 8)), ((13, 9), (12, 8)), ((4, 8), (5, 7))], "Alice")
+    book.add_game(PLAYERS, [((3, 11), (4, 10))], "Bob")
+    book.add_game(PLAYERS, [((3, 11), (4, 10))], None)
+    assert len(book) == 2
+    state = GameState()
+    state.setup_players(PLAYERS)
+    players = list(state.get_players().values())
+    start_key = state.board.hash_key ^ zobrist_turn_key(0)
+    assert sorted(book.lookup(start_key)) == [(((3, 9), (4, 8)), 1, 1), (((3, 11), (4, 10)), 2, 0)]
+    assert book.choose_move(state.board, players, 0) == ((3, 9), (4, 8))
+    assert book.choose_move(state.board, players, 1) is None
+    state.board.apply_move((3, 9), (4, 8))
+    assert book.choose_move(state.board, players, 1) == ((13, 9), (12, 8))
+    assert book.choose_move(state.board, players, 0) is None
+
+
+def test_save_and_load(tmp_path):
+    book = build_from_self_play(2, time_budget=0.02, max_depth=1, max_plies=6)
+    file_name = str(tmp_path / "book.ccb")
+    book.save(file_name)
+    loaded = OpeningBook.load(file_name)
+    assert len(loaded) == len(book) > 0
+    assert loaded.max_plies == 6
+    key = starting_board(PLAYERS).hash_key ^ zobrist_turn_key(0)
+    assert sorted(loaded.lookup(key)) == sorted(book.lookup(key))
+    with open(file_name, "wb") as file:
+        file.write(b"not a book")
+    with pytest.raises(ValueError):
+        OpeningBook.load(file_name)
+
+
+def test_build_from_archive(tmp_path):
+    log_files = []
+    for seed in range(2):
+        log_file = str(tmp_path / f"game{seed}.txt")
+        state = GameState(GameConfig(2, time_budget=0.02, max_depth=1, max_plies=1000, log_file=log_file, seed=seed))
+        state.run()
+        state.close_log()
+        log_files.append(log_file)
+    archive_file = str(tmp_path / "games.cca")
+    archive_logs(log_files, archive_file)
+    from_archive = build_from_archive(archive_file, max_plies=8)
+    from_self_play = build_from_self_play(2, time_budget=0.02, max_depth=1, max_plies=8)
+    key = starting_board(PLAYERS).hash_key ^ zobrist_turn_key(0)
+    assert sorted(from_archive.lookup(key)) == sorted(from_self_play.lookup(key))
+    assert len(from_archive) == len(from_self_play)
+
+
+def test_search_ai_plays_book_moves():
+    book = OpeningBook()
+    book.add_game(PLAYERS, [((3, 11), (4, 10))], "Alice")
+    state = GameState()
+    state.setup_players(PLAYERS)
+    players = list(state.get_players().values())
+    ai = SearchAI(time_budget=0.05, max_depth=1, book=book)
+    assert ai.choose_move(state.board, players, 0) == ((3, 11), (4, 10))
+    assert ai.choose_move(state.board, players, 1) is not None
@@ -80,6 +80,17 @@ def test_add_piece():
     player.add_piece(piece4)
     assert piece4 in player.get_pieces().values()
 
+def test_clear_pieces():
+    player = Player("Player1", RED)
+    player.add_target_loc((0, 0))
+    player.add_target_loc((0, 1))
+    piece = Piece(RED, str(RED)+"1", (0, 0))
+    player.add_piece(piece)
+    assert player.get_target_locs()[(0, 0)] == piece
+    player.clear_pieces()
+    assert player.get_pieces() == {}
+    assert player.get_target_locs() == {(0, 0): 0, (0, 1): 0}
+
 def test_get_pieces():
     player = Player("Player1", RED)
     piece = Piece(RED, str(RED)+"1", (0, 0))
@@ -0,0 +1,132 @@
+import asyncio
+from unittest.mock import patch
+from chinese_checkers.board import Board
+from chinese_checkers.server import GameServer, GameClient
+
+
+def run(test):
+    async def with_server():
+        server = GameServer(port=0, time_budget=0.05, max_depth=1)
+        port = await server.start()
+        try:
+            await asyncio.wait_for(test(server, port), 30)
+        finally:
+            await server.close()
+    asyncio.run(with_server())
+
+
+async def receive_type(client, kind):
+    message = await client.receive()
+    while message["type"] != kind:
+        message = await client.receive()
+    return message
+
+
+def test_two_players():
+    async def test(server, port):
+        alice = await GameClient.connect(port=port)
+        bob = await GameClient.connect(port=port)
+        await alice.join("t1", "Alice")
+        assert await alice.receive() == {"type": "joined", "table": "t1", "name": "Alice", "seat": 0}
+        await bob.join("t1", "Alice")
+        assert (await bob.receive())["message"] == "This name is already taken"
+        await bob.join("t1", "Bob")
+        assert (await bob.receive())["seat"] == 1
+        start = await alice.receive()
+        assert start["type"] == "start"
+        assert [player["name"] for player in start["players"]] == ["Alice", "Bob"]
+        assert start["turn"] == "Alice"
+        assert (await bob.receive()) == start
+        await bob.move((13, 9), (12, 8))
+        assert (await bob.receive())["message"] == "Not your turn"
+        await alice.move((3, 11), (6, 12))
+        assert (await alice.receive())["message"] == "Illegal move"
+        await alice.move((3, 11), (4, 10))
+        for client in (alice, bob):
+            assert await client.receive() == {"type": "move", "player": "Alice", "from": [3, 11], "to": [4, 10],
+                                              "ply": 1, "turn": "Bob"}
+        await bob.join("t2", "Bob")
+        assert (await bob.receive())["message"] == "Already at a table"
+        await alice.close()
+        assert await receive_type(bob, "game_over") == {"type": "game_over", "winner": None,
+                                                        "reason": "Alice left"}
+        await bob.close()
+    run(test)
+
+
+def test_against_computer():
+    async def test(server, port):
+        alice = await GameClient.connect(port=port)
+        await alice.join("t1", "Alice", num_of_players=3, num_of_computers=2)
+        start = await receive_type(alice, "start")
+        assert [player["computer"] for player in start["players"]] == [False, True, True]
+        await alice.move((3, 11), (4, 10))
+        moves = [await alice.receive() for _ in range(3)]
+        assert [move["player"] for move in moves] == ["Alice", "Computer 1", "Computer 2"]
+        assert moves[-1]["turn"] == "Alice"
+        await alice.close()
+    run(test)
+
+
+def test_invalid_messages():
+    async def test(server, port):
+        client = await GameClient.connect(port=port)
+        client.writer.write(b"not json\n")
+        assert (await client.receive())["message"] == "Invalid message"
+        await client.send({"type": "dance"})
+        assert (await client.receive())["message"] == "Unknown message type"
+        await client.move((3, 11), (4, 10))
+        assert (await client.receive())["message"] == "Not at a table"
+        await client.join("t1", "Alice", num_of_players=5)
+        assert (await client.receive())["message"] == "Invalid table settings"
+        await client.close()
+    run(test)
+
+
+def test_rejected_joins_leave_no_tables():
+    async def test(server, port):
+        client = await GameClient.connect(port=port)
+        for i in range(5):
+            await client.join(f"t{i}", "")
+            assert (await client.receive())["message"] == "Invalid name"
+        await client.join("t5", "Computer 1", num_of_players=2, num_of_computers=1)
+        assert (await client.receive())["message"] == "This name is already taken"
+        assert server.tables == {}
+        await client.close()
+    run(test)
+
+
+def test_game_where_all_the_players_are_blocked_ends():
+    async def test(server, port):
+        alice = await GameClient.connect(port=port)
+        await alice.join("t1", "Alice", num_of_players=3, num_of_computers=2)
+        assert (await receive_type(alice, "start"))["turn"] == "Alice"
+        passes = [await alice.receive() for _ in range(3)]
+        assert [message["player"] for message in passes] == ["Alice", "Computer 1", "Computer 2"]
+        assert await alice.receive() == {"type": "game_over", "winner": None, "reason": "blocked"}
+        assert server.tables == {}
+        await alice.close()
+    with patch.object(Board, "legal_moves", return_value=[]):
+        run(test)
+
+
+def test_many_tables():
+    async def test(server, port):
+        async def play_table(i):
+            first = await GameClient.connect(port=port)
+            second = await GameClient.connect(port=port)
+            await first.join(f"t{i}", "First")
+            await receive_type(first, "joined")
+            await second.join(f"t{i}", "Second")
+            await receive_type(second, "start")
+            await first.move((3, 11), (4, 10))
+            await receive_type(second, "move")
+            await second.move((13, 9), (12, 8))
+            message = await receive_type(first, "move")
+            while message["player"] != "Second":
+                message = await receive_type(first, "move")
+            await first.close()
+            await second.close()
+            return message["ply"]
+        assert await asyncio.gather(*(play_table(i) for i in range(50))) == [2] * 50
+    run(test)
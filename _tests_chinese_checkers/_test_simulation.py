@@ -0,0 +1,96 @@
+import pytest
+from chinese_checkers.board import CELLS, CELL_INDEX
+from chinese_checkers.game_state import GameState
+from chinese_checkers.archive import Archive
+
+np = pytest.importorskip("numpy")
+from chinese_checkers.simulation import BatchSimulation  # noqa: E402
+
+
+def replayed_state(simulation, game):
+    state = GameState()
+    state.setup_players(simulation.players_info)
+    for src, dst in simulation.moves[game, :simulation.plies[game]]:
+        piece = state.board.apply_move(CELLS[src], CELLS[dst])
+        owner = next(player for player in state.get_players().values() if player.get_color() == piece.get_color())
+        owner.move_piece(CELLS[src], CELLS[dst])
+    return state
+
+
+@pytest.mark.parametrize("num_of_players", [2, 3, 6])
+def test_destinations_match_legal_moves(num_of_players):
+    simulation = BatchSimulation(4, num_of_players, "random", max_plies=40, seed=0)
+    while True:
+        games = simulation.active_games()
+        if len(games) == 0:
+            break
+        destinations = simulation.destinations(games)
+        for row, game in enumerate(games):
+            state = replayed_state(simulation, game)
+            player = list(state.get_players().values())[simulation.turns[game]]
+            legal = {(CELL_INDEX[src], CELL_INDEX[dst]) for src, dst in state.board.legal_moves(player)}
+            found = {(int(simulation.positions[game, simulation.turns[game], piece]), int(cell))
+                     for piece, cell in zip(*np.nonzero(destinations[row]))}
+            assert found == legal
+        simulation.step()
+    assert (simulation.plies == 40).all()
+
+
+def test_greedy_games_end_with_the_winner():
+    simulation = BatchSimulation(6, 2, "greedy", seed=1)
+    simulation.run()
+    assert (simulation.winners >= 0).all()
+    for game in range(6):
+        state = replayed_state(simulation, game)
+        winners = [i for i, player in enumerate(state.get_players().values()) if player.check_if_winner()]
+        assert winners == [simulation.winners[game]]
+
+
+def test_same_seed_same_games():
+    first = BatchSimulation(3, 3, "greedy", max_plies=100, seed=5)
+    second = BatchSimulation(3, 3, "greedy", max_plies=100, seed=5)
+    first.run()
+    second.run()
+    assert (first.plies == second.plies).all()
+    assert (first.moves == second.moves).all()
+
+
+def test_games_where_all_the_players_are_blocked_end():
+    simulation = BatchSimulation(2, 3, "random", seed=3)
+    simulation.occupied[1] = True  # Every cell is taken, so no player of the second game can move
+    for _ in range(3):
+        assert simulation.step() == 2
+        assert simulation.plies[1] == 0
+    assert list(simulation.active_games()) == [0]
+    simulation.run()
+    assert simulation.winners[1] == -1
+    assert simulation.plies[1] == 0
+    assert len(simulation.active_games()) == 0
+    assert simulation.recorded_games()[1].moves == []
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        BatchSimulation(1, 2, "minimax")
+
+
+def test_export(tmp_path):
+    simulation = BatchSimulation(3, 2, "greedy", seed=2)
+    simulation.run()
+    log_files = [str(tmp_path / f"game{i}.txt") for i in range(3)]
+    simulation.write_text_logs(log_files)
+    for game, log_file in enumerate(log_files):
+        state = GameState(log_file=log_file)
+        state.load_settings()
+        state.place_pieces_on_board()
+        state.add_targets_to_players()
+        state.change_turn()
+        assert state.load_game() == simulation.plies[game]
+        assert state.board.hash_key == replayed_state(simulation, game).board.hash_key
+        assert open(log_file).readlines()[-1].endswith("+Game Over\n")
+    archive_file = str(tmp_path / "games.cca")
+    simulation.write_archive(archive_file)
+    with Archive(archive_file) as archive:
+        assert len(archive) == 3
+        for game in range(3):
+            assert archive.get_moves(game) == [tuple(move) for move in simulation.moves[game, :simulation.plies[game]]]
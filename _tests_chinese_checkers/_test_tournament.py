@@ -0,0 +1,39 @@
+import functools
+import chinese_checkers.tournament
+from chinese_checkers.endgame import Tablebase
+from chinese_checkers.game_state import GameConfig
+from chinese_checkers.tournament import play_game, run_tournament
+
+
+def test_play_game():
+    record = play_game(3, GameConfig(2, time_budget=0.05, max_depth=1, max_plies=1000), 11)
+    assert record.game_id == 3
+    assert record.seed == 11
+    assert record.num_of_players == 2
+    assert record.winner in ("Computer 1", "Computer 2")
+    assert record.winner == f"Computer {record.winner_seat + 1}"
+    assert 0 < record.plies <= 1000
+    assert 0 <= record.mean_move_time <= record.max_move_time
+
+
+def test_play_game_is_reproducible():
+    config = GameConfig(2, time_budget=5, max_depth=1, max_plies=1000)
+    first = play_game(0, config, 5)
+    second = play_game(0, config, 5)
+    assert (first.winner, first.plies) == (second.winner, second.plies)
+
+
+def test_run_tournament():
+    records = run_tournament(2, (2, 3), workers=2, time_budget=0.05, max_depth=1, max_plies=40, seed=100)
+    assert [record.game_id for record in records] == [0, 1, 2, 3]
+    assert [record.num_of_players for record in records] == [2, 2, 3, 3]
+    assert [record.seed for record in records] == [100, 101, 102, 103]
+    assert all(record.plies == 40 and record.winner is None for record in records)
+
+
+def test_run_tournament_builds_the_endgame_tables_first(tmp_path, monkeypatch):
+    monkeypatch.setattr(chinese_checkers.tournament, "Tablebase", functools.partial(Tablebase, max_outside=1))
+    records = run_tournament(1, (2,), workers=1, time_budget=0.05, max_depth=1, max_plies=4,
+                             endgame_tables=str(tmp_path))
+    assert len(records) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["endgame_0_1.bin", "endgame_111_1.bin"]
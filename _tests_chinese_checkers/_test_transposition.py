@@ -0,0 +1,39 @@
+from chinese_checkers.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+
+def test_store_and_lookup():
+    table = TranspositionTable(8)
+    assert table.lookup(5) is None
+    table.store(5, 3, 10, EXACT, ((0, 12), (1, 11)))
+    assert table.lookup(5) == (5, 3, 10, EXACT, ((0, 12), (1, 11)))
+    table.store(5, 1, 7, LOWER_BOUND, None)
+    assert table.lookup(5) == (5, 1, 7, LOWER_BOUND, None)
+    assert len(table) == 1
+
+
+def test_size_is_power_of_two():
+    assert TranspositionTable(1000).size == 1024
+    assert TranspositionTable(1).size == 1
+
+
+def test_two_tier_replacement():
+    table = TranspositionTable(4)
+    table.store(1, 5, 10, EXACT, None)
+    table.store(5, 2, 20, UPPER_BOUND, None)  # same slot, shallower: goes to the always-replace tier
+    assert table.lookup(1)[2] == 10
+    assert table.lookup(5)[2] == 20
+    table.store(9, 1, 30, EXACT, None)  # replaces the recent entry, the deep one stays
+    assert table.lookup(5) is None
+    assert table.lookup(1)[2] == 10
+    assert table.lookup(9)[2] == 30
+    table.store(13, 6, 40, EXACT, None)  # deeper: takes the depth-preferred tier
+    assert table.lookup(13)[2] == 40
+    assert table.lookup(1) is None
+
+
+def test_clear():
+    table = TranspositionTable(4)
+    table.store(1, 1, 1, EXACT, None)
+    table.clear()
+    assert table.lookup(1) is None
+    assert len(table) == 0
@@ -0,0 +1,297 @@
+import random
+import threading
+import time
+from typing import Tuple, List, Optional
+from .board import Board, CELL_INDEX, zobrist_turn_key
+from .player import Player
+from .transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from .opening_book import OpeningBook
+from .endgame import Tablebase
+from .distances import distance_tables
+from .batch_eval import BatchEvaluator, HAS_NUMPY
+
+Coordinates = Tuple[int, int]
+Move = Tuple[Coordinates, Coordinates]
+
+WIN_SCORE = 1_000_000
+
+
+class _SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget of the move is used up, or the search is stopped.
+    """
+
+
+class SearchAI:
+    """
+    A computer player that picks moves with iterative deepening alpha-beta search.
+    With more than 2 players the search is paranoid: all the opponents play against the player to move.
+    """
+
+    def __init__(self, time_budget: float = 1.0, max_depth: int = 4, beam_width: Optional[int] = 16,
+                 table: Optional[TranspositionTable] = None, rng: Optional[random.Random] = None,
+                 book: Optional[OpeningBook] = None, endgame: Optional[Tablebase] = None,
+                 batch: bool = True) -> None:
+        """
+        A constructor for a SearchAI object.
+        :param time_budget: The number of seconds the search may take for a single move.
+        :param max_depth: The deepest search, in plies.
+        :param beam_width: The number of best ordered moves searched at every node, None to search all of them.
+        :param table: The transposition table, it is kept between moves so results are reused across turns.
+        :param rng: If given, breaks ties between equally good moves at random, so games are not all the same.
+        :param book: An opening book, positions found in it are played from it without searching.
+        :param endgame: Endgame tables, when few of the player's pieces are outside its target they pick the move.
+        :param batch: If True and numpy is installed, the moves before the last ply are scored together
+        with a BatchEvaluator instead of one by one. The results are the same.
+        """
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.beam_width = beam_width
+        # Allocated by the first search when not given, a SearchAI that never searches costs no table memory
+        self.__table = table
+        self.rng = rng
+        self.book = book
+        self.endgame = endgame
+        self.batch = batch and HAS_NUMPY
+        self.__evaluator: Optional[BatchEvaluator] = None
+        self.nodes = 0
+        self.__deadline = 0.0
+        self.__stop: Optional[threading.Event] = None
+        self.__board: Board = Board()
+        self.__players: List[Player] = []
+        # The step distances of every cell to the far corner of every player's target, by cell index
+        self.__to_apex: List[Optional[Tuple[int, ...]]] = []
+        self.__root = 0
+
+    @property
+    def table(self) -> TranspositionTable:
+        """
+        :return: The transposition table, it is kept between moves so results are reused across turns.
+        """
+        if self.__table is None:
+            self.__table = TranspositionTable()
+        return self.__table
+
+    def choose_move(self, board: Board, players: List[Player], player_index: int,
+                    stop: Optional[threading.Event] = None) -> Optional[Move]:
+        """
+        This function searches for the best move of a player.
+        The board and the players are changed during the search and restored before it returns.
+        :param board: The board of the game.
+        :param players: The players of the game, in turn order.
+        :param player_index: The index of the player to move.
+        :param stop: If given, setting it from another thread ends the search early, like the end of the time budget.
+        :return: A (piece location, destination) pair, None if the player can't move.
+        """
+        if self.book is not None:
+            book_move = self.book.choose_move(board, players, player_index, self.rng)
+            if book_move is not None:
+                return book_move
+        if self.endgame is not None:
+            endgame_move = self.endgame.choose_move(board, players[player_index])
+            if endgame_move is not None:
+                return endgame_move
+        self.__prepare(board, players, player_index, time.perf_counter() + self.time_budget, stop)
+        moves = self.ordered_moves(player_index, self.rng is not None)
+        if not moves:
+            return None
+        best_move = moves[0]
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best_move = self.__search_root(moves, depth)
+            except _SearchTimeout:
+                break
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+        return best_move
+
+    def ponder(self, board: Board, players: List[Player], player_index: int, stop: threading.Event) -> None:
+        """
+        This function thinks on the time of a player, for the player after it, until stop is set.
+        It searches the positions after the best moves of the player deeper and deeper,
+        so the next choose_move of the next player finds them in the transposition table.
+        The board and the players are changed during the search and restored before it returns.
+        :param board: The board of the game.
+        :param players: The players of the game, in turn order.
+        :param player_index: The index of the player to move.
+        :param stop: Setting it from another thread ends the search.
+        """
+        self.__prepare(board, players, player_index, float("inf"), stop)
+        next_index = (player_index + 1) % len(players)
+        replies = self.ordered_moves(player_index)[:self.beam_width]
+        player = players[player_index]
+        try:
+            for depth in range(1, self.max_depth + 1):
+                for move in replies:
+                    board.apply_move(move[0], move[1])
+                    player.move_piece(move[0], move[1])
+                    try:
+                        if not player.check_if_winner():
+                            self.__root = next_index
+                            moves = self.ordered_moves(next_index)
+                            if moves:
+                                self.__search_root(moves, depth)
+                    finally:
+                        player.move_piece(move[1], move[0])
+                        board.undo_move(move[0], move[1])
+        except _SearchTimeout:
+            pass
+
+    def __prepare(self, board: Board, players: List[Player], player_index: int, deadline: float,
+                  stop: Optional[threading.Event]) -> None:
+        """
+        This function sets up a search of a position.
+        :param board: The board of the game.
+        :param players: The players of the game, in turn order.
+        :param player_index: The index of the player the search is done for.
+        :param deadline: The time.perf_counter() time the search ends at.
+        :param stop: If given, setting it ends the search.
+        """
+        if self.__table is None:
+            self.__table = TranspositionTable()
+        self.__board = board
+        self.__players = players
+        self.__to_apex = [distance_tables(player.get_target_locs()).to_apex if player.get_target_locs() else None
+                          for player in players]
+        self.__root = player_index
+        self.__evaluator = BatchEvaluator(players) if self.batch else None
+        self.__deadline = deadline
+        self.__stop = stop
+        self.nodes = 0
+
+    def evaluate(self) -> int:
+        """
+        This function scores the position for the player the search is done for.
+        :return: The player's progress minus the progress of the best opponent.
+        """
+        scores = [self.progress(index) for index in range(len(self.__players))]
+        own = scores.pop(self.__root)
+        return own - max(scores) if scores else own
+
+    def progress(self, player_index: int) -> int:
+        """
+        :param player_index: The index of a player.
+        :return: Minus the sum of the distances of the player's pieces from the far corner of its target.
+        """
+        to_apex = self.__to_apex[player_index]
+        if to_apex is None:
+            return 0
+        return -sum(to_apex[CELL_INDEX[loc]] for loc in self.__players[player_index].get_pieces())
+
+    def ordered_moves(self, player_index: int, shuffle: bool = False) -> List[Move]:
+        """
+        This function returns the moves of a player, the ones that advance the most first.
+        :param player_index: The index of the player.
+        :param shuffle: If True, moves that advance the same are in random order.
+        :return: list of (piece location, destination) pairs.
+        """
+        moves = self.__board.legal_moves(self.__players[player_index])
+        if shuffle and self.rng is not None:
+            self.rng.shuffle(moves)
+        to_apex = self.__to_apex[player_index]
+        if to_apex is not None:
+            moves.sort(key=lambda move: to_apex[CELL_INDEX[move[1]]] - to_apex[CELL_INDEX[move[0]]])
+        return moves
+
+    def __search_root(self, moves: List[Move], depth: int) -> Move:
+        """
+        This function searches all the moves of the root player to a given depth.
+        :param moves: The moves of the root player, best first.
+        :param depth: The depth to search.
+        :return: The best move.
+        """
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            score = self.__after_move(self.__root, move, depth - 1, alpha, WIN_SCORE + 1)
+            if score > alpha:
+                alpha = score
+                best_move = move
+        return best_move
+
+    def __after_move(self, player_index: int, move: Move, depth: int, alpha: int, beta: int) -> int:
+        """
+        This function plays a move, scores the position after it and takes the move back.
+        :return: The score of the position after the move.
+        """
+        player = self.__players[player_index]
+        self.__board.apply_move(move[0], move[1])
+        player.move_piece(move[0], move[1])
+        try:
+            if player.check_if_winner():
+                score = WIN_SCORE + depth if player_index == self.__root else -WIN_SCORE - depth
+            else:
+                score = self.__search((player_index + 1) % len(self.__players), depth, alpha, beta)
+        finally:
+            player.move_piece(move[1], move[0])
+            self.__board.undo_move(move[0], move[1])
+        return score
+
+    def __search(self, player_index: int, depth: int, alpha: int, beta: int) -> int:
+        """
+        This function runs the alpha-beta search, the root player maximizes and the others minimize.
+        :return: The score of the position.
+        """
+        self.nodes += 1
+        if self.nodes & 255 == 0 and (time.perf_counter() > self.__deadline or
+                                      (self.__stop is not None and self.__stop.is_set())):
+            raise _SearchTimeout()
+        if depth == 0:
+            return self.evaluate()
+        table = self.__table
+        assert table is not None, "__prepare allocates the table"
+        # The score depends on the player to move and on the player the search is done for,
+        # turn keys from 6 up are not used by any player so they mark the root player.
+        key = self.__board.hash_key ^ zobrist_turn_key(player_index) ^ zobrist_turn_key(self.__root + 6)
+        entry = table.lookup(key)
+        table_move = None
+        if entry is not None:
+            _, entry_depth, score, flag, table_move = entry
+            if entry_depth >= depth:
+                if flag == EXACT or (flag == LOWER_BOUND and score >= beta) or (flag == UPPER_BOUND and score <= alpha):
+                    return score
+        moves = self.ordered_moves(player_index)
+        if not moves:
+            return self.__search((player_index + 1) % len(self.__players), depth - 1, alpha, beta)
+        if table_move in moves:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+        if self.beam_width is not None:
+            moves = moves[:self.beam_width]
+        first_alpha, first_beta = alpha, beta
+        best_move = moves[0]
+        scores = None
+        if depth == 1 and self.__evaluator is not None:
+            scores = self.__evaluator.scores(self.__players, player_index, self.__root, moves, WIN_SCORE).tolist()
+        if player_index == self.__root:
+            for i, move in enumerate(moves):
+                if scores is not None:
+                    score = scores[i]
+                else:
+                    score = self.__after_move(player_index, move, depth - 1, alpha, beta)
+                if score > alpha:
+                    alpha = score
+                    best_move = move
+                if alpha >= beta:
+                    break
+            value = alpha
+        else:
+            for i, move in enumerate(moves):
+                if scores is not None:
+                    score = scores[i]
+                else:
+                    score = self.__after_move(player_index, move, depth - 1, alpha, beta)
+                if score < beta:
+                    beta = score
+                    best_move = move
+                if alpha >= beta:
+                    break
+            value = beta
+        if value <= first_alpha:
+            flag = UPPER_BOUND
+        elif value >= first_beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        table.store(key, depth, value, flag, best_move)
+        return value
@@ -0,0 +1,131 @@
+import threading
+import pygame
+from typing import Tuple, List, Optional, Callable
+from .ai import SearchAI
+from .board import Board
+from .piece import Piece
+from .player import Player
+
+# The event posted when a computer move is found, with the attributes move and ply
+AI_MOVE_EVENT = pygame.USEREVENT + 1
+
+
+def copy_position(board: Board, players: List[Player]) -> Tuple[Board, List[Player]]:
+    """
+    This function copies the pieces and targets of a game, so a search can change them while the game goes on.
+    :param board: The board of the game.
+    :param players: The players of the game, in turn order.
+    :return: A new board and new players with the same pieces and targets.
+    """
+    new_board = Board()
+    new_players = []
+    for player in players:
+        new_player = Player(player.get_name(), player.color, player.check_if_computer())
+        for loc in player.get_target_locs():
+            new_player.add_target_loc(loc)
+        for loc, piece in player.get_pieces().items():
+            new_piece = Piece(piece.color, piece.get_id(), loc)
+            new_board.add_piece(new_piece)
+            new_player.add_piece(new_piece)
+        new_players.append(new_player)
+    return new_board, new_players
+
+
+class AIWorker:
+    """
+    A class that runs the search of a SearchAI on a background thread, so the window keeps handling events.
+    A found move is posted as an AI_MOVE_EVENT with the ply it was searched for, the display must be initialized.
+    While a human thinks, the worker can ponder for the computer that moves next,
+    the positions it searches stay in the transposition table of the SearchAI.
+    Only one search runs at a time: starting a search or cancelling stops the one that runs.
+    """
+
+    def __init__(self, ai: SearchAI) -> None:
+        """
+        A constructor for an AIWorker object.
+        :param ai: The computer player, its transposition table is shared by all the searches.
+        """
+        self.ai = ai
+        self.__thread: Optional[threading.Thread] = None
+        self.__stop = threading.Event()
+        # ("move" or "ponder", ply) of the running search
+        self.__task: Optional[Tuple[str, int]] = None
+
+    def is_searching_move(self, ply: int) -> bool:
+        """
+        :param ply: The number of moves played so far.
+        :return: True if the move of this ply is searched for.
+        """
+        return self.__task == ("move", ply) and self.__thread is not None and self.__thread.is_alive()
+
+    def is_pondering(self, ply: int) -> bool:
+        """
+        :param ply: The number of moves played so far.
+        :return: True if the worker ponders on the time of the player of this ply.
+        """
+        return self.__task == ("ponder", ply) and self.__thread is not None and self.__thread.is_alive()
+
+    def request_move(self, board: Board, players: List[Player], player_index: int, ply: int) -> None:
+        """
+        This function starts searching for the move of a player, on a copy of the position.
+        :param board: The board of the game.
+        :param players: The players of the game, in turn order.
+        :param player_index: The index of the player to move.
+        :param ply: The number of moves played so far, it comes back with the move.
+        """
+        self.cancel()
+        board, players = copy_position(board, players)
+        self.__task = ("move", ply)
+        self.__start(self.__search_move, board, players, player_index, ply, self.__stop)
+
+    def ponder(self, board: Board, players: List[Player], player_index: int, ply: int) -> None:
+        """
+        This function starts thinking on the time of a player, for the player after it, until it is cancelled.
+        :param board: The board of the game.
+        :param players: The players of the game, in turn order.
+        :param player_index: The index of the player to move.
+        :param ply: The number of moves played so far.
+        """
+        self.cancel()
+        board, players = copy_position(board, players)
+        self.__task = ("ponder", ply)
+        self.__start(self.ai.ponder, board, players, player_index, self.__stop)
+
+    def cancel(self) -> None:
+        """
+        This function stops the running search and waits for it, a cancelled search posts no move,
+        and a move it already posted is taken out of the event queue.
+        """
+        if self.__thread is not None:
+            self.__stop.set()
+            self.__thread.join()
+            self.__thread = None
+            if pygame.display.get_init():
+                pygame.event.clear(AI_MOVE_EVENT)
+        self.__task = None
+        self.__stop = threading.Event()
+
+    def __start(self, target: Callable[..., None], *args: object) -> None:
+        """
+        This function runs a search on a new daemon thread, so a search never keeps the program from exiting.
+        :param target: The search function.
+        :param args: Its arguments.
+        """
+        self.__thread = threading.Thread(target=target, args=args, daemon=True)
+        self.__thread.start()
+
+    def __search_move(self, board: Board, players: List[Player], player_index: int, ply: int,
+                      stop: threading.Event) -> None:
+        """
+        This function searches for a move and sends it back, unless the search was cancelled.
+        :param board: A copy of the board of the game.
+        :param players: Copies of the players of the game, in turn order.
+        :param player_index: The index of the player to move.
+        :param ply: The number of moves played so far.
+        :param stop: Set when the search is cancelled.
+        """
+        move = self.ai.choose_move(board, players, player_index, stop)
+        if stop.is_set():
+            return
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(AI_MOVE_EVENT, move=move, ply=ply))
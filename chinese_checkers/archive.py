@@ -0,0 +1,196 @@
+import os
+import sys
+import mmap
+import array
+import struct
+from typing import Tuple, List, Iterable, Iterator, Optional, BinaryIO
+from .game_record import RecordedGame, encode_game, decode_game, decode_moves, text_log_to_game
+
+# An archive starts with MAGIC and a version byte, then the records of its games one after the other
+# (see game_record.py), then the offsets of the records as uint64 with one more offset for the end of the last one,
+# and it ends with a footer of the offset of that index, the number of games and MAGIC again.
+MAGIC = b"CCGA"
+VERSION = 1
+_HEADER = struct.Struct("<4sB")
+_FOOTER = struct.Struct("<QQ4s")
+_OFFSET = struct.Struct("<Q")
+
+
+class ArchiveWriter:
+    """
+    A class that writes many games to one archive file, the index is written when it is closed.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """
+        A constructor for an ArchiveWriter object.
+        :param file_name: The name of the archive file.
+        """
+        self.file_name = file_name
+        self.__file: Optional[BinaryIO] = open(file_name, "wb")
+        self.__file.write(_HEADER.pack(MAGIC, VERSION))
+        self.__offsets = array.array("Q", [_HEADER.size])
+
+    def add_record(self, record: bytes) -> int:
+        """
+        This function adds an encoded game to the archive.
+        :param record: The binary record of the game.
+        :return: The id of the game in the archive.
+        """
+        if self.__file is None:
+            raise ValueError(f"The archive {self.file_name} is closed")
+        self.__file.write(record)
+        self.__offsets.append(self.__offsets[-1] + len(record))
+        return len(self.__offsets) - 2
+
+    def add_game(self, game: RecordedGame) -> int:
+        """
+        This function adds a game to the archive.
+        :param game: The game.
+        :return: The id of the game in the archive.
+        """
+        return self.add_record(encode_game(game))
+
+    def __len__(self) -> int:
+        """
+        :return: The number of games added so far.
+        """
+        return len(self.__offsets) - 1
+
+    def close(self) -> None:
+        """
+        This function writes the index and the footer and closes the archive file.
+        """
+        if self.__file is None:
+            return
+        index_offset = self.__offsets[-1]
+        if sys.byteorder == "big":
+            self.__offsets.byteswap()
+        self.__file.write(self.__offsets.tobytes())
+        self.__file.write(_FOOTER.pack(index_offset, len(self.__offsets) - 1, MAGIC))
+        self.__file.close()
+        self.__file = None
+
+
+class Archive:
+    """
+    A class that reads an archive file through mmap, games are decoded only when they are asked for.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """
+        A constructor for an Archive object.
+        :param file_name: The name of the archive file.
+        """
+        self.file_name = file_name
+        with open(file_name, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size + _OFFSET.size + _FOOTER.size:
+                raise ValueError(f"{file_name} is not a game archive")
+            self.__data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = _HEADER.unpack_from(self.__data, 0)
+        self.__index_offset, self.__num_of_games, end_magic = _FOOTER.unpack_from(
+            self.__data, len(self.__data) - _FOOTER.size)
+        if magic != MAGIC or end_magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{file_name} is not a game archive")
+        # A truncated file has no room for the index the footer describes
+        if self.__index_offset + (self.__num_of_games + 1) * _OFFSET.size + _FOOTER.size != len(self.__data):
+            self.close()
+            raise ValueError(f"{file_name} is truncated or corrupt")
+
+    def __len__(self) -> int:
+        """
+        :return: The number of games in the archive.
+        """
+        return self.__num_of_games
+
+    def get_record(self, game_id: int) -> bytes:
+        """
+        :param game_id: The id of a game, from 0 to len(archive) - 1.
+        :return: The binary record of the game, a copy that stays valid after the archive is closed.
+        """
+        start, end = self.__record_range(game_id)
+        return self.__data[start:end]
+
+    def __record_range(self, game_id: int) -> Tuple[int, int]:
+        """
+        :param game_id: The id of a game.
+        :return: The offsets of the start and the end of the record of the game.
+        """
+        if not 0 <= game_id < self.__num_of_games:
+            raise IndexError(f"No game {game_id} in {self.file_name}")
+        start, = _OFFSET.unpack_from(self.__data, self.__index_offset + game_id * _OFFSET.size)
+        end, = _OFFSET.unpack_from(self.__data, self.__index_offset + (game_id + 1) * _OFFSET.size)
+        if not _HEADER.size <= start <= end <= self.__index_offset:
+            raise ValueError(f"The index of {self.file_name} is corrupt")
+        return start, end
+
+    def __view(self, game_id: int) -> memoryview:
+        """
+        :param game_id: The id of a game.
+        :return: The record of the game as a view of the mapped file without copying it,
+        it must be released before the archive is closed.
+        """
+        start, end = self.__record_range(game_id)
+        return memoryview(self.__data)[start:end]
+
+    def get_game(self, game_id: int) -> RecordedGame:
+        """
+        :param game_id: The id of a game.
+        :return: The game, with its players and messages.
+        """
+        with self.__view(game_id) as record:
+            return decode_game(record)
+
+    def get_moves(self, game_id: int) -> List[Tuple[int, int]]:
+        """
+        :param game_id: The id of a game.
+        :return: The moves of the game as (from cell index, to cell index) pairs, see Board.cell_list().
+        """
+        with self.__view(game_id) as record:
+            return decode_moves(record)
+
+    def iter_games(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, List[Tuple[int, int]]]]:
+        """
+        This function yields the games of the archive one at a time.
+        :param start: The id of the first game.
+        :param stop: The id after the last game, None for the end of the archive.
+        :return: An iterator of (game id, moves) pairs, the moves are as in get_moves.
+        """
+        end = self.__num_of_games if stop is None else min(stop, self.__num_of_games)
+        for game_id in range(start, end):
+            yield game_id, self.get_moves(game_id)
+
+    def close(self) -> None:
+        """
+        This function unmaps the archive file.
+        """
+        self.__data.close()
+
+    def __enter__(self) -> "Archive":
+        """
+        :return: The archive, it is closed at the end of the with block.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        This function closes the archive at the end of a with block.
+        """
+        self.close()
+
+
+def archive_logs(log_files: Iterable[str], archive_file: str) -> int:
+    """
+    This function converts text log files to one archive.
+    :param log_files: The names of the log files, in the order of their game ids.
+    :param archive_file: The name of the archive file to write.
+    :return: The number of archived games.
+    """
+    writer = ArchiveWriter(archive_file)
+    try:
+        for log_file in log_files:
+            writer.add_game(text_log_to_game(log_file))
+    finally:
+        writer.close()
+    return len(writer)
@@ -0,0 +1,98 @@
+from typing import Tuple, Sequence
+from .board import CELLS, CELL_INDEX
+from .player import Player
+from .distances import distance_tables
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, without it SearchAI scores the moves one by one
+    np = None  # type: ignore[assignment]
+
+Coordinates = Tuple[int, int]
+Move = Tuple[Coordinates, Coordinates]
+
+HAS_NUMPY = np is not None
+
+
+class BatchEvaluator:
+    """
+    A class that scores many moves with single numpy operations.
+    Every player has a row of distances to the far corner of its target and a row of occupied cells,
+    both indexed by the cell indices of Board.cell_list().
+    The scores are the same as SearchAI.evaluate would give after every move.
+    """
+
+    def __init__(self, players: Sequence[Player]) -> None:
+        """
+        A constructor for a BatchEvaluator object.
+        :param players: The players of the game, in turn order. Only their targets are read here.
+        """
+        if np is None:
+            raise ImportError("BatchEvaluator needs numpy")
+        self.num_of_players = len(players)
+        self.distances = np.zeros((len(players), len(CELLS)), dtype=np.int64)
+        self.targets = np.zeros((len(players), len(CELLS)), dtype=bool)
+        for i, player in enumerate(players):
+            target_locs = player.get_target_locs()
+            if target_locs:
+                self.distances[i] = distance_tables(target_locs).to_apex
+                self.targets[i, [CELL_INDEX[loc] for loc in target_locs]] = True
+
+    def occupancy(self, players: Sequence[Player]) -> "np.ndarray":
+        """
+        :param players: The players of the game, in turn order.
+        :return: A boolean array of the cells that hold the pieces of every player.
+        """
+        occupied = np.zeros(len(players) * len(CELLS), dtype=bool)
+        occupied[np.fromiter((i * len(CELLS) + CELL_INDEX[loc] for i, player in enumerate(players)
+                              for loc in player.get_pieces()), dtype=np.int64)] = True
+        return occupied.reshape(len(players), len(CELLS))
+
+    def progress(self, occupied: "np.ndarray") -> "np.ndarray":
+        """
+        :param occupied: The occupancy of every player.
+        :return: Minus the sum of the distances of every player's pieces from the far corner of its target.
+        """
+        return -(self.distances * occupied).sum(axis=1)
+
+    @staticmethod
+    def move_arrays(moves: Sequence[Move]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        :param moves: (piece location, destination) pairs.
+        :return: The cell indices of the locations and of the destinations.
+        """
+        src = np.fromiter((CELL_INDEX[move[0]] for move in moves), dtype=np.int64, count=len(moves))
+        dst = np.fromiter((CELL_INDEX[move[1]] for move in moves), dtype=np.int64, count=len(moves))
+        return src, dst
+
+    def scores(self, players: Sequence[Player], player_index: int, root_index: int, moves: Sequence[Move],
+               win_score: int) -> "np.ndarray":
+        """
+        This function scores the positions after moves of a player, for the player the search is done for.
+        :param players: The players of the game, in turn order.
+        :param player_index: The index of the player that moves.
+        :param root_index: The index of the player the scores are for.
+        :param moves: The moves of the player.
+        :param win_score: The score of a win.
+        :return: The score after every move: win_score if it wins for the root player, -win_score if it wins
+        for another player, otherwise the root player's progress minus the progress of the best opponent.
+        """
+        occupied = self.occupancy(players)
+        progress = self.progress(occupied)
+        src, dst = self.move_arrays(moves)
+        distances = self.distances[player_index]
+        moved = progress[player_index] + distances[src] - distances[dst]
+        others = [i for i in range(self.num_of_players) if i != root_index and i != player_index]
+        if player_index == root_index:
+            scores = moved - progress[others].max() if others else moved
+        elif others:
+            scores = progress[root_index] - np.maximum(moved, progress[others].max())
+        else:
+            scores = progress[root_index] - moved
+        # A move wins if it fills the only target cell the player is missing, from outside the target
+        missing = self.targets[player_index] & ~occupied[player_index]
+        if missing.sum() == 1:
+            targets = self.targets[player_index]
+            wins = missing[dst] & ~targets[src]
+            scores = np.where(wins, win_score if player_index == root_index else -win_score, scores)
+        return scores
@@ -0,0 +1,163 @@
+from typing import Tuple, List, Iterable, Iterator
+from .board import Board, CELLS, CELL_INDEX, NEIGHBORS, JUMPS
+from .piece import Piece
+from .player import Player
+
+Coordinates = Tuple[int, int]
+Move = Tuple[int, int]
+
+# Every game cell gets a bit, its index in Board.cell_list(). For every cell, the mask of its neighbors.
+NEIGHBOR_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << CELL_INDEX[neighbor] for neighbor in NEIGHBORS[cell]) for cell in CELLS)
+# For every cell, the (jumped over bit, landing bit, landing index) triples of its jumps.
+JUMP_TABLE: Tuple[Tuple[Tuple[int, int, int], ...], ...] = tuple(
+    tuple((1 << CELL_INDEX[over], 1 << CELL_INDEX[land], CELL_INDEX[land]) for over, land in JUMPS[cell])
+    for cell in CELLS)
+
+
+def mask_of(cells: Iterable[Coordinates]) -> int:
+    """
+    This function converts board coordinates to a bit mask.
+    :param cells: coordinates of game cells.
+    :return: an integer with the bit of every given cell set.
+    """
+    mask = 0
+    for cell in cells:
+        mask |= 1 << CELL_INDEX[cell]
+    return mask
+
+
+def indices_of(mask: int) -> Iterator[int]:
+    """
+    This function yields the indices of the set bits of a mask, lowest first.
+    :param mask: a bit mask of cells.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def cells_of(mask: int) -> List[Coordinates]:
+    """
+    This function converts a bit mask to board coordinates.
+    :param mask: a bit mask of cells.
+    :return: list of coordinates.
+    """
+    return [CELLS[index] for index in indices_of(mask)]
+
+
+def destinations(index: int, occupied: int) -> int:
+    """
+    This function returns every cell a piece can reach in one move, with steps and chained jumps.
+    :param index: the cell index of the piece.
+    :param occupied: the mask of all occupied cells, including the piece itself.
+    :return: a mask of the reachable cells.
+    """
+    moves = NEIGHBOR_MASKS[index] & ~occupied
+    seen = occupied | moves
+    stack = [index]
+    while stack:
+        for over_bit, land_bit, land in JUMP_TABLE[stack.pop()]:
+            if occupied & over_bit and not seen & land_bit:
+                seen |= land_bit
+                moves |= land_bit
+                stack.append(land)
+    return moves
+
+
+class BitBoard:
+    """
+    A compact board state for search and simulation, every player's pieces are kept as a 121-bit integer.
+    """
+    __slots__ = ("player_bits", "occupied")
+
+    def __init__(self, player_bits: Iterable[int]) -> None:
+        """
+        A constructor for a BitBoard object.
+        :param player_bits: a mask of occupied cells for every player, in turn order.
+        """
+        self.player_bits: Tuple[int, ...] = tuple(player_bits)
+        occupied = 0
+        for bits in self.player_bits:
+            occupied |= bits
+        self.occupied = occupied
+
+    @classmethod
+    def from_board(cls, board: Board, players: Iterable[Player]) -> "BitBoard":
+        """
+        This function builds a BitBoard from the pieces on a Board.
+        :param board: the board to convert.
+        :param players: the players of the game, in turn order.
+        :return: a BitBoard object.
+        """
+        return cls(mask_of(loc for loc in player.get_pieces() if loc in board.pieces) for player in players)
+
+    def to_board(self, players: Iterable[Player]) -> Tuple[Board, List[Player]]:
+        """
+        This function builds new Board and Player objects with the pieces of this state.
+        The players are copies of the given ones, with the same name, color, type and target locations.
+        :param players: the players of the game, in turn order.
+        :return: the new board and the new players.
+        """
+        board = Board()
+        new_players = []
+        for player, bits in zip(players, self.player_bits):
+            new_player = Player(player.get_name(), player.color, player.check_if_computer())
+            for loc in player.get_target_locs():
+                new_player.add_target_loc(loc)
+            for i, loc in enumerate(cells_of(bits)):
+                piece = Piece(player.color, f"{player.color}{i}", loc)
+                board.add_piece(piece)
+                new_player.add_piece(piece)
+            new_players.append(new_player)
+        return board, new_players
+
+    def destinations(self, index: int) -> int:
+        """
+        :param index: the cell index of a piece.
+        :return: a mask of the cells the piece can move to.
+        """
+        return destinations(index, self.occupied)
+
+    def legal_moves(self, player_index: int) -> List[Move]:
+        """
+        This function returns all the moves of a player.
+        :param player_index: the index of the player in turn order.
+        :return: list of (from index, to index) pairs.
+        """
+        occupied = self.occupied
+        return [(src, dst) for src in indices_of(self.player_bits[player_index])
+                for dst in indices_of(destinations(src, occupied))]
+
+    def play(self, player_index: int, src: int, dst: int) -> "BitBoard":
+        """
+        This function returns the state after a move, the move is not validated.
+        :param player_index: the index of the player that moves.
+        :param src: the cell index the piece moves from.
+        :param dst: the cell index the piece moves to.
+        :return: a new BitBoard object.
+        """
+        bits = list(self.player_bits)
+        bits[player_index] ^= (1 << src) | (1 << dst)
+        return BitBoard(bits)
+
+    def is_winner(self, player_index: int, target_mask: int) -> bool:
+        """
+        :param player_index: the index of the player.
+        :param target_mask: the mask of the player's target cells.
+        :return: True if all the target cells hold the player's pieces.
+        """
+        return self.player_bits[player_index] & target_mask == target_mask
+
+    def __eq__(self, other: object) -> bool:
+        """
+        :return: True if both states have the same pieces for every player.
+        """
+        return isinstance(other, BitBoard) and self.player_bits == other.player_bits
+
+    def __hash__(self) -> int:
+        """
+        :return: a hash of the state, so it can be used as a dictionary key.
+        """
+        return hash(self.player_bits)
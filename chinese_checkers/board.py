@@ -1,11 +1,117 @@
+import random
 import pygame
-from pygame import Surface
-from typing import Tuple, List, Optional, Set, Union
+from pygame import Surface, Rect
+from typing import Tuple, List, Optional, Set, Union, Dict, FrozenSet, Iterable
 from .piece import Piece
-from .constants import BLACK, WHITE, ROWS, COLS, SQUARE_SIZE
+from .player import Player
+from .constants import BLACK, WHITE, ROWS, SQUARE_SIZE
 
 Coordinates = Tuple[int, int]
 
+# The six directions a piece can step in, as (row, col) offsets on the graphic board.
+DIRECTIONS: Tuple[Coordinates, ...] = ((-1, -1), (-1, 1), (0, -2), (0, 2), (1, -1), (1, 1))
+
+
+def star_layout() -> List[List[Union[int, str]]]:
+    """
+    This function builds the empty graphic board in the shape of the star of david.
+    :return: list of rows, " " for cells outside the game and 0 for empty game cells.
+    """
+    layout: List[List[Union[int, str]]] = []
+    max_width = 13  # Width of the widest row
+    board_len = 17  # Number of rows
+    for i in range(board_len):
+        if i < 4:
+            num_spaces_before = (max_width - (i + 1)) // 2
+            num_spaces_after = max_width - num_spaces_before - (i + 1)
+        elif i == 4 or i == 12:
+            num_spaces_before = 0
+            num_spaces_after = 0
+        elif 4 < i < 8:
+            num_spaces_before = (max_width - (board_len - i)) // 2
+            num_spaces_after = max_width - num_spaces_before - (board_len - i)
+        elif 8 <= i < 12:
+            num_spaces_before = (max_width - (i + 1)) // 2
+            num_spaces_after = max_width - num_spaces_before - (i + 1)
+        else:
+            num_spaces_before = (max_width - (board_len - i)) // 2
+            num_spaces_after = max_width - num_spaces_before - (board_len - i)
+        layout.append([])
+        if i % 2 != 0:
+            layout[i].append(" ")
+        for j in range(max_width):
+            if j < num_spaces_before or j >= max_width - num_spaces_after:
+                layout[i].append(" ")
+            else:
+                layout[i].append(0)
+            if j < max_width - 1:
+                layout[i].append(" ")
+    return layout
+
+
+def _build_tables() -> Tuple[Tuple[Coordinates, ...], Dict[Coordinates, Tuple[Coordinates, ...]],
+                             Dict[Coordinates, Tuple[Tuple[Coordinates, Coordinates], ...]]]:
+    """
+    This function precomputes the static geometry of the board, so move generation only does lookups.
+    :return: the game cells, the neighbors of every cell and the (jumped over, landing) pairs of every cell.
+    """
+    cells = tuple((i, j) for i, row in enumerate(star_layout()) for j, cell in enumerate(row) if cell != " ")
+    cell_set = set(cells)
+    neighbors = {}
+    jumps = {}
+    for x, y in cells:
+        around = []
+        over_and_land = []
+        for dx, dy in DIRECTIONS:
+            over = (x + dx, y + dy)
+            land = (x + 2 * dx, y + 2 * dy)
+            if over in cell_set:
+                around.append(over)
+                if land in cell_set:
+                    over_and_land.append((over, land))
+        neighbors[(x, y)] = tuple(around)
+        jumps[(x, y)] = tuple(over_and_land)
+    return cells, neighbors, jumps
+
+
+CELLS, NEIGHBORS, JUMPS = _build_tables()
+CELL_SET: FrozenSet[Coordinates] = frozenset(CELLS)
+CELL_INDEX: Dict[Coordinates, int] = {cell: index for index, cell in enumerate(CELLS)}
+
+# Zobrist keys are derived from a seeded generator, so a position has the same key in every process.
+_ZOBRIST_KEYS: Dict[Tuple[Coordinates, Tuple[int, int, int]], int] = {}
+
+
+def zobrist_key(cell: Coordinates, color: Tuple[int, int, int]) -> int:
+    """
+    This function returns the random 64-bit key of a piece of a given color in a given cell.
+    :param cell: the coordinates of the cell.
+    :param color: the color of the piece.
+    :return: the key of the (cell, color) pair.
+    """
+    key = _ZOBRIST_KEYS.get((cell, color))
+    if key is None:
+        key = random.Random(f"zobrist{cell}{color}").getrandbits(64)
+        _ZOBRIST_KEYS[(cell, color)] = key
+    return key
+
+
+def zobrist_turn_key(player_index: int) -> int:
+    """
+    This function returns the random 64-bit key of the player whose turn it is.
+    :param player_index: the index of the player in turn order.
+    :return: the key of the turn.
+    """
+    return zobrist_key((-1, player_index), (0, 0, 0))
+
+
+def cell_rect(cell: Coordinates) -> Rect:
+    """
+    :param cell: a cell of the board (row, col).
+    :return: the area of the window the cell is drawn in.
+    """
+    return Rect(cell[1] * SQUARE_SIZE, cell[0] * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+
 
 class Board:
     """
@@ -18,54 +124,49 @@ class Board:
         """
         self.__graphic_board: list[list[Union[int, Piece, str]]] = []
         self.create_board()
-        self.valid_cells = self.cell_list()
+        self.valid_cells = CELL_SET
         self.pieces: dict[Coordinates, Piece] = {}
+        # The Zobrist key of the position, the XOR of the keys of all the pieces on the board.
+        self.hash_key = 0
+        # Cached moves of the pieces on the board, and for every cell the pieces whose moves depend on it.
+        self.__moves_cache: Dict[Coordinates, FrozenSet[Coordinates]] = {}
+        self.__cells_read: Dict[Coordinates, Set[Coordinates]] = {}
+        self.__watchers: Dict[Coordinates, Set[Coordinates]] = {}
+        # The static background is rendered once, then only the cells that changed since the last drawing are drawn.
+        self.__background: Optional[Surface] = None
+        self.__drawn: Optional[Dict[Coordinates, Tuple[int, int, int]]] = None
+        self.__dirty_cells: Set[Coordinates] = set()
 
     def create_board(self) -> None:
         """
         this function creates the graphic board of the game in the shape of the star of david
         """
-        max_width = 13  # Width of the widest row
-        board_len = 17  # Number of rows
-        for i in range(board_len):
-            if i < 4:
-                num_spaces_before = (max_width - (i + 1)) // 2
-                num_spaces_after = max_width - num_spaces_before - (i + 1)
-            elif i == 4 or i == 12:
-                num_spaces_before = 0
-                num_spaces_after = 0
-            elif 4 < i < 8:
-                num_spaces_before = (max_width - (board_len - i)) // 2
-                num_spaces_after = max_width - num_spaces_before - (board_len - i)
-            elif 8 <= i < 12:
-                num_spaces_before = (max_width - (i + 1)) // 2
-                num_spaces_after = max_width - num_spaces_before - (i + 1)
-            else:
-                num_spaces_before = (max_width - (board_len - i)) // 2
-                num_spaces_after = max_width - num_spaces_before - (board_len - i)
-            self.__graphic_board.append([])
-            if i % 2 != 0:
-                self.__graphic_board[i].append(" ")
-            for j in range(max_width):
-                if j < num_spaces_before or j >= max_width - num_spaces_after:
-                    self.__graphic_board[i].append(" ")
-                else:
-                    self.__graphic_board[i].append(0)
-                if j < max_width - 1:
-                    self.__graphic_board[i].append(" ")
+        for row in star_layout():
+            self.__graphic_board.append(list[Union[int, Piece, str]](row))
+
+    def background(self, size: Tuple[int, int]) -> Surface:
+        """
+        This function returns the board without pieces, it is rendered once for every window size.
+        :param size: The size of the window.
+        :return: A surface of the given size.
+        """
+        if self.__background is None or self.__background.get_size() != size:
+            background = Surface(size)
+            background.fill(WHITE)
+            for row in range(ROWS):
+                for col in range(len(self.__graphic_board[row])):
+                    if self.__graphic_board[row][col] == " ":
+                        pygame.draw.rect(background, BLACK,
+                                         (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+            self.__background = background
+        return self.__background
 
     def draw_board(self, win: Surface) -> None:
         """
         This function draws the board on the screen.
         :param win: The window to draw the board on.
         """
-        win.fill(WHITE)
-        for row in range(ROWS):
-            for col in range(len(self.__graphic_board[row])):
-                if self.__graphic_board[row][col] == " ":
-                    pygame.draw.rect(win, BLACK, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
-                else:
-                    pygame.draw.rect(win, WHITE, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+        win.blit(self.background(win.get_size()), (0, 0))
 
     def draw(self, win: Surface) -> None:
         """
@@ -74,11 +175,48 @@ class Board:
         :return:
         """
         self.draw_board(win)
-        for row in range(ROWS):
-            for col in range(COLS):
-                piece = self.__graphic_board[row][col]
-                if piece != 0 and piece != " " and type(piece) == Piece:
-                    piece.draw(win)
+        for piece in self.pieces.values():
+            piece.draw(win)
+        self.__drawn = {loc: piece.color for loc, piece in self.pieces.items()}
+        self.__dirty_cells.clear()
+
+    def invalidate_drawing(self) -> None:
+        """
+        This function makes the next draw_changes draw the whole board, e.g. after the window was covered.
+        """
+        self.__drawn = None
+
+    def mark_dirty(self, cells: Iterable[Coordinates]) -> None:
+        """
+        This function makes the next draw_changes redraw some cells, e.g. cells that were highlighted.
+        :param cells: The cells to redraw.
+        """
+        self.__dirty_cells.update(cells)
+
+    def draw_changes(self, win: Surface) -> Optional[List[Coordinates]]:
+        """
+        This function redraws only the cells whose content changed since the board was last drawn,
+        and the cells marked with mark_dirty.
+        :param win: the window to draw the board on.
+        :return: The redrawn cells, None if the whole board was drawn because it wasn't drawn before.
+        """
+        if self.__drawn is None:
+            self.draw(win)
+            return None
+        drawn = self.__drawn
+        current = {loc: piece.color for loc, piece in self.pieces.items()}
+        cells = self.__dirty_cells
+        cells.update(loc for loc in drawn.keys() | current.keys() if drawn.get(loc) != current.get(loc))
+        background = self.background(win.get_size())
+        for cell in cells:
+            rect = cell_rect(cell)
+            win.blit(background, rect, rect)
+            piece = self.pieces.get(cell)
+            if piece is not None:
+                piece.draw(win)
+        self.__drawn = current
+        self.__dirty_cells = set()
+        return list(cells)
 
     def __str__(self) -> str:
         """
@@ -101,25 +239,16 @@ class Board:
         :param coordinates: tuple of (row, col) of the coordinates to check.
         :return: The name of the piece in "coordinates", 0 if it's empty, None if the cell is not in the game.
         """
-        if coordinates[0] < 0 or coordinates[0] >= len(self.__graphic_board) or coordinates[1] < 0 or coordinates[
-            1] >= len(self.__graphic_board[0]):
-            return
-        if self.__graphic_board[coordinates[0]][coordinates[1]] == " ":
+        if coordinates not in CELL_SET:
             return
-        else:
-            return self.__graphic_board[coordinates[0]][coordinates[1]]
+        return self.__graphic_board[coordinates[0]][coordinates[1]]
 
     def cell_list(self) -> List[Coordinates]:
         """
         This function returns the coordinates of game cells in this board.
         :return: list of coordinates.
         """
-        cell_l = []
-        for i, row in enumerate(self.__graphic_board):
-            for j in range(len(row)):
-                if self.cell_content((i, j)) is not None:
-                    cell_l.append((i, j))
-        return cell_l
+        return list(CELLS)
 
     def add_piece(self, piece: Piece) -> bool:
         """
@@ -128,10 +257,12 @@ class Board:
     #     :return: True upon success, False if failed.
     #     """
         if piece.get_location() not in self.pieces.keys():
-            if piece.get_location() in self.valid_cells:
+            if piece.get_location() in CELL_SET:
                 if self.cell_content(piece.get_location()) == 0:
                     self.__graphic_board[piece.get_location()[0]][piece.get_location()[1]] = piece
                     self.pieces[piece.get_location()] = piece
+                    self.hash_key ^= zobrist_key(piece.get_location(), piece.color)
+                    self.__invalidate(piece.get_location())
                     return True
         return False
 
@@ -141,17 +272,7 @@ class Board:
         :param location:
         :return: set of coordinates.
         """
-        x = location[0]
-        y = location[1]
-        around: Set[Coordinates] = set()
-        all_cells = self.valid_cells
-        if (x, y) not in all_cells:
-            return around
-        surrounding = {(x - 1, y - 1), (x - 1, y + 1), (x, y - 2), (x, y + 2), (x + 1, y - 1), (x + 1, y + 1)}
-        for cord in surrounding:
-            if cord in all_cells:
-                around.add(cord)
-        return around
+        return set(NEIGHBORS.get(location, ()))
 
     def optional_moves(self, piece: Union[Piece,None]) -> Set[Coordinates]:
         """
@@ -161,28 +282,91 @@ class Board:
         """
         moves: Set[Coordinates] = set()
         if piece != None:
-            x = piece.get_location()[0]
-            y = piece.get_location()[1]
-            around = self.get_around((x, y))
-
-            filled = set()
-            if around == set():
+            location = piece.get_location()
+            if location not in NEIGHBORS:
                 return moves
-            for cord in around:
-                if self.cell_content(cord) == 0:
-                    moves.add(cord)
-                else:
-                    filled.add(cord)
-            if len(list(moves)) == 6:
-                return moves
-            else:
-                for cord in filled:
-                    a = cord[0] + (cord[0] - x)
-                    b = cord[1] + (cord[1] - y)
-                    prev = cord
-                    moves.update(self.hops((a, b), prev))
+            if self.pieces.get(location) is piece:
+                return set(self.__cached_moves(location))
+            moves = self.__reachable(location)[0]
         return moves
 
+    def legal_moves(self, player: Player) -> List[Tuple[Coordinates, Coordinates]]:
+        """
+        This function returns all the moves of a player's pieces.
+        The moves of every piece are cached, and a move only recomputes the pieces whose moves it could change.
+        :param player: the player to move.
+        :return: list of (piece location, destination) pairs.
+        """
+        moves = []
+        for location in player.get_pieces():
+            if location in self.pieces:
+                for destination in self.__cached_moves(location):
+                    moves.append((location, destination))
+        return moves
+
+    def __cached_moves(self, location: Coordinates) -> FrozenSet[Coordinates]:
+        """
+        This function returns the moves of the piece in a location, and computes them if they are not cached.
+        :param location: the location of a piece on the board.
+        :return: set of coordinates.
+        """
+        moves = self.__moves_cache.get(location)
+        if moves is None:
+            found, cells_read = self.__reachable(location)
+            moves = frozenset(found)
+            self.__moves_cache[location] = moves
+            self.__cells_read[location] = cells_read
+            for cell in cells_read:
+                self.__watchers.setdefault(cell, set()).add(location)
+        return moves
+
+    def __reachable(self, location: Coordinates) -> Tuple[Set[Coordinates], Set[Coordinates]]:
+        """
+        This function searches the steps and the chained hops from a location.
+        :param location: the location of the piece.
+        :return: the reachable cells, and the cells whose content the search depended on.
+        """
+        pieces = self.pieces
+        cells_read = set(NEIGHBORS[location])
+        moves = {cord for cord in cells_read if cord not in pieces}
+        if len(moves) == 6:
+            return moves, cells_read
+        visited: Set[Coordinates] = set()
+        stack: List[Tuple[Coordinates, Optional[Coordinates]]] = [(location, None)]
+        while stack:
+            cur, prev = stack.pop()
+            if prev is not None:
+                moves.add(cur)
+            for over, land in JUMPS[cur]:
+                cells_read.add(over)
+                if over != prev and over in pieces:
+                    cells_read.add(land)
+                    if land not in pieces and land not in visited:
+                        visited.add(land)
+                        stack.append((land, over))
+        return moves, cells_read
+
+    def __invalidate(self, *cells: Coordinates) -> None:
+        """
+        This function drops the cached moves that depend on the content of the given cells.
+        :param cells: cells whose content changed.
+        """
+        for cell in cells:
+            for location in self.__watchers.pop(cell, ()):
+                self.__forget(location)
+            self.__forget(cell)
+
+    def __forget(self, location: Coordinates) -> None:
+        """
+        This function drops the cached moves of the piece in a location.
+        :param location: the location of the piece.
+        """
+        if self.__moves_cache.pop(location, None) is not None:
+            for cell in self.__cells_read.pop(location):
+                watchers = self.__watchers.get(cell)
+                if watchers is not None:
+                    watchers.discard(location)
+
     def hops(self, cord: Coordinates, prev: Coordinates, visited: Union[Set[Coordinates],None] = None) -> Set[Coordinates]:
         """
         This function returns the possible hops from a given location.
@@ -194,22 +378,18 @@ class Board:
         if visited is None:
             visited = set()
         moves: Set[Coordinates] = set()
-        a = cord[0]
-        b = cord[1]
-        if self.cell_content((a, b)) != 0 or (a, b) in visited:
+        pieces = self.pieces
+        if cord not in JUMPS or cord in pieces or cord in visited:
             return moves
-        else:
-            visited.add((a, b))
-            moves.add((a, b))
-            around = self.get_around((a, b))
-            if prev in around:
-                around.remove(prev)
-            for c in around:
-                if self.cell_content(c) != 0:
-                    x = c[0] + (c[0] - a)
-                    y = c[1] + (c[1] - b)
-                    prev = c
-                    moves.update(self.hops((x, y), prev, visited))
+        visited.add(cord)
+        stack = [(cord, prev)]
+        while stack:
+            cur, prev = stack.pop()
+            moves.add(cur)
+            for over, land in JUMPS[cur]:
+                if over != prev and over in pieces and land not in pieces and land not in visited:
+                    visited.add(land)
+                    stack.append((land, over))
         return moves
 
     def get_all_pieces_locations(self) -> List[Coordinates]:
@@ -225,7 +405,7 @@ class Board:
         :param location: the location of the piece.
         :return: piece object.
         """
-        if location in self.cell_list():
+        if location in CELL_SET:
             return self.__graphic_board[location[0]][location[1]]
 
     def move_piece(self, piece_loc: Coordinates, destination: Coordinates) -> bool:
@@ -235,24 +415,38 @@ class Board:
         :param destination: the destination location.
         :return: True upon success, False if failed.
         """
-        # print(piece_loc, destination)
-        if piece_loc in self.get_all_pieces_locations() and piece_loc in self.pieces:
-            piece = self.pieces[piece_loc]
-            if destination in self.optional_moves(piece):
-                current_loc = piece.get_location()
-                if current_loc is not None and destination is not None:
-                    # move the piece in the graphic board
-                    self.__graphic_board[current_loc[0]][current_loc[1]] = 0
-                    self.__graphic_board[destination[0]][destination[1]] = piece
-                    # change the location of the piece in the piece object
-                    piece.move(destination)
-                    # change the location of the piece in the pieces dictionary
-                    self.pieces.pop(piece_loc)
-                    self.pieces[destination] = piece
-
-                    return True
+        if piece_loc in self.pieces and destination is not None:
+            if destination in self.optional_moves(self.pieces[piece_loc]):
+                self.apply_move(piece_loc, destination)
+                return True
         return False
 
+    def apply_move(self, piece_loc: Coordinates, destination: Coordinates) -> Piece:
+        """
+        This function moves a piece without checking that the move is legal.
+        Use it only for moves that were already validated, e.g. by optional_moves, a log or a search.
+        :param piece_loc: the location of the piece to move.
+        :param destination: the destination location, must be an empty cell.
+        :return: the moved piece.
+        """
+        piece = self.pieces.pop(piece_loc)
+        self.__graphic_board[piece_loc[0]][piece_loc[1]] = 0
+        self.__graphic_board[destination[0]][destination[1]] = piece
+        piece.move(destination)
+        self.pieces[destination] = piece
+        self.hash_key ^= zobrist_key(piece_loc, piece.color) ^ zobrist_key(destination, piece.color)
+        self.__invalidate(piece_loc, destination)
+        return piece
+
+    def undo_move(self, piece_loc: Coordinates, destination: Coordinates) -> Piece:
+        """
+        This function takes back a move that was made with apply_move.
+        :param piece_loc: the location the piece moved from.
+        :param destination: the location the piece moved to.
+        :return: the moved piece.
+        """
+        return self.apply_move(destination, piece_loc)
+
     def get_graphic_board(self) -> List[List[str]]:
         """
         This function returns the graphic board of the game.
@@ -9,6 +9,11 @@ COLS = 25
 
 SQUARE_SIZE = WIDTH // COLS
 
+# The main loop plays a computer turn every COMPUTER_TICK_MS, and otherwise sleeps until an event comes,
+# waking up at least every IDLE_TIMEOUT_MS
+COMPUTER_TICK_MS = 300
+IDLE_TIMEOUT_MS = 1000
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
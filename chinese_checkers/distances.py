@@ -0,0 +1,90 @@
+from typing import Tuple, Dict, FrozenSet, Iterable, NamedTuple, Optional
+from .board import CELLS, CELL_INDEX, NEIGHBORS, JUMPS
+from .player import Player
+
+Coordinates = Tuple[int, int]
+
+BOARD_CENTER = (8, 12)
+
+
+class DistanceTables(NamedTuple):
+    """
+    How far every cell is from a target triangle, every table is indexed by the cell indices of Board.cell_list().
+    """
+    apex: Coordinates
+    # The step distance to the far corner of the target
+    to_apex: Tuple[int, ...]
+    # The fewest steps to any cell of the target
+    steps: Tuple[int, ...]
+    # The fewest hops to any cell of the target, a hop is a step or a single jump,
+    # as if there was always a piece to jump over
+    hops: Tuple[int, ...]
+
+
+_TABLES: Dict[FrozenSet[Coordinates], DistanceTables] = {}
+
+
+def hex_distance(a: Coordinates, b: Coordinates) -> int:
+    """
+    This function returns the number of steps between two cells of the board.
+    :param a: the first cell (row, col).
+    :param b: the second cell (row, col).
+    :return: the step distance.
+    """
+    d_row = abs(a[0] - b[0])
+    d_col = abs(a[1] - b[1])
+    return d_row + max(0, (d_col - d_row) // 2)
+
+
+def target_apex(player: Player) -> Optional[Coordinates]:
+    """
+    This function returns the far corner of a player's target triangle.
+    :param player: the player.
+    :return: the target cell farthest from the center of the board, None if the player has no targets.
+    """
+    targets = player.get_target_locs()
+    if not targets:
+        return None
+    return max(targets, key=lambda loc: hex_distance(loc, BOARD_CENTER))
+
+
+def distance_tables(targets: Iterable[Coordinates]) -> DistanceTables:
+    """
+    This function returns the distance tables of a target triangle, they are computed once for every target.
+    :param targets: the cells of the target, at least one.
+    :return: a DistanceTables object.
+    """
+    key = frozenset(targets)
+    tables = _TABLES.get(key)
+    if tables is None:
+        apex = max(key, key=lambda loc: hex_distance(loc, BOARD_CENTER))
+        hop_cells = {cell: NEIGHBORS[cell] + tuple(land for _, land in JUMPS[cell]) for cell in CELLS}
+        tables = DistanceTables(apex, tuple(hex_distance(cell, apex) for cell in CELLS),
+                                _breadth_first(key, NEIGHBORS), _breadth_first(key, hop_cells))
+        _TABLES[key] = tables
+    return tables
+
+
+def _breadth_first(targets: FrozenSet[Coordinates], next_cells: Dict[Coordinates, Tuple[Coordinates, ...]]) \
+        -> Tuple[int, ...]:
+    """
+    This function finds the fewest moves from every cell to a set of cells.
+    :param targets: the cells to reach.
+    :param next_cells: the cells a single move leads to from every cell, moves must be reversible.
+    :return: the distance of every cell, by cell index.
+    """
+    distances = [-1] * len(CELLS)
+    frontier = list(targets)
+    for cell in frontier:
+        distances[CELL_INDEX[cell]] = 0
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for cell in frontier:
+            for next_cell in next_cells[cell]:
+                if distances[CELL_INDEX[next_cell]] < 0:
+                    distances[CELL_INDEX[next_cell]] = depth
+                    next_frontier.append(next_cell)
+        frontier = next_frontier
+    return tuple(distances)
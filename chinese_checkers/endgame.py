@@ -0,0 +1,260 @@
+import os
+import tempfile
+import time
+import argparse
+from math import comb
+from typing import Tuple, Dict, Optional, Iterable, Sequence
+from .board import Board, CELLS, CELL_INDEX
+from .bitboard import destinations, indices_of, mask_of
+from .player import Player
+
+Coordinates = Tuple[int, int]
+Move = Tuple[Coordinates, Coordinates]
+
+NUM_OF_PIECES = 10
+UNKNOWN = 255
+DEFAULT_DIRECTORY = "endgame_tables"
+# A table file starts with _MAGIC, the largest number of pieces outside the target it covers
+# and the cell indices of the target, then the distance of every position as a byte
+_MAGIC = b"CCEG"
+# _COMB[n][k] is the number of ways to choose k of n, for the ranks of the positions
+_COMB = [[comb(n, k) for k in range(NUM_OF_PIECES + 1)] for n in range(len(CELLS) + 1)]
+
+
+class EndgameTable:
+    """
+    A table of the exact solitaire distances of a player's pieces to a target triangle:
+    the fewest moves that fill the target when no other pieces are on the board.
+    It covers every position with up to max_outside pieces outside the target,
+    and only moves through such positions.
+    """
+
+    def __init__(self, targets: Iterable[Coordinates], max_outside: int = 2,
+                 distances: Optional[bytes] = None) -> None:
+        """
+        A constructor for an EndgameTable object.
+        :param targets: The 10 cells of the target triangle.
+        :param max_outside: The largest number of pieces outside the target the table covers.
+        :param distances: The distances of a saved table, the table is computed if not given.
+        """
+        self.targets = sorted(CELL_INDEX[cell] for cell in targets)
+        self.max_outside = max_outside
+        self.target_mask = mask_of(CELLS[index] for index in self.targets)
+        self.__others = [index for index in range(len(CELLS)) if not self.target_mask >> index & 1]
+        self.__target_rank = {index: rank for rank, index in enumerate(self.targets)}
+        self.__other_rank = {index: rank for rank, index in enumerate(self.__others)}
+        # The positions with k pieces outside the target start at self.__offsets[k]
+        self.__offsets = [0]
+        for k in range(max_outside + 1):
+            self.__offsets.append(self.__offsets[-1] + comb(NUM_OF_PIECES, k) * comb(len(self.__others), k))
+        if distances is None:
+            self.distances = self.__compute()
+        elif len(distances) != self.__offsets[-1]:
+            raise ValueError("The distances don't match the size of the table")
+        else:
+            self.distances = distances
+
+    def __len__(self) -> int:
+        """
+        :return: The number of positions in the table.
+        """
+        return self.__offsets[-1]
+
+    def rank(self, mask: int) -> int:
+        """
+        This function returns the place of a position in the table.
+        The empty target cells and the cells outside the target are ranked as combinations.
+        :param mask: The cells of the 10 pieces.
+        :return: The index of the position, -1 if the table doesn't cover it.
+        """
+        outside_rank = 0
+        k = 0
+        for index in indices_of(mask & ~self.target_mask):
+            k += 1
+            if k > self.max_outside:
+                return -1
+            outside_rank += _COMB[self.__other_rank[index]][k]
+        hole_rank = 0
+        i = 0
+        for index in indices_of(self.target_mask & ~mask):
+            i += 1
+            hole_rank += _COMB[self.__target_rank[index]][i]
+        return self.__offsets[k] + hole_rank * _COMB[len(self.__others)][k] + outside_rank
+
+    def distance(self, cells: Iterable[Coordinates]) -> Optional[int]:
+        """
+        :param cells: The cells of the player's 10 pieces.
+        :return: The solitaire distance to the target, None if the table doesn't cover the position.
+        """
+        index = self.rank(mask_of(cells))
+        if index < 0 or self.distances[index] == UNKNOWN:
+            return None
+        return self.distances[index]
+
+    def __compute(self) -> bytes:
+        """
+        This function computes the distances with a breadth first search from the filled target.
+        Moves can be played backwards, so the search goes forward from the goal.
+        :return: A distance for every position, UNKNOWN for the unreachable ones.
+        """
+        target_mask = self.target_mask
+        distances = bytearray([UNKNOWN]) * len(self)
+        distances[self.rank(self.target_mask)] = 0
+        frontier = [self.target_mask]
+        depth = 0
+        while frontier and depth < UNKNOWN - 1:
+            depth += 1
+            next_frontier = []
+            for mask in frontier:
+                outside = bin(mask & ~target_mask).count("1")
+                for src in indices_of(mask):
+                    without = mask ^ (1 << src)
+                    reachable = destinations(src, mask)
+                    if outside == self.max_outside and target_mask >> src & 1:
+                        reachable &= target_mask  # Leaving the target would take the position out of the table
+                    for dst in indices_of(reachable):
+                        child = without | (1 << dst)
+                        index = self.rank(child)
+                        if distances[index] == UNKNOWN:
+                            distances[index] = depth
+                            next_frontier.append(child)
+            frontier = next_frontier
+        return bytes(distances)
+
+
+class Tablebase:
+    """
+    A class that gives the endgame table of every target triangle.
+    The tables are read from files in a directory the first time they are needed,
+    and computed and saved there if they are missing.
+    """
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, max_outside: int = 2, build: bool = True) -> None:
+        """
+        A constructor for a Tablebase object.
+        :param directory: The directory of the table files.
+        :param max_outside: The largest number of pieces outside the target the tables cover.
+        :param build: If False, targets without a saved table have no table instead of computing it.
+        """
+        self.directory = directory
+        self.max_outside = max_outside
+        self.build = build
+        self.__tables: Dict[Tuple[int, ...], Optional[EndgameTable]] = {}
+
+    def file_name(self, targets: Sequence[int]) -> str:
+        """
+        :param targets: The sorted cell indices of a target triangle.
+        :return: The name of the file of its table.
+        """
+        return os.path.join(self.directory, f"endgame_{targets[0]}_{self.max_outside}.bin")
+
+    def get_table(self, targets: Iterable[Coordinates]) -> Optional[EndgameTable]:
+        """
+        :param targets: The 10 cells of a target triangle.
+        :return: The table of the target, None if it has no saved table and build is False.
+        """
+        key = tuple(sorted(CELL_INDEX[cell] for cell in targets))
+        if key not in self.__tables:
+            self.__tables[key] = self.__load(key)
+        return self.__tables[key]
+
+    def __load(self, targets: Tuple[int, ...]) -> Optional[EndgameTable]:
+        """
+        This function reads the table of a target from its file, or computes and saves it.
+        :param targets: The sorted cell indices of the target triangle.
+        :return: The table, None if it has no file and build is False.
+        """
+        file_name = self.file_name(targets)
+        cells = [CELLS[index] for index in targets]
+        header = _MAGIC + bytes((self.max_outside,)) + bytes(targets)
+        if os.path.isfile(file_name):
+            with open(file_name, "rb") as file:
+                data = file.read()
+            if data.startswith(header):
+                try:
+                    return EndgameTable(cells, self.max_outside, data[len(header):])
+                except ValueError:
+                    pass  # A file of the wrong size is treated as missing and built again
+        if not self.build:
+            return None
+        table = EndgameTable(cells, self.max_outside)
+        os.makedirs(self.directory, exist_ok=True)
+        # The table is written to a temporary file that replaces the old one at once,
+        # so processes that build the same table together never read a half written file
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, prefix=os.path.basename(file_name), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(header + table.distances)
+            os.replace(temp_name, file_name)
+        except BaseException:
+            os.remove(temp_name)
+            raise
+        return table
+
+    def distance(self, player: Player) -> Optional[int]:
+        """
+        :param player: A player.
+        :return: The solitaire distance of the player's pieces to its target, None if no table covers it.
+        """
+        targets = player.get_target_locs()
+        if len(targets) != NUM_OF_PIECES or len(player.get_pieces()) != NUM_OF_PIECES:
+            return None
+        table = self.get_table(targets)
+        return table.distance(player.get_pieces()) if table is not None else None
+
+    def choose_move(self, board: Board, player: Player) -> Optional[Move]:
+        """
+        This function picks the legal move that brings the player's pieces closest to filling the target.
+        :param board: The board of the game.
+        :param player: The player to move.
+        :return: A (piece location, destination) pair, None if no table covers the position,
+        a target cell holds another player's piece or no move gets closer.
+        """
+        targets = player.get_target_locs()
+        if len(targets) != NUM_OF_PIECES or len(player.get_pieces()) != NUM_OF_PIECES:
+            return None
+        if any(loc in board.pieces and loc not in player.get_pieces() for loc in targets):
+            return None
+        # Only count the pieces outside the target before loading the table, most positions are not endgames
+        if sum(loc not in targets for loc in player.get_pieces()) > self.max_outside:
+            return None
+        table = self.get_table(targets)
+        if table is None:
+            return None
+        mask = mask_of(player.get_pieces())
+        best_index = table.rank(mask)
+        if best_index < 0 or table.distances[best_index] == UNKNOWN:
+            return None
+        best_distance = table.distances[best_index]
+        best_move = None
+        for piece_loc, destination in board.legal_moves(player):
+            index = table.rank(mask ^ (1 << CELL_INDEX[piece_loc]) ^ (1 << CELL_INDEX[destination]))
+            if index >= 0 and table.distances[index] < best_distance:
+                best_distance = table.distances[index]
+                best_move = (piece_loc, destination)
+        return best_move
+
+
+def main() -> None:
+    """
+    Computes and saves the endgame tables of all the target triangles from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Compute the endgame tables of all the target triangles.")
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY, help="the directory to save the tables in")
+    parser.add_argument("--max-outside", type=int, default=2, help="pieces outside the target the tables cover")
+    args = parser.parse_args()
+
+    from .game_state import GameState, GameConfig
+    tablebase = Tablebase(args.directory, args.max_outside)
+    for name, player in GameState(GameConfig(6)).get_players().items():
+        if player is None:
+            parser.error(f"The player {name} of the 6 player game is missing")
+        start = time.perf_counter()
+        table = tablebase.get_table(player.get_target_locs())
+        if table is None:
+            parser.error(f"The table for the target of {name} could not be built in {args.directory}")
+        print(f"{len(table)} positions for the target of {player.get_name()} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import os
+import time
+import bisect
+import datetime
+from typing import IO, List, Optional, Tuple, Iterator
+
+Coordinates = Tuple[int, int]
+
+# What is done to the log file when a game ends
+DURABILITY_NONE = "none"
+DURABILITY_FLUSH = "flush"
+DURABILITY_FSYNC = "fsync"
+DURABILITY_LEVELS = (DURABILITY_NONE, DURABILITY_FLUSH, DURABILITY_FSYNC)
+
+# A snapshot line holds the positions of all the pieces, so a replay can start from it
+SNAPSHOT = "Snapshot"
+# A pass line is written when a player has no legal move, so a replay gives the turn to the player after it
+PASS = "Pass"
+
+
+def parse_coordinates(text: str) -> Coordinates:
+    """
+    This function parses coordinates the way they are written in the log file, e.g. "(3, 9)".
+    :param text: The text of the coordinates.
+    :return: A tuple of (row, col).
+    """
+    row, col = text.strip()[1:-1].split(",")
+    return int(row), int(col)
+
+
+def read_log_lines(file_name: str, offset: int = 0) -> Iterator[Tuple[int, str]]:
+    """
+    This function reads the lines of a log file one by one, from a byte offset.
+    :param file_name: The name of the log file.
+    :param offset: The byte offset of the first line to read.
+    :return: An iterator of (byte offset, line) pairs, every line ends with a newline.
+    """
+    with open(file_name, "rb") as file:
+        file.seek(offset)
+        for raw_line in file:
+            yield offset, raw_line.decode("utf-8").rstrip("\r\n") + "\n"
+            offset += len(raw_line)
+
+
+def find_last_snapshot(file_name: str, block_size: int = 1 << 16) -> Optional[int]:
+    """
+    This function finds the last snapshot line of a log file, it reads the file backwards from its end.
+    :param file_name: The name of the log file.
+    :param block_size: The number of bytes read at a time.
+    :return: The byte offset of the line, None if the log has no snapshots.
+    """
+    marker = f"+{SNAPSHOT}".encode("utf-8")
+    with open(file_name, "rb") as file:
+        start = file.seek(0, os.SEEK_END)
+        # The first line of the bytes read so far, with its newline: it may start in the block before them,
+        # the lines after it were already searched
+        carry = b""
+        while start > 0:
+            read_from = max(0, start - block_size)
+            file.seek(read_from)
+            data = file.read(start - read_from) + carry
+            start = read_from
+            position = len(data)
+            while True:
+                position = data.rfind(marker, 0, position)
+                if position < 0:
+                    break
+                end = position + len(marker)
+                if data[end:end + 1] in (b"\n", b"\r"):
+                    line_start = data.rfind(b"\n", 0, position) + 1
+                    if line_start > 0 or start == 0:
+                        return start + line_start
+                    break  # The start of the line is in the next block
+            carry = data[:data.find(b"\n") + 1] or data
+        return None
+
+
+class LogIndex:
+    """
+    A class that indexes the byte offsets of the turns and the snapshots of a log file,
+    so any ply of the game can be reached from the snapshot before it.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """
+        A constructor for a LogIndex object, it reads the log file once.
+        :param file_name: The name of the log file.
+        """
+        self.file_name = file_name
+        self.turn_offsets: List[int] = []
+        self.snapshot_plies: List[int] = []
+        self.snapshot_offsets: List[int] = []
+        ply = 0
+        for offset, line in read_log_lines(file_name):
+            if line.endswith("Turn\n"):
+                if ply < len(self.turn_offsets):
+                    self.turn_offsets[ply] = offset
+                else:
+                    self.turn_offsets.append(offset)
+                ply += 1
+            elif line.endswith(f"{SNAPSHOT}\n"):
+                ply = int(line.split("+")[2])
+                self.snapshot_plies.append(ply)
+                self.snapshot_offsets.append(offset)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of turns in the log.
+        """
+        return len(self.turn_offsets)
+
+    def snapshot_before(self, ply: int) -> int:
+        """
+        :param ply: A number of played turns.
+        :return: The byte offset of the last snapshot taken at or before the ply, 0 if there is none.
+        """
+        i = bisect.bisect_right(self.snapshot_plies, ply) - 1
+        return self.snapshot_offsets[i] if i >= 0 else 0
+
+    def read_turn(self, ply: int) -> str:
+        """
+        :param ply: The number of turns played before the turn.
+        :return: The line of the turn in the log file.
+        """
+        return next(read_log_lines(self.file_name, self.turn_offsets[ply]))[1]
+
+
+class GameLogWriter:
+    """
+    A class that writes the log of a game through a single open file, and batches the lines it writes.
+    """
+
+    def __init__(self, file_name: str, mode: str = "a", flush_every: int = 64, flush_interval: float = 1.0,
+                 durability: str = DURABILITY_FLUSH) -> None:
+        """
+        A constructor for a GameLogWriter object.
+        :param file_name: The name of the log file.
+        :param mode: "w" to start a new log file, "a" to append to an existing one.
+        :param flush_every: The number of buffered lines that triggers a write to the file.
+        :param flush_interval: The number of seconds after which buffered lines are written to the file.
+        :param durability: What to do when the game ends: "none" keeps buffering, "flush" writes the
+        buffered lines to the operating system and "fsync" also waits until they are on the disk.
+        """
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Invalid durability: {durability}")
+        self.file_name = file_name
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self.__file: Optional[IO[str]] = open(file_name, mode)
+        self.__buffer: List[str] = []
+        self.__last_flush = time.monotonic()
+        self.__second = -1
+        self.__timestamp = ""
+
+    def timestamp(self) -> str:
+        """
+        :return: The current time as "%Y-%m-%d %H:%M:%S", it is formatted once per second.
+        """
+        second = int(time.time())
+        if second != self.__second:
+            self.__second = second
+            self.__timestamp = datetime.datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        return self.__timestamp
+
+    def write(self, line: str) -> None:
+        """
+        This function adds a line to the log, it is written to the file on the next flush.
+        :param line: The line to write, with its newline.
+        """
+        if self.__file is None:
+            raise ValueError(f"The log file {self.file_name} is closed")
+        self.__buffer.append(line)
+        if len(self.__buffer) >= self.flush_every:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush_if_due(self) -> Optional[float]:
+        """
+        This function writes the buffered lines if flush_interval seconds passed since the last flush.
+        It is called on the ticks of the game loops, so the last lines of a burst don't wait for the next line.
+        :return: The number of seconds until the buffered lines are due, None if no line is buffered.
+        """
+        if not self.__buffer:
+            return None
+        due_in = self.__last_flush + self.flush_interval - time.monotonic()
+        if due_in <= 0:
+            self.flush()
+            return None
+        return due_in
+
+    def flush(self) -> None:
+        """
+        This function writes the buffered lines to the file.
+        """
+        if self.__file is None:
+            return
+        if self.__buffer:
+            self.__file.write("".join(self.__buffer))
+            self.__buffer = []
+        self.__file.flush()
+        self.__last_flush = time.monotonic()
+
+    def end_game(self) -> None:
+        """
+        This function makes the log durable as configured, it is called when a game ends or is quit.
+        """
+        if self.durability == DURABILITY_NONE or self.__file is None:
+            return
+        self.flush()
+        if self.durability == DURABILITY_FSYNC:
+            os.fsync(self.__file.fileno())
+
+    def close(self) -> None:
+        """
+        This function writes the buffered lines and closes the file.
+        """
+        if self.__file is not None:
+            self.flush()
+            self.__file.close()
+            self.__file = None
+
+    def is_closed(self) -> bool:
+        """
+        :return: True if the log file was closed.
+        """
+        return self.__file is None
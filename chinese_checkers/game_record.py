@@ -0,0 +1,310 @@
+import struct
+import time
+import datetime
+from typing import Tuple, List, Optional, Union, BinaryIO
+from .board import CELLS, CELL_INDEX
+from .game_state import GameState
+from .game_log import PASS, parse_coordinates
+
+Coordinates = Tuple[int, int]
+Color = Tuple[int, int, int]
+PlayerInfo = Tuple[str, Color, bool]
+
+# A record starts with MAGIC, a version byte, the start time (uint32) and the numbers of players and computers,
+# then every player as (name length, name in utf-8, r, g, b, is computer).
+# Every move follows as 2 bytes: the indices of its cells in Board.cell_list().
+# MARKER followed by an index into END_MESSAGES records the end or the quitting of the game.
+MAGIC = b"CCGR"
+VERSION = 1
+MARKER = 0xFF
+END_MESSAGES = ("Game Over", "Quit Game")
+_HEADER = struct.Struct("<4sBIBB")
+
+
+class RecordedGame:
+    """
+    A class representing a game read from or written to a binary game record.
+    """
+
+    def __init__(self, players: List[PlayerInfo], moves: Optional[List[Tuple[int, int]]] = None,
+                 messages: Optional[List[Tuple[int, str]]] = None, start_time: Optional[int] = None) -> None:
+        """
+        A constructor for a RecordedGame object.
+        :param players: A (name, color, is computer) tuple for every player, in turn order.
+        :param moves: The moves of the game as (from cell index, to cell index) pairs.
+        :param messages: The end messages of the game, as (number of moves before it, message) pairs.
+        :param start_time: The time the game started, in seconds since the epoch.
+        """
+        self.players = players
+        self.moves = moves if moves is not None else []
+        self.messages = messages if messages is not None else []
+        self.start_time = int(time.time()) if start_time is None else start_time
+
+    def get_num_of_computers(self) -> int:
+        """
+        :return: The number of computer players.
+        """
+        return sum(is_computer for _, _, is_computer in self.players)
+
+    def get_cell_moves(self) -> List[Tuple[Coordinates, Coordinates]]:
+        """
+        :return: The moves of the game as (piece location, destination) pairs.
+        """
+        return [(CELLS[src], CELLS[dst]) for src, dst in self.moves]
+
+
+def encode_header(game: RecordedGame) -> bytes:
+    """
+    This function encodes the settings and the players of a game.
+    :param game: The game.
+    :return: The header of the record.
+    """
+    data = bytearray(_HEADER.pack(MAGIC, VERSION, game.start_time, len(game.players), game.get_num_of_computers()))
+    for name, color, is_computer in game.players:
+        encoded_name = name.encode("utf-8")
+        if len(encoded_name) > 255:
+            raise ValueError(f"The name of {name!r} is longer than 255 bytes in utf-8")
+        data.append(len(encoded_name))
+        data += encoded_name
+        data += bytes(color)
+        data.append(int(is_computer))
+    return bytes(data)
+
+
+def encode_game(game: RecordedGame) -> bytes:
+    """
+    This function encodes a whole game as a binary record.
+    :param game: The game.
+    :return: The record.
+    """
+    data = bytearray(encode_header(game))
+    messages = sorted(game.messages)
+    next_message = 0
+    for ply, (src, dst) in enumerate(game.moves):
+        while next_message < len(messages) and messages[next_message][0] <= ply:
+            data += bytes((MARKER, END_MESSAGES.index(messages[next_message][1])))
+            next_message += 1
+        data += bytes((src, dst))
+    for _, message in messages[next_message:]:
+        data += bytes((MARKER, END_MESSAGES.index(message)))
+    return bytes(data)
+
+
+def decode_game(data: Union[bytes, memoryview]) -> RecordedGame:
+    """
+    This function decodes a binary record.
+    :param data: The record, e.g. the content of a record file or a slice of an archive.
+    :return: A RecordedGame object.
+    """
+    start_time, players, offset = _decode_header(data)
+    body = bytes(data[offset:])
+    moves: List[Tuple[int, int]] = []
+    messages: List[Tuple[int, str]] = []
+    for i in range(0, len(body) - 1, 2):
+        if body[i] == MARKER:
+            messages.append((len(moves), END_MESSAGES[body[i + 1]]))
+        else:
+            moves.append((body[i], body[i + 1]))
+    return RecordedGame(players, moves, messages, start_time)
+
+
+def decode_moves(data: Union[bytes, memoryview]) -> List[Tuple[int, int]]:
+    """
+    This function decodes only the moves of a binary record, it is faster than decode_game.
+    :param data: The record.
+    :return: The moves as (from cell index, to cell index) pairs.
+    """
+    offset = _skip_header(data)
+    body = bytes(data[offset:])
+    end = len(body) - len(body) % 2
+    while end >= 2 and body[end - 2] == MARKER:
+        end -= 2  # The end messages are usually after the last move
+    sources = body[0:end:2]
+    if MARKER not in sources:
+        return list(zip(sources, body[1:end:2]))
+    return [(body[i], body[i + 1]) for i in range(0, end, 2) if body[i] != MARKER]
+
+
+def _check_header(data: Union[bytes, memoryview]) -> Tuple[int, int]:
+    """
+    :param data: The record.
+    :return: The start time and the number of players of the game.
+    """
+    magic, version, start_time, num_of_players, _ = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a game record")
+    return start_time, num_of_players
+
+
+def _decode_header(data: Union[bytes, memoryview]) -> Tuple[int, List[PlayerInfo], int]:
+    """
+    :param data: The record.
+    :return: The start time, the players and the offset of the first move.
+    """
+    start_time, num_of_players = _check_header(data)
+    offset = _HEADER.size
+    players = []
+    for _ in range(num_of_players):
+        name_length = data[offset]
+        name = bytes(data[offset + 1:offset + 1 + name_length]).decode("utf-8")
+        offset += 1 + name_length
+        color = (data[offset], data[offset + 1], data[offset + 2])
+        players.append((name, color, bool(data[offset + 3])))
+        offset += 4
+    return start_time, players, offset
+
+
+def _skip_header(data: Union[bytes, memoryview]) -> int:
+    """
+    :param data: The record.
+    :return: The offset of the first move.
+    """
+    _, num_of_players = _check_header(data)
+    offset = _HEADER.size
+    for _ in range(num_of_players):
+        offset += 1 + data[offset] + 4
+    return offset
+
+
+class GameRecordWriter:
+    """
+    A class that writes a game record move by move.
+    """
+
+    def __init__(self, file_name: str, players: List[PlayerInfo], start_time: Optional[int] = None) -> None:
+        """
+        A constructor for a GameRecordWriter object, it writes the header of the record.
+        :param file_name: The name of the record file.
+        :param players: A (name, color, is computer) tuple for every player, in turn order.
+        :param start_time: The time the game started, in seconds since the epoch.
+        """
+        self.__file: BinaryIO = open(file_name, "wb")
+        self.__file.write(encode_header(RecordedGame(players, start_time=start_time)))
+
+    def write_move(self, piece_loc: Coordinates, destination: Coordinates) -> None:
+        """
+        This function writes a move.
+        :param piece_loc: The location the piece moved from.
+        :param destination: The location the piece moved to.
+        """
+        self.__file.write(bytes((CELL_INDEX[piece_loc], CELL_INDEX[destination])))
+
+    def write_end(self, msg: str) -> None:
+        """
+        This function writes that the game ended.
+        :param msg: "Game Over" or "Quit Game".
+        """
+        self.__file.write(bytes((MARKER, END_MESSAGES.index(msg))))
+
+    def close(self) -> None:
+        """
+        This function closes the record file.
+        """
+        self.__file.close()
+
+
+def write_game_record(file_name: str, game: RecordedGame) -> None:
+    """
+    This function writes a whole game to a record file.
+    :param file_name: The name of the record file.
+    :param game: The game.
+    """
+    with open(file_name, "wb") as file:
+        file.write(encode_game(game))
+
+
+def read_game_record(file_name: str) -> RecordedGame:
+    """
+    This function reads a record file.
+    :param file_name: The name of the record file.
+    :return: A RecordedGame object.
+    """
+    with open(file_name, "rb") as file:
+        return decode_game(file.read())
+
+
+def text_log_to_game(log_file: str) -> RecordedGame:
+    """
+    This function reads the players and the moves of a text log file.
+    :param log_file: The name of the text log file.
+    :return: A RecordedGame object.
+    """
+    parser = GameState()
+    players: List[PlayerInfo] = []
+    moves: List[Tuple[int, int]] = []
+    messages: List[Tuple[int, str]] = []
+    start_time: Optional[int] = None
+    with open(log_file, "r") as file:
+        for line in file:
+            if start_time is None:
+                start_time = int(datetime.datetime.strptime(line[:19], "%Y-%m-%d %H:%M:%S").timestamp())
+            if line.endswith("Players Info\n"):
+                name, color, is_computer = parser.parse_players_info_line(line)
+                players.append((name, (color[0], color[1], color[2]), is_computer))
+            elif line.endswith("Turn\n"):
+                components = line.split("+")
+                moves.append((CELL_INDEX[parse_coordinates(components[3])],
+                              CELL_INDEX[parse_coordinates(components[4])]))
+            elif line.rstrip("\n").endswith(END_MESSAGES):
+                messages.append((len(moves), line.rstrip("\n").rsplit("+", 1)[1]))
+    if start_time is None:
+        raise ValueError(f"The log file {log_file} is empty")
+    return RecordedGame(players, moves, messages, start_time)
+
+
+def text_log_to_record(log_file: str, record_file: str) -> RecordedGame:
+    """
+    This function converts a text log file of a game to a binary record.
+    :param log_file: The name of the text log file.
+    :param record_file: The name of the record file to write.
+    :return: The converted game.
+    """
+    game = text_log_to_game(log_file)
+    write_game_record(record_file, game)
+    return game
+
+
+def record_to_text_log(record_file: str, log_file: str) -> None:
+    """
+    This function converts a binary record to a text log file, that Game can load.
+    The pieces are tracked by replaying the moves, all the lines get the start time of the game.
+    :param record_file: The name of the record file.
+    :param log_file: The name of the text log file to write.
+    """
+    game_to_text_log(read_game_record(record_file), log_file)
+
+
+def game_to_text_log(game: RecordedGame, log_file: str) -> None:
+    """
+    This function writes a game as a text log file, that Game can load.
+    The pieces are tracked by replaying the moves, all the lines get the start time of the game.
+    :param game: The game.
+    :param log_file: The name of the text log file to write.
+    """
+    timestamp = datetime.datetime.fromtimestamp(game.start_time).strftime("%Y-%m-%d %H:%M:%S")
+    state = GameState()
+    state.setup_players(game.players)
+    turn_order = [player for player in state.get_players().values() if player is not None]
+    owners = {player.get_color(): player for player in turn_order}
+    turn = 0
+    messages = sorted(game.messages)
+    next_message = 0
+    with open(log_file, "w") as file:
+        file.write(f"{timestamp},Game Settings: +{len(game.players)}+{game.get_num_of_computers()}+Game Settings\n")
+        for name, color, is_computer in game.players:
+            file.write(f"{timestamp},Game Settings: +{name}+{color}+{is_computer}+Players Info\n")
+        for ply, (piece_loc, destination) in enumerate(game.get_cell_moves()):
+            while next_message < len(messages) and messages[next_message][0] <= ply:
+                file.write(f"{timestamp}+{messages[next_message][1]}\n")
+                next_message += 1
+            piece = state.board.apply_move(piece_loc, destination)
+            player = owners[piece.get_color()]
+            # The players the moves skip had no legal moves and passed
+            while turn_order[turn] is not player:
+                file.write(f"{timestamp}+{turn_order[turn].get_name()}+{PASS}\n")
+                turn = (turn + 1) % len(turn_order)
+            turn = (turn + 1) % len(turn_order)
+            player.move_piece(piece_loc, destination)
+            file.write(f"{timestamp}+{player.get_name()}+{piece.get_id()}+{piece_loc}+{destination}+Turn\n")
+        for _, message in messages[next_message:]:
+            file.write(f"{timestamp}+{message}\n")
@@ -0,0 +1,768 @@
+import random
+import time
+import ast
+from typing import Tuple, List, Optional, Union, Set, Dict
+from .piece import Piece
+from .player import Player
+from .board import Board, CELLS, CELL_INDEX
+from .ai import SearchAI
+from .opening_book import OpeningBook
+from .endgame import Tablebase
+from .game_log import (GameLogWriter, LogIndex, DURABILITY_FLUSH, SNAPSHOT, PASS, parse_coordinates, read_log_lines,
+                       find_last_snapshot)
+from .constants import RED, GREEN, BLUE, YELLOW, ORANGE, PURPLE
+
+Coordinates = Tuple[int, int]
+
+PLAYER_COLORS = [RED, GREEN, BLUE, YELLOW, ORANGE, PURPLE]
+
+
+class GameConfig:
+    """
+    A class representing the settings of a game that runs without a window or prompts.
+    """
+
+    def __init__(self, num_of_players: int = 2, num_of_computers: Optional[int] = None,
+                 player_names: Optional[List[str]] = None, time_budget: float = 1.0, max_depth: int = 4,
+                 max_plies: Optional[int] = None, log_file: Union[str, None] = None,
+                 seed: Optional[int] = None, log_durability: str = DURABILITY_FLUSH,
+                 snapshot_interval: Optional[int] = 50, opening_book: Optional[str] = None,
+                 endgame_tables: Optional[str] = None) -> None:
+        """
+        A constructor for a GameConfig object.
+        :param num_of_players: The number of players (2,3,4 or 6).
+        :param num_of_computers: How many of the players are computers, all of them by default.
+        :param player_names: The names of the human players, "Player 1", "Player 2"... by default.
+        :param time_budget: The number of seconds a computer player may think about a move.
+        :param max_depth: The deepest search of a computer player, in plies.
+        :param max_plies: The number of moves after which run() stops, None to play until someone wins.
+        :param log_file: The name of a log file to write the game to, None to not log it.
+        :param seed: If given, the computer players break ties between moves with a generator seeded with it.
+        :param log_durability: What is done to the log file when the game ends: "none", "flush" or "fsync".
+        :param snapshot_interval: The number of moves between snapshots in the log file, None for no snapshots.
+        :param opening_book: The name of an opening book file the computer players look moves up in.
+        :param endgame_tables: The directory of the endgame tables of the computer players, None to not use them.
+        Missing tables are computed there the first time they are needed.
+        """
+        self.num_of_players = num_of_players
+        self.num_of_computers = num_of_players if num_of_computers is None else num_of_computers
+        self.player_names = player_names
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.max_plies = max_plies
+        self.log_file = log_file
+        self.seed = seed
+        self.log_durability = log_durability
+        self.snapshot_interval = snapshot_interval
+        self.opening_book = opening_book
+        self.endgame_tables = endgame_tables
+
+
+class GameState:
+    """
+    A class representing the rules and the state of a game, without drawing or user input.
+    """
+
+    def __init__(self, config: Optional[GameConfig] = None, log_file: Union[str, None] = None) -> None:
+        """
+        A constructor for a GameState object.
+        :param config: The settings of a new game, if given the players and pieces are placed right away.
+        :param log_file: The name of the log file of the game.
+        """
+        self.board = Board()
+        self.players: Dict[str, Player] = {}
+        self.num_of_players = 0
+        self.num_of_computers = 0
+        self.turn: Union[Player,None] = None
+        self.__winner: Union[Player,None] = None
+        self.selected_piece: Union[Piece,None] = None
+        self.valid_moves: Set[Coordinates] = set()
+        self.is_valid_move = True
+        self.log_file = log_file
+        self.log_durability = DURABILITY_FLUSH
+        # A snapshot of the game is logged every this many moves, so a replay doesn't start from the first move
+        self.snapshot_interval: Optional[int] = 50
+        self.__log_writer: Optional[GameLogWriter] = None
+        self.ai = SearchAI()
+        self.ply = 0
+        self.max_plies: Optional[int] = None
+        # The (piece location, destination) of every move played in this game
+        self.history: List[Tuple[Coordinates, Coordinates]] = []
+        # The number of seconds every computer move played by run() took
+        self.move_times: List[float] = []
+        if config is not None:
+            self.setup(config)
+
+    def setup(self, config: GameConfig) -> None:
+        """
+        This function initializes a new game from its settings.
+        :param config: The settings of the game.
+        """
+        if not self.is_valid_num_of_players(config.num_of_players):
+            raise ValueError(f"Invalid number of players: {config.num_of_players}")
+        if not 0 <= config.num_of_computers <= config.num_of_players:
+            raise ValueError(f"Invalid number of computers: {config.num_of_computers}")
+        self.log_file = config.log_file
+        self.log_durability = config.log_durability
+        self.snapshot_interval = config.snapshot_interval
+        if self.log_file is not None:
+            self.open_log("w")
+        rng = random.Random(config.seed) if config.seed is not None else None
+        book = OpeningBook.load(config.opening_book) if config.opening_book is not None else None
+        endgame = Tablebase(config.endgame_tables) if config.endgame_tables is not None else None
+        self.ai = SearchAI(config.time_budget, config.max_depth, rng=rng, book=book, endgame=endgame)
+        self.max_plies = config.max_plies
+        self.num_of_players = config.num_of_players
+        self.num_of_computers = config.num_of_computers
+        if self.log_file is not None:
+            self.log_game_settings(self.num_of_players, self.num_of_computers)
+        num_of_humans = self.num_of_players - self.num_of_computers
+        names = config.player_names or [f"Player {i + 1}" for i in range(num_of_humans)]
+        for i in range(self.num_of_players):
+            if i < num_of_humans:
+                self.add_player(names[i], PLAYER_COLORS[i], False)
+            else:
+                self.add_player(f"Computer {i - num_of_humans + 1}", PLAYER_COLORS[i], True)
+        self.place_pieces_on_board()
+        self.add_targets_to_players()
+        self.change_turn()
+
+    def setup_players(self, players_info: List[Tuple[str, Tuple[int, int, int], bool]]) -> None:
+        """
+        This function adds the players of a game in turn order and places their pieces, without logging.
+        :param players_info: A (name, color, is computer) tuple for every player.
+        """
+        self.num_of_players = len(players_info)
+        self.num_of_computers = sum(is_computer for _, _, is_computer in players_info)
+        for name, color, is_computer in players_info:
+            self.players[name] = Player(name, color, is_computer)
+        self.place_pieces_on_board()
+        self.add_targets_to_players()
+        self.change_turn()
+
+    def add_player(self, name: str, color: Tuple[int, int, int], is_computer: bool) -> Player:
+        """
+        This function creates a player, adds it to the game and logs it.
+        :param name: The name of the player.
+        :param color: The color of the player.
+        :param is_computer: True if the player is a computer.
+        :return: The new player.
+        """
+        player = Player(name, color, is_computer)
+        self.players[name] = player
+        if self.log_file is not None:
+            self.log_players_info(name, color, is_computer)
+        return player
+
+    # These functions are for setting up the game
+    def is_valid_num_of_players(self, num_of_players: int) -> bool:
+        """
+        This function checks if the number of players is valid.
+        :param num_of_players: An integer representing the number of players.
+        :return: True if the number of players is valid, False otherwise.
+        """
+        return 2 <= num_of_players <= 6 and num_of_players != 5
+
+    def get_num_of_players(self) -> int:
+        """
+        :return: The number of players in the game.
+        """
+        return self.num_of_players
+
+    def calculate_first_loc(self) -> List[Coordinates]:
+        """
+        This function calculates the starting positions of the pieces.
+        :return: A list of tuples representing the starting positions.
+        """
+        first_loc = []
+        if self.num_of_players == 6:
+            first_loc = [(0, 12), (4, 0), (9, 3), (13, 9), (9, 21), (4, 18)]
+        elif self.num_of_players == 4:
+            first_loc = [(4, 0), (9, 3), (9, 21), (4, 18)]
+        elif self.num_of_players == 3:
+            first_loc = [(0, 12), (9, 3), (9, 21)]
+        elif self.num_of_players == 2:
+            first_loc = [(0, 12), (13, 9)]
+
+        return first_loc
+
+    def calculate_starting_position(self) -> list[list[Coordinates]]:
+        """
+        This function calculates the starting positions of the pieces of every player
+        :return:
+        """
+        first_loc = self.calculate_first_loc()
+        starting_positions = []
+        for index, first in enumerate(first_loc):
+            player = []
+            start_x, start_y = first
+            if first in [(4, 0), (4, 18), (13, 9)]:
+                for i in range(start_x, start_x + 4):
+                    c = i - start_x
+                    for j in range(start_y + c, start_y + 7 - c, 2):
+                        player.append((i, j))
+            else:
+                for i in range(start_x, start_x + 4):
+                    c = i - start_x
+                    for j in range(start_y - c, start_y + c + 2, 2):
+                        player.append((i, j))
+            starting_positions.append(player)
+
+        return starting_positions
+
+    def convert_start_pos_to_target_pos(self, start_pos: Coordinates) -> Union[Coordinates, None]:
+        """
+        This function converts the starting position to the target position.
+        :param start_pos: A tuple representing the starting position.
+        :return: A tuple representing the target position.
+        """
+        if start_pos == (0, 12):
+            return (13, 9)
+        if start_pos == (4, 0):
+            return (9, 21)
+        if start_pos == (9, 3):
+            return (4, 18)
+        if start_pos == (13, 9):
+            return (0, 12)
+        if start_pos == (9, 21):
+            return (4, 0)
+        if start_pos == (4, 18):
+            return (9, 3)
+
+    def calculate_target_position(self) -> list[list[Coordinates]]:
+        """
+        This function calculates the target positions of the pieces of every player
+        :return:
+        """
+        target_positions = []
+        for index, first in enumerate(self.calculate_first_loc()):
+            player = []
+            start_x, start_y = self.convert_start_pos_to_target_pos(first)
+            if first not in [(4, 0), (4, 18), (13, 9)]:
+                for i in range(start_x, start_x + 4):
+                    c = i - start_x
+                    for j in range(start_y + c, start_y + 7 - c, 2):
+                        player.append((i, j))
+            else:
+                for i in range(start_x, start_x + 4):
+                    c = i - start_x
+                    for j in range(start_y - c, start_y + c + 2, 2):
+                        player.append((i, j))
+            target_positions.append(player)
+
+        return target_positions
+
+    def add_targets_to_players(self) -> None:
+        """
+        This function adds the target positions to the players.
+        """
+        target_positions = self.calculate_target_position()
+        for player, positions in zip(self.players.values(), target_positions):
+            for i, position in enumerate(positions):
+                player.add_target_loc(position)
+
+    def place_pieces_on_board(self) -> None:
+        """
+        This function places the pieces on the board and adds the pieces to the players piece dictionary.
+        :param self:
+        :return:
+        """
+        starting_positions = self.calculate_starting_position()
+        for player, positions in zip(self.players.values(), starting_positions):
+            for i, position in enumerate(positions):
+                piece = Piece(player.get_color(), f"{player.get_color()}{i}", position)
+                self.board.add_piece(piece)
+                player.add_piece(piece)
+
+    def get_board(self) -> Board:
+        """
+        :return: The board of the game.
+        """
+        return self.board
+
+    # These functions are for the activ part of the game
+    def select(self, loc: Coordinates) -> bool:
+        """
+        This function selects a piece on the board and trys to move it to a selected location.
+        :param loc: A tuple representing the location of the piece.
+        """
+        if not self.selected_piece:
+            piece = self.board.get_piece(loc)
+            if piece is None or piece == 0 or piece == " ":
+                self.is_valid_move = False
+                return False
+            elif piece.get_color() is not None and self.turn is not None and piece.get_color() == self.turn.get_color():
+                self.selected_piece = piece
+                self.valid_moves = self.board.optional_moves(piece)
+                self.is_valid_move = True
+                return True  # Piece selection successful
+            else:
+                self.is_valid_move = False
+                return False  # Invalid piece selection, prompt user to select again
+        else:
+            result = self._move(loc)
+            if not result:
+                self.is_valid_move = False
+                # If the move is invalid, reset the selected piece and valid moves
+                self.selected_piece = None
+                self.valid_moves = set()
+                return False  # Indicate that the move was invalid
+            else:
+                self.is_valid_move = True
+                return True  # Move successful
+
+    def computer_move(self) -> bool:
+        """
+        This method executes a move for a computer player.
+        :return: True if the move is successful, False otherwise.
+        """
+        player = self.get_current_player()
+        assert player is not None, "The game has started"
+        players = list(self.players.values())
+        return self.play_computer_move(self.ai.choose_move(self.board, players, players.index(player)))
+
+    def play_move(self, piece_loc: Coordinates, destination: Coordinates) -> bool:
+        """
+        This method plays a move of the current player, e.g. one sent over the network, if the rules allow it.
+        :param piece_loc: The location of one of the current player's pieces.
+        :param destination: The location to move it to.
+        :return: True if the move is successful, False otherwise.
+        """
+        player = self.get_current_player()
+        if player is None or piece_loc not in player.get_pieces():
+            return False
+        if not self.play_computer_move((piece_loc, destination)):
+            self.selected_piece = None
+            self.valid_moves = set()
+            return False
+        return True
+
+    def pass_turn(self) -> None:
+        """
+        This method passes the turn of the current player, that has no legal moves, and logs the pass.
+        """
+        player = self.get_current_player()
+        if self.log_file is not None and player is not None:
+            self.log_pass(player.get_name())
+        self.selected_piece = None
+        self.change_turn()
+
+    def play_computer_move(self, move: Optional[Tuple[Coordinates, Coordinates]]) -> bool:
+        """
+        This method plays a move that was chosen for the current computer player.
+        :param move: A (piece location, destination) pair, None if the computer has no move.
+        :return: True if the move is successful, False otherwise.
+        """
+        if move is None:
+            return False  # No valid moves available for the computer player
+        self.selected_piece = self.board.get_piece(move[0])
+        self.valid_moves = self.board.optional_moves(self.selected_piece)
+        return self._move(move[1])
+
+    def _move(self, loc: Coordinates) -> bool:
+        """
+        This function moves a piece to a selected location.
+        :param loc: A tuple representing the location of the destination.
+        :return:
+        """
+        piece = self.board.get_piece(loc)
+        cur_piece = self.selected_piece
+        if cur_piece is not None:
+            cur_loc = cur_piece.get_location()
+            if self.selected_piece and piece == 0 and loc in self.valid_moves:
+                self.board.apply_move(cur_loc, loc)
+                self.get_current_player().move_piece(cur_loc, loc)
+                if self.log_file is not None:
+                    self.log_turn(self.get_current_player().get_name(), cur_piece.get_id(), cur_loc, loc)
+                self.selected_piece = None
+                self.ply += 1
+                self.history.append((cur_loc, loc))
+                self.change_turn()
+                if self.log_file is not None and self.snapshot_interval and self.ply % self.snapshot_interval == 0:
+                    self.log_snapshot()
+
+                return True
+        return False
+
+    def change_turn(self) -> None:
+        """
+        This function changes the turn of the game.
+        """
+        self.valid_moves = set()
+        player_names = list(self.players.keys())
+        if player_names != [] and self.players != {}:
+            if self.turn is None:
+                self.turn = self.players[player_names[0]]
+            else:
+                index = player_names.index(self.turn.get_name())
+                if index == len(player_names) - 1:
+                    self.turn = self.players[player_names[0]]
+                else:
+                    self.turn = self.players[player_names[index + 1]]
+
+    def get_current_player(self) -> Union[Player, None]:
+        """
+        :return: The current player of the game.
+        """
+        return self.turn
+
+    def run(self) -> Union[Player, None]:
+        """
+        This function plays the computer turns until the game is over, or until a human player has to move.
+        :return: The winner of the game, None if there is no winner yet.
+        """
+        while not self.is_end_game():
+            if self.max_plies is not None and self.ply >= self.max_plies:
+                break
+            player = self.get_current_player()
+            if player is None or not player.check_if_computer():
+                break
+            start = time.perf_counter()
+            moved = self.computer_move()
+            self.move_times.append(time.perf_counter() - start)
+            if not moved:
+                self.pass_turn()
+            self.tick_log()
+        if self.get_winner() is not None:
+            self.update_wins_and_losses()
+        return self.get_winner()
+
+    def get_players(self) -> Dict[str, Union[Player,None]]:
+        """
+        :return: The players of the game.
+        """
+        return self.players
+
+    # These functions are for the end of the game
+    def is_end_game(self) -> bool:
+        """
+        This function checks if the game is over.
+        :return: True if the game is over, False otherwise.
+        """
+        for player in self.players.values():
+            if player is not None:
+                if player.check_if_winner():
+                    if self.get_winner() is None and self.log_file is not None:
+                        self.log_game_end("Game Over")
+                    self.set_winner(player)
+                    return True
+        return False
+
+    def set_winner(self, player: Player) -> None:
+        """
+        This function sets the winner of the game.
+        :param player: The player that won the game.
+        """
+        self.__winner = player
+
+    def get_winner(self) -> Union[Player, None]:
+        """
+        :return: The winner of the game.
+        """
+        return self.__winner
+
+    def update_wins_and_losses(self) -> None:
+        """
+        This function updates the wins and losses of the players.
+        """
+        if self.get_winner() == None:
+            return
+        else:
+            for player in self.players.values():
+                if player == self.get_winner():
+                    player.add_win()
+                else:
+                    player.add_loss()
+
+    def get_scores(self) -> dict[str, dict[str, int]]:
+        """
+        :return: A dictionary representing the scores of the players.
+        """
+        scores = {}
+        for player in self.players.values():
+            win_lose = {"wins": player.get_number_of_wins(), "losses": player.get_number_of_losses()}
+            scores[player.get_name()] = win_lose
+        return scores
+
+    # all function below are for the log file
+
+    def log_game_settings(self, number_of_players: int, number_of_computers: int) -> None:
+        """
+        This function logs the game settings to a text file.
+        :param number_of_players: The number of players in the game.
+        :param number_of_computers: The number of computers in the game.
+        """
+        log = self.get_log_writer()
+        log.write(f"{log.timestamp()},Game Settings: +{number_of_players}+{number_of_computers}+Game Settings\n")
+
+    def log_players_info(self, players_name: str, players_color: Tuple[int, int, int], is_computer: bool) -> None:
+        """
+        This function logs the players' information to a text file.
+        :param players_name: The name of the player.
+        :param players_color: The color of the player.
+        :param is_computer: True if the player is a computer, False otherwise.
+        """
+        log = self.get_log_writer()
+        log.write(f"{log.timestamp()},Game Settings: +{players_name}+{players_color}+{is_computer}+Players Info\n")
+
+    def log_turn(self, player_name: str, piece_id: str, piece_location: Coordinates, destination: Coordinates) -> None:
+        """
+        This function logs the current turn of the game and writes it to a text file.
+        :param player_name: The name of the player.
+        :param piece_id: The id of the piece.
+        :param piece_location: The location of the piece.
+        :param destination: The destination of the piece.
+        """
+        log = self.get_log_writer()
+        log.write(f"{log.timestamp()}+{player_name}+{piece_id}+{piece_location}+{destination}+Turn\n")
+
+    def log_pass(self, player_name: str) -> None:
+        """
+        This function logs that a player had no legal moves and passed its turn.
+        :param player_name: The name of the player.
+        """
+        log = self.get_log_writer()
+        log.write(f"{log.timestamp()}+{player_name}+{PASS}\n")
+
+    def log_snapshot(self) -> None:
+        """
+        This function logs the number of moves played, the player whose turn it is and the positions of all the pieces.
+        The positions of every player are the indices of the cells in Board.cell_list(), ordered by the pieces ids,
+        and the players are separated by "/".
+        """
+        positions = "/".join(",".join(str(CELL_INDEX[loc]) for loc in locations)
+                             for locations in self.piece_positions())
+        player = self.get_current_player()
+        assert player is not None, "A snapshot is taken after a move"
+        log = self.get_log_writer()
+        log.write(f"{log.timestamp()}+{SNAPSHOT}+{self.ply}+{player.get_name()}+{positions}"
+                  f"+{SNAPSHOT}\n")
+
+    def log_game_end(self, msg: str) -> None:
+        """
+        Log that the game has ended in the log file.
+        :param msg: A message to write to the log file.
+        """
+        log = self.get_log_writer()
+        log.write(f"{log.timestamp()}+{msg}\n")
+        log.end_game()
+
+    def open_log(self, mode: str = "a") -> GameLogWriter:
+        """
+        This function opens the log file of the game for writing, and closes the previous one.
+        :param mode: "w" to start a new log file, "a" to append to an existing one.
+        :return: The writer of the log file.
+        """
+        if self.log_file is None:
+            raise ValueError("The game has no log file")
+        self.close_log()
+        self.__log_writer = GameLogWriter(self.log_file, mode, durability=self.log_durability)
+        return self.__log_writer
+
+    def get_log_writer(self) -> GameLogWriter:
+        """
+        :return: The writer of the log file, the file is opened for appending if it is not open yet.
+        """
+        writer = self.__log_writer
+        if writer is None or writer.is_closed() or writer.file_name != self.log_file:
+            writer = self.open_log("a")
+        return writer
+
+    def tick_log(self) -> Optional[float]:
+        """
+        This function writes the buffered log lines if they waited for the flush interval of the log writer.
+        :return: The number of seconds until the buffered lines are due, None if no line is buffered.
+        """
+        if self.__log_writer is None:
+            return None
+        return self.__log_writer.flush_if_due()
+
+    def close_log(self) -> None:
+        """
+        This function writes the buffered log lines and closes the log file.
+        """
+        if self.__log_writer is not None:
+            self.__log_writer.close()
+            self.__log_writer = None
+
+    def load_settings(self) -> None:
+        """
+        This function loads the game settings from a log file.
+        """
+        file_name = self.log_file
+        try:
+            with open(file_name, 'r') as file:
+                for line in file:
+                    if line.endswith("Turn\n"):
+                        break  # The settings are all before the first turn
+                    if line.endswith("Game Settings\n"):
+                        num_of_players, num_of_computers = self.parse_settings_line(line)
+                        self.num_of_players = num_of_players
+                        self.num_of_computers = num_of_computers
+                    elif line.endswith("Players Info\n"):
+                        player_name, player_color, is_computer = self.parse_players_info_line(line)
+                        self.players[player_name] = Player(player_name, player_color, is_computer)
+        except Exception as e:
+            print("An error occurred:", e)
+
+    def parse_settings_line(self, line: str) -> Tuple[int, int]:
+        """
+        This function parses a setting line from the log file.
+        :param line:
+        :return:
+        """
+        components = line.split("+")
+        num_of_players = int(components[1])
+        num_of_computers = int(components[2])
+        return num_of_players, num_of_computers
+
+    def parse_players_info_line(self, line: str) -> tuple[str, Union[tuple[int, int, int], Tuple[int,...]], bool]:
+        """
+        This function parses a player info line from the log file.
+        :param line:
+        :return:
+        """
+        components = line.split("+")
+        player_name = components[1]
+        color = components[2].replace(" ", "")
+        player_colore_tuple = ast.literal_eval(color)
+        player_color = tuple(map(int, player_colore_tuple))
+        is_computer = components[3].lower() == "true"
+        return player_name, player_color, is_computer
+
+    def parse_log_line(self, line: str) -> Tuple[str, str, Coordinates, Coordinates]:
+        """
+        This function parses a turn line from the log file.
+        :param line: A line from the log file.
+        :return: The player's name, the piece's id, the piece's location, and the destination.
+        """
+        components = line.split("+")
+        player_name = components[1]
+        piece_id = components[2]
+        piece_loc = parse_coordinates(components[3])
+        destination = parse_coordinates(components[4])
+        return player_name, piece_id, piece_loc, destination
+
+    def load_game(self, stop_at: Optional[int] = None, index: Optional[LogIndex] = None) -> int:
+        """
+        This function replays the turns of the log file on the board, the pieces must be in their starting positions.
+        The replay starts from the last snapshot before the wanted move, so its time doesn't grow with the game,
+        and the moves after it are not validated again.
+        After the replay it is the turn of the player after the last one that moved or passed.
+        :param stop_at: The number of moves to replay, None to replay all of them.
+        :param index: The index of the log file, it is built if it is needed and not given.
+        :return: The number of moves played.
+        """
+        file_name = self.log_file
+        if file_name is None:
+            raise ValueError("The game has no log file")
+        last_player = None
+        try:
+            if stop_at is None:
+                offset = find_last_snapshot(file_name) or 0
+            else:
+                offset = (index if index is not None else LogIndex(file_name)).snapshot_before(stop_at)
+            for _, line in read_log_lines(file_name, offset):
+                if line.endswith("Turn\n"):
+                    # The passes right after the last wanted move are replayed, they don't change the board
+                    if stop_at is not None and self.ply >= stop_at:
+                        break
+                    player_name, piece_id, piece_loc, destination = self.parse_log_line(line)
+                    self.update_game_state(player_name, piece_loc, destination)
+                    last_player = player_name
+                    self.ply += 1
+                elif line.endswith(f"{SNAPSHOT}\n"):
+                    self.restore_snapshot(*self.parse_snapshot_line(line))
+                    last_player = None
+                elif line.endswith(f"+{PASS}\n"):
+                    last_player = line.split("+")[1]
+        except Exception as e:
+            print("An error occurred:", e)
+        if last_player is not None:
+            self.turn = self.get_player_by_name(last_player)
+            self.change_turn()
+        return self.ply
+
+    def parse_snapshot_line(self, line: str) -> Tuple[int, str, List[List[Coordinates]]]:
+        """
+        This function parses a snapshot line from the log file.
+        :param line: A line from the log file.
+        :return: The number of moves played, the name of the player whose turn it is,
+        and the locations of every player's pieces ordered by the pieces ids.
+        """
+        components = line.split("+")
+        ply = int(components[2])
+        turn_name = components[3]
+        positions = [[CELLS[int(index)] for index in locations.split(",") if index]
+                     for locations in components[4].split("/")]
+        return ply, turn_name, positions
+
+    def piece_positions(self) -> List[List[Coordinates]]:
+        """
+        :return: The locations of every player's pieces in turn order, ordered by the pieces ids.
+        """
+        positions = []
+        for player in self.players.values():
+            locations = {piece.get_id(): loc for loc, piece in player.get_pieces().items()}
+            positions.append([locations[f"{player.get_color()}{i}"] for i in range(len(locations))])
+        return positions
+
+    def restore_snapshot(self, ply: int, turn_name: str, positions: List[List[Coordinates]]) -> None:
+        """
+        This function puts the game in the state of a snapshot.
+        :param ply: The number of moves played.
+        :param turn_name: The name of the player whose turn it is.
+        :param positions: The locations of every player's pieces in turn order, ordered by the pieces ids.
+        """
+        self.board = Board()
+        for player, locations in zip(self.players.values(), positions):
+            player.clear_pieces()
+            for i, loc in enumerate(locations):
+                piece = Piece(player.color, f"{player.color}{i}", loc)
+                self.board.add_piece(piece)
+                player.add_piece(piece)
+        self.turn = self.get_player_by_name(turn_name)
+        self.ply = ply
+        self.selected_piece = None
+        self.valid_moves = set()
+
+    def update_game_state(self, player_name: str, piece_coords: Coordinates, destination_coords: Coordinates) -> None:
+        """
+        This function updates the game state based on the log file.
+        :param player_name: The name of the player.
+        :param piece_coords: The coordinates of the piece to move.
+        :param destination_coords: The destination coordinates.
+        :return:
+        """
+        # Retrieve the player object based on the player's name
+        player = self.get_player_by_name(player_name)
+
+        # Retrieve the piece object based on its coordinates
+        piece = self.board.get_piece_by_coordinates(piece_coords)
+
+        # Move the piece to the new destination, the logged moves were validated when they were played
+        if piece is not None and self.board.get_piece(destination_coords) == 0:
+            self.board.apply_move(piece_coords, destination_coords)
+            player.move_piece(piece_coords, destination_coords)
+
+    def get_player_by_name(self, player_name: str) -> Player:
+        """
+        This function retrieves a player object based on the player's name.
+        :param player_name: The name of the player.
+        :return: Player object.
+        """
+        return self.players[player_name]
+
+    # these functions are for testing
+
+    def get_selected_piece(self) -> Union[Piece,None]:
+        """
+        :return: The selected piece of the game.
+        """
+        return self.selected_piece
+
+    def set_players(self, players: Dict[str,Player]) -> None:
+        """
+        :param players: A dictionary representing the players of the game.
+        """
+        self.players = players
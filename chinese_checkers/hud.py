@@ -0,0 +1,76 @@
+import pygame
+from collections import OrderedDict
+from pygame import Surface, Rect
+from pygame.font import Font
+from typing import Tuple, Dict
+
+Color = Tuple[int, int, int]
+
+
+class TextRenderer:
+    """
+    A class that draws the text of the game, e.g. the current player and the scores.
+    Every font size is loaded once, and the most recently drawn texts are kept rendered,
+    so drawing the same text again is a single blit.
+    """
+
+    def __init__(self, max_texts: int = 64) -> None:
+        """
+        A constructor for a TextRenderer object.
+        :param max_texts: The number of rendered texts to keep, the least recently used ones are dropped.
+        """
+        self.max_texts = max_texts
+        self.__fonts: Dict[int, Font] = {}
+        self.__texts: "OrderedDict[Tuple[str, Color, int], Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """
+        :return: The number of rendered texts that are kept.
+        """
+        return len(self.__texts)
+
+    def font(self, size: int) -> Font:
+        """
+        :param size: The size of the font.
+        :return: The default font in that size, loaded the first time it is needed.
+        """
+        font = self.__fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = Font(None, size)
+            self.__fonts[size] = font
+        return font
+
+    def render(self, text: str, color: Color, size: int) -> Surface:
+        """
+        :param text: The text.
+        :param color: The color of the text.
+        :param size: The size of the font.
+        :return: The rendered text, rendered only if it is not kept from before.
+        """
+        key = (text, color, size)
+        surface = self.__texts.get(key)
+        if surface is not None:
+            self.__texts.move_to_end(key)
+            return surface
+        surface = self.font(size).render(text, True, color)
+        self.__texts[key] = surface
+        if len(self.__texts) > self.max_texts:
+            self.__texts.popitem(last=False)
+        return surface
+
+    def draw(self, win: Surface, text: str, color: Color, size: int, center: Tuple[int, int]) -> Rect:
+        """
+        This function draws text on the screen.
+        :param win: The window to draw on.
+        :param text: The text to draw.
+        :param color: The color of the text.
+        :param size: The size of the font.
+        :param center: The (x, y) of the center of the text.
+        :return: The area the text was drawn in.
+        """
+        surface = self.render(text, color, size)
+        rect = surface.get_rect(center=center)
+        win.blit(surface, rect)
+        return rect
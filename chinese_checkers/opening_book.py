@@ -0,0 +1,228 @@
+import argparse
+import random
+import struct
+from typing import Tuple, List, Dict, Optional, Sequence
+from .board import Board, CELLS, CELL_INDEX, zobrist_turn_key
+from .player import Player
+
+Coordinates = Tuple[int, int]
+Move = Tuple[Coordinates, Coordinates]
+PlayerInfo = Tuple[str, Tuple[int, int, int], bool]
+
+# A book file starts with MAGIC, a version byte, the number of plies the book covers and the number of entries,
+# then every entry as (position key, from cell index, to cell index, games, wins), sorted by key.
+# The key of a position is Board.hash_key ^ zobrist_turn_key(index of the player to move).
+MAGIC = b"CCOB"
+VERSION = 1
+_HEADER = struct.Struct("<4sBBI")
+_ENTRY = struct.Struct("<QBBII")
+
+
+class OpeningBook:
+    """
+    A table of the moves played in the first plies of many games, and how often the player that played them won.
+    """
+
+    def __init__(self, max_plies: int = 16, min_games: int = 1) -> None:
+        """
+        A constructor for an OpeningBook object.
+        :param max_plies: The number of plies from the start of a game that are added to the book.
+        :param min_games: The number of games a move must have been played in to be chosen from the book.
+        """
+        self.max_plies = max_plies
+        self.min_games = min_games
+        # position key -> {(from cell index, to cell index): [games, wins]}
+        self.__stats: Dict[int, Dict[Tuple[int, int], List[int]]] = {}
+
+    def __len__(self) -> int:
+        """
+        :return: The number of positions in the book.
+        """
+        return len(self.__stats)
+
+    def add_game(self, players_info: Sequence[PlayerInfo], moves: Sequence[Move], winner: Optional[str]) -> None:
+        """
+        This function adds the first plies of a game to the book.
+        :param players_info: A (name, color, is computer) tuple for every player, in turn order.
+        :param moves: The (piece location, destination) of every move of the game.
+        :param winner: The name of the winner, None if the game has no winner.
+        """
+        board = starting_board(players_info)
+        colors = [color for _, color, _ in players_info]
+        winner_index = [name for name, _, _ in players_info].index(winner) if winner is not None else None
+        for piece_loc, destination in moves[:self.max_plies]:
+            piece = board.pieces.get(piece_loc)
+            if piece is None:
+                break
+            mover = colors.index(piece.color)
+            key = board.hash_key ^ zobrist_turn_key(mover)
+            stats = self.__stats.setdefault(key, {}).setdefault((CELL_INDEX[piece_loc], CELL_INDEX[destination]),
+                                                                [0, 0])
+            stats[0] += 1
+            if mover == winner_index:
+                stats[1] += 1
+            board.apply_move(piece_loc, destination)
+
+    def lookup(self, key: int) -> List[Tuple[Move, int, int]]:
+        """
+        :param key: The key of a position.
+        :return: The (move, games, wins) of every move played in the position.
+        """
+        return [((CELLS[src], CELLS[dst]), games, wins)
+                for (src, dst), (games, wins) in self.__stats.get(key, {}).items()]
+
+    def choose_move(self, board: Board, players: Sequence[Player], player_index: int,
+                    rng: Optional[random.Random] = None) -> Optional[Move]:
+        """
+        This function picks the book move with the best win rate in a position.
+        :param board: The board of the game.
+        :param players: The players of the game, in turn order.
+        :param player_index: The index of the player to move.
+        :param rng: If given, breaks ties between equally good moves at random.
+        :return: A legal (piece location, destination) pair, None if the position is not in the book.
+        """
+        color = players[player_index].get_color()
+        best_moves: List[Move] = []
+        best_score = -1.0
+        for move, games, wins in self.lookup(board.hash_key ^ zobrist_turn_key(player_index)):
+            if games < self.min_games:
+                continue
+            piece = board.pieces.get(move[0])
+            # Different positions may share a key, so book moves are checked before they are played
+            if piece is None or piece.get_color() != color or move[1] not in board.optional_moves(piece):
+                continue
+            score = (wins + 1) / (games + 2)
+            if score > best_score:
+                best_moves = [move]
+                best_score = score
+            elif score == best_score:
+                best_moves.append(move)
+        if not best_moves:
+            return None
+        return rng.choice(best_moves) if rng is not None else best_moves[0]
+
+    def save(self, file_name: str) -> None:
+        """
+        This function writes the book to a file.
+        :param file_name: The name of the book file.
+        """
+        entries = sorted((key, src, dst, games, wins)
+                         for key, moves in self.__stats.items() for (src, dst), (games, wins) in moves.items())
+        with open(file_name, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, self.max_plies, len(entries)))
+            file.write(b"".join(_ENTRY.pack(*entry) for entry in entries))
+
+    @classmethod
+    def load(cls, file_name: str, min_games: int = 1) -> "OpeningBook":
+        """
+        This function reads a book file.
+        :param file_name: The name of the book file.
+        :param min_games: The number of games a move must have been played in to be chosen from the book.
+        :return: An OpeningBook object.
+        """
+        with open(file_name, "rb") as file:
+            data = file.read()
+        magic, version, max_plies, num_of_entries = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{file_name} is not an opening book")
+        book = cls(max_plies, min_games)
+        for key, src, dst, games, wins in _ENTRY.iter_unpack(data[_HEADER.size:_HEADER.size +
+                                                                  num_of_entries * _ENTRY.size]):
+            book.__stats.setdefault(key, {})[(src, dst)] = [games, wins]
+        return book
+
+
+def starting_board(players_info: Sequence[PlayerInfo]) -> Board:
+    """
+    :param players_info: A (name, color, is computer) tuple for every player, in turn order.
+    :return: A board with the pieces of the players in their starting positions.
+    """
+    from .game_state import GameState  # game_state imports the AI, which imports this module
+    state = GameState()
+    state.setup_players(list(players_info))
+    return state.board
+
+
+def build_from_archive(archive_file: str, max_plies: int = 16) -> OpeningBook:
+    """
+    This function builds an opening book from the games of an archive.
+    :param archive_file: The name of the archive file.
+    :param max_plies: The number of plies from the start of every game that are added to the book.
+    :return: The book.
+    """
+    from .archive import Archive
+    book = OpeningBook(max_plies)
+    with Archive(archive_file) as archive:
+        for game_id in range(len(archive)):
+            game = archive.get_game(game_id)
+            moves = game.get_cell_moves()
+            game_over = "Game Over" in (message for _, message in game.messages)
+            book.add_game(game.players, moves, last_mover(game.players, moves) if game_over else None)
+    return book
+
+
+def last_mover(players_info: Sequence[PlayerInfo], moves: Sequence[Move]) -> Optional[str]:
+    """
+    :param players_info: A (name, color, is computer) tuple for every player, in turn order.
+    :param moves: The (piece location, destination) of every move of a game.
+    :return: The name of the player that played the last move, None if there are no moves.
+    """
+    if not moves:
+        return None
+    board = starting_board(players_info)
+    for piece_loc, destination in moves:
+        board.apply_move(piece_loc, destination)
+    color = board.pieces[moves[-1][1]].get_color()
+    return next(name for name, player_color, _ in players_info if player_color == color)
+
+
+def build_from_self_play(num_of_games: int, num_of_players: int = 2, time_budget: float = 0.1, max_depth: int = 2,
+                         max_plies: int = 16, seed: int = 0) -> OpeningBook:
+    """
+    This function builds an opening book from games between computer players.
+    :param num_of_games: The number of games to play.
+    :param num_of_players: The number of players of every game.
+    :param time_budget: The number of seconds a computer may think about a move.
+    :param max_depth: The deepest search of the computers, in plies.
+    :param max_plies: The number of plies from the start of every game that are added to the book.
+    :param seed: The seed of the first game, the computers break ties at random so the games differ.
+    :return: The book.
+    """
+    from .game_state import GameState, GameConfig
+    book = OpeningBook(max_plies)
+    for i in range(num_of_games):
+        state = GameState(GameConfig(num_of_players, time_budget=time_budget, max_depth=max_depth, max_plies=1000,
+                                     seed=seed + i))
+        winner = state.run()
+        players_info = [(player.get_name(), player.color, player.check_if_computer())
+                        for player in state.get_players().values() if player is not None]
+        book.add_game(players_info, state.history, winner.get_name() if winner is not None else None)
+    return book
+
+
+def main() -> None:
+    """
+    Builds an opening book from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Build an opening book from self-play games or a game archive.")
+    parser.add_argument("output", help="the book file to write")
+    parser.add_argument("--archive", default=None, help="an archive to read the games from instead of playing them")
+    parser.add_argument("--games", type=int, default=20, help="self-play games to play")
+    parser.add_argument("--players", type=int, default=2, help="number of players of the self-play games")
+    parser.add_argument("--time-budget", type=float, default=0.1, help="seconds per computer move")
+    parser.add_argument("--depth", type=int, default=2, help="deepest search in plies")
+    parser.add_argument("--book-plies", type=int, default=16, help="plies from the start of a game in the book")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first self-play game")
+    args = parser.parse_args()
+
+    if args.archive is not None:
+        book = build_from_archive(args.archive, args.book_plies)
+    else:
+        book = build_from_self_play(args.games, args.players, args.time_budget, args.depth, args.book_plies,
+                                    args.seed)
+    book.save(args.output)
+    print(f"{len(book)} positions written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 import pygame
 from pygame import Surface
-import random
-from typing import Tuple, Optional, Set, Dict, Union
+from typing import Tuple, Dict, Union
 from .piece import Piece
 
 Coordinates = Tuple[int, int]
@@ -106,6 +105,16 @@ class Player:
         :param piece: A Piece object to add to the player's pieces list.
         """
         self.__pieces[piece.get_location()] = piece
+        if piece.get_location() in self.target_locs.keys():
+            self.target_locs[piece.get_location()] = piece
+
+    def clear_pieces(self) -> None:
+        """
+        This function removes all the player's pieces, the target locations are kept empty.
+        """
+        self.__pieces = {}
+        for loc in self.target_locs.keys():
+            self.target_locs[loc] = 0
 
     def get_pieces(self) -> Dict[Coordinates, Piece]:
         """
@@ -131,21 +140,3 @@ class Player:
         :return: True if the player is a computer player, False otherwise.
         """
         return self.is_computer
-
-    def computer_select_piece(self) -> Union[Piece, None]:
-        """
-        This function selects a random piece from the player's pieces.
-        :return: A Piece object representing the selected piece.
-        """
-        if self.__pieces:
-            return random.choice(list(self.__pieces.values()))
-        return None
-
-    def computer_select_destination(self, valid_moves: Set[Coordinates]) -> Coordinates:
-        """
-        This function selects a random destination from the given valid moves.
-        :param valid_moves: A set of valid moves.
-        :return: A tuple representing the selected destination.
-        """
-        return random.choice(list(valid_moves))
-
@@ -0,0 +1,495 @@
+import argparse
+import asyncio
+import json
+from typing import Tuple, List, Dict, Optional, Any, Callable
+from .game_state import GameState, GameConfig
+from .player import Player
+
+Coordinates = Tuple[int, int]
+Message = Dict[str, Any]
+
+DEFAULT_PORT = 8765
+# A line longer than this is not a message of the protocol
+MAX_LINE = 1 << 16
+# The connections that may wait to be accepted, many clients connect at once when a server with many tables starts
+BACKLOG = 4096
+
+
+class Connection:
+    """
+    A client connected to the server. Messages are JSON objects, one per line, in both directions.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        A constructor for a Connection object.
+        :param reader: The stream the client's messages come from.
+        :param writer: The stream the messages to the client go to.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.table: Optional["Table"] = None
+        self.name: Optional[str] = None
+
+    def send(self, message: Message) -> None:
+        """
+        This function sends a message to the client, unless it disconnected.
+        :param message: The message.
+        """
+        if not self.writer.is_closing():
+            self.writer.write((json.dumps(message) + "\n").encode("utf-8"))
+
+
+class Table:
+    """
+    A game hosted by the server. The game starts when all the human seats are taken,
+    the computers take the last seats, like in GameState.setup.
+    Everything that happens at the table goes through its command queue and is handled by its own task,
+    one command at a time, so a table needs no locks and an idle table costs only a waiting task.
+    The rules and the turn order are the ones of GameState.
+    """
+
+    def __init__(self, name: str, num_of_players: int, num_of_computers: int, time_budget: float, max_depth: int,
+                 on_close: Callable[["Table"], None]) -> None:
+        """
+        A constructor for a Table object, it starts the task of the table.
+        :param name: The name of the table.
+        :param num_of_players: The number of players (2,3,4 or 6).
+        :param num_of_computers: How many of the players are computers.
+        :param time_budget: The number of seconds a computer player may think about a move.
+        :param max_depth: The deepest search of a computer player, in plies.
+        :param on_close: Called with the table when its game is over or all its players left.
+        """
+        self.name = name
+        self.num_of_players = num_of_players
+        self.num_of_computers = num_of_computers
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.seats: List[Connection] = []
+        self.state: Optional[GameState] = None
+        self.closed = False
+        self.commands: "asyncio.Queue[Tuple[str, Connection, Message]]" = asyncio.Queue()
+        self.__on_close = on_close
+        self.task = asyncio.ensure_future(self.run())
+
+    def broadcast(self, message: Message) -> None:
+        """
+        This function sends a message to every player at the table.
+        :param message: The message.
+        """
+        for connection in self.seats:
+            connection.send(message)
+
+    async def run(self) -> None:
+        """
+        This function handles the commands of the table until it closes.
+        """
+        try:
+            while not self.closed:
+                kind, connection, message = await self.commands.get()
+                if kind == "join":
+                    self.__join(connection, message)
+                elif kind == "move":
+                    self.__move(connection, message)
+                elif kind == "leave":
+                    self.__leave(connection)
+                if self.state is not None and not self.closed:
+                    await self.__computer_turns(self.state)
+        finally:
+            self.closed = True
+            for connection in self.seats:
+                connection.table = None
+            while not self.commands.empty():
+                kind, connection, _ = self.commands.get_nowait()
+                if kind == "join":
+                    connection.table = None
+                    connection.send({"type": "error", "message": "The table is closed"})
+            self.__on_close(self)
+
+    def __join(self, connection: Connection, message: Message) -> None:
+        """
+        This function seats a client, and starts the game when all the human seats are taken.
+        :param connection: The client.
+        :param message: The join message, with the name of the player.
+        """
+        name = message.get("name")
+        computer_names = {f"Computer {i + 1}" for i in range(self.num_of_computers)}
+        error = None
+        if self.state is not None or len(self.seats) == self.num_of_players - self.num_of_computers:
+            error = "The table is full"
+        elif not is_valid_name(name):
+            error = "Invalid name"
+        elif name in computer_names or any(seated.name == name for seated in self.seats):
+            error = "This name is already taken"
+        if error is not None:
+            connection.table = None
+            connection.send({"type": "error", "message": error})
+            # A table that no one could join would never close
+            self.closed = not self.seats
+            return
+        assert isinstance(name, str)
+        connection.name = name
+        self.seats.append(connection)
+        connection.send({"type": "joined", "table": self.name, "name": name, "seat": len(self.seats) - 1})
+        if len(self.seats) == self.num_of_players - self.num_of_computers:
+            state = GameState(GameConfig(self.num_of_players, self.num_of_computers,
+                                         player_names=[seated.name for seated in self.seats
+                                                       if seated.name is not None],
+                                         time_budget=self.time_budget, max_depth=self.max_depth))
+            self.state = state
+            self.broadcast({"type": "start", "table": self.name,
+                            "players": [{"name": player.get_name(), "color": list(player.get_color() or ()),
+                                         "computer": player.check_if_computer()}
+                                        for player in state.get_players().values() if player is not None],
+                            "turn": current_player(state).get_name()})
+            self.__skip_blocked_players(state)
+
+    def __move(self, connection: Connection, message: Message) -> None:
+        """
+        This function plays the move of a human player if it is its turn and the rules allow it.
+        :param connection: The client.
+        :param message: The move message, with the "from" and "to" cells as [row, col].
+        """
+        state = self.state
+        if state is None:
+            connection.send({"type": "error", "message": "The game didn't start"})
+            return
+        name = current_player(state).get_name()
+        if name != connection.name:
+            connection.send({"type": "error", "message": "Not your turn"})
+            return
+        piece_loc = parse_cell(message.get("from"))
+        destination = parse_cell(message.get("to"))
+        if piece_loc is None or destination is None or not state.play_move(piece_loc, destination):
+            connection.send({"type": "error", "message": "Illegal move"})
+            return
+        self.__moved(state, name)
+
+    def __leave(self, connection: Connection) -> None:
+        """
+        This function removes a client that disconnected, a game that started ends without a winner.
+        :param connection: The client.
+        """
+        if connection not in self.seats:
+            return
+        self.seats.remove(connection)
+        connection.table = None
+        if self.state is not None:
+            self.broadcast({"type": "game_over", "winner": None, "reason": f"{connection.name} left"})
+            self.closed = True
+        else:
+            self.broadcast({"type": "left", "name": connection.name})
+            self.closed = not self.seats
+
+    async def __computer_turns(self, state: GameState) -> None:
+        """
+        This function plays the turns of the computers until a human has to move or the game is over.
+        The search runs on a worker thread, so the other tables keep playing meanwhile.
+        :param state: The game of the table.
+        """
+        while not self.closed and current_player(state).check_if_computer():
+            name = current_player(state).get_name()
+            if await asyncio.to_thread(state.computer_move):
+                self.__moved(state, name)
+            else:
+                self.__skip_blocked_players(state)
+
+    def __moved(self, state: GameState, name: str) -> None:
+        """
+        This function tells the players about a move and checks if it ended the game.
+        :param state: The game of the table.
+        :param name: The name of the player that moved.
+        """
+        piece_loc, destination = state.history[-1]
+        self.broadcast({"type": "move", "player": name, "from": list(piece_loc), "to": list(destination),
+                        "ply": state.ply, "turn": current_player(state).get_name()})
+        winner = state.get_winner() if state.is_end_game() else None
+        if winner is not None:
+            self.broadcast({"type": "game_over", "winner": winner.get_name(), "reason": "win"})
+            self.closed = True
+        else:
+            self.__skip_blocked_players(state)
+
+    def __skip_blocked_players(self, state: GameState) -> None:
+        """
+        This function passes the turns of the players that have no legal moves,
+        the game ends without a winner when all the players passed in a row.
+        :param state: The game of the table.
+        """
+        for _ in range(self.num_of_players):
+            player = current_player(state)
+            if state.board.legal_moves(player):
+                return
+            state.pass_turn()
+            self.broadcast({"type": "pass", "player": player.get_name(),
+                            "turn": current_player(state).get_name()})
+        self.broadcast({"type": "game_over", "winner": None, "reason": "blocked"})
+        self.closed = True
+
+
+def current_player(state: GameState) -> Player:
+    """
+    :param state: A game that started.
+    :return: The player whose turn it is.
+    """
+    player = state.get_current_player()
+    assert player is not None, "The game has no players"
+    return player
+
+
+def is_valid_name(name: Any) -> bool:
+    """
+    :param name: The name of a join message.
+    :return: True if it can be the name of a player.
+    """
+    return isinstance(name, str) and name != "" and not name.isspace()
+
+
+def parse_cell(value: Any) -> Optional[Coordinates]:
+    """
+    :param value: A cell of a message, e.g. [3, 11].
+    :return: The cell as (row, col), None if it is not a pair of integers.
+    """
+    if isinstance(value, list) and len(value) == 2 and all(type(x) is int for x in value):
+        return value[0], value[1]
+    return None
+
+
+class GameServer:
+    """
+    A class that hosts many games over TCP, every game is a Table with its own task.
+    A client sends a join message to take a seat at a table, the table is created by the first join:
+        {"type": "join", "table": "t1", "name": "Alice", "players": 2, "computers": 0}
+    and then its moves:
+        {"type": "move", "from": [3, 11], "to": [4, 10]}
+    The server answers with joined, start, move, pass, left, game_over and error messages.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, time_budget: float = 0.5,
+                 max_depth: int = 2) -> None:
+        """
+        A constructor for a GameServer object.
+        :param host: The address to listen on.
+        :param port: The port to listen on, 0 for any free port.
+        :param time_budget: The number of seconds a computer player may think about a move.
+        :param max_depth: The deepest search of a computer player, in plies.
+        """
+        self.host = host
+        self.port = port
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.tables: Dict[str, Table] = {}
+        self.__server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> int:
+        """
+        This function starts listening.
+        :return: The port the server listens on.
+        """
+        self.__server = await asyncio.start_server(self.handle_client, self.host, self.port, limit=MAX_LINE,
+                                                   backlog=BACKLOG)
+        self.port = self.__server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self) -> None:
+        """
+        This function starts listening and serves until the task is cancelled.
+        """
+        if self.__server is None:
+            await self.start()
+        server = self.__server
+        assert server is not None
+        async with server:
+            await server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        This function stops listening and stops the tasks of all the tables.
+        """
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+        tables = list(self.tables.values())
+        for table in tables:
+            table.task.cancel()
+        await asyncio.gather(*(table.task for table in tables), return_exceptions=True)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        This function reads the messages of a client until it disconnects.
+        :param reader: The stream the client's messages come from.
+        :param writer: The stream the messages to the client go to.
+        """
+        connection = Connection(reader, writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break  # A line over MAX_LINE, or the connection was reset
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    message = None
+                if not isinstance(message, dict):
+                    connection.send({"type": "error", "message": "Invalid message"})
+                else:
+                    self.__handle_message(connection, message)
+                await writer.drain()
+        finally:
+            if connection.table is not None:
+                connection.table.commands.put_nowait(("leave", connection, {}))
+            writer.close()
+
+    def __handle_message(self, connection: Connection, message: Message) -> None:
+        """
+        This function passes a message of a client to its table.
+        :param connection: The client.
+        :param message: The message.
+        """
+        kind = message.get("type")
+        if kind == "join":
+            if connection.table is not None:
+                connection.send({"type": "error", "message": "Already at a table"})
+                return
+            if not is_valid_name(message.get("name")):
+                # Checked before the table is made, a table no one joins would never close
+                connection.send({"type": "error", "message": "Invalid name"})
+                return
+            table = self.__get_table(message)
+            if table is None:
+                connection.send({"type": "error", "message": "Invalid table settings"})
+                return
+            connection.table = table
+            table.commands.put_nowait(("join", connection, message))
+        elif kind == "move":
+            if connection.table is None:
+                connection.send({"type": "error", "message": "Not at a table"})
+                return
+            connection.table.commands.put_nowait(("move", connection, message))
+        else:
+            connection.send({"type": "error", "message": "Unknown message type"})
+
+    def __get_table(self, message: Message) -> Optional[Table]:
+        """
+        :param message: A join message.
+        :return: The table the message names, created with the settings of the message if it is new,
+        None if the settings are invalid.
+        """
+        name = message.get("table")
+        if not isinstance(name, str):
+            return None
+        table = self.tables.get(name)
+        if table is not None and not table.closed:
+            return table
+        num_of_players = message.get("players", 2)
+        num_of_computers = message.get("computers", 0)
+        if type(num_of_players) is not int or type(num_of_computers) is not int:
+            return None
+        if not GameState().is_valid_num_of_players(num_of_players) or not 0 <= num_of_computers < num_of_players:
+            return None
+        table = Table(name, num_of_players, num_of_computers, self.time_budget, self.max_depth, self.__close_table)
+        self.tables[name] = table
+        return table
+
+    def __close_table(self, table: Table) -> None:
+        """
+        This function forgets a table that closed, so its name can be used for a new game.
+        :param table: The table.
+        """
+        if self.tables.get(table.name) is table:
+            del self.tables[table.name]
+
+
+class GameClient:
+    """
+    A class that plays at a GameServer table, e.g. from a test or a bot.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        A constructor for a GameClient object, use GameClient.connect to open the connection.
+        :param reader: The stream the server's messages come from.
+        :param writer: The stream the messages to the server go to.
+        """
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> "GameClient":
+        """
+        This function connects to a server.
+        :param host: The address of the server.
+        :param port: The port of the server.
+        :return: A GameClient object.
+        """
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def send(self, message: Message) -> None:
+        """
+        This function sends a message to the server.
+        :param message: The message.
+        """
+        self.writer.write((json.dumps(message) + "\n").encode("utf-8"))
+        await self.writer.drain()
+
+    async def receive(self) -> Message:
+        """
+        :return: The next message of the server.
+        """
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("The server closed the connection")
+        return json.loads(line)
+
+    async def join(self, table: str, name: str, num_of_players: int = 2, num_of_computers: int = 0) -> None:
+        """
+        This function asks for a seat at a table.
+        :param table: The name of the table.
+        :param name: The name of the player.
+        :param num_of_players: The number of players, if the table is new.
+        :param num_of_computers: How many of the players are computers, if the table is new.
+        """
+        await self.send({"type": "join", "table": table, "name": name, "players": num_of_players,
+                         "computers": num_of_computers})
+
+    async def move(self, piece_loc: Coordinates, destination: Coordinates) -> None:
+        """
+        This function sends a move.
+        :param piece_loc: The location of the piece to move.
+        :param destination: The location to move it to.
+        """
+        await self.send({"type": "move", "from": list(piece_loc), "to": list(destination)})
+
+    async def close(self) -> None:
+        """
+        This function closes the connection.
+        """
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def main() -> None:
+    """
+    Runs a game server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Host Chinese Checkers games over TCP.")
+    parser.add_argument("--host", default="127.0.0.1", help="the address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="the port to listen on")
+    parser.add_argument("--time-budget", type=float, default=0.5, help="seconds per computer move")
+    parser.add_argument("--depth", type=int, default=2, help="deepest computer search in plies")
+    args = parser.parse_args()
+
+    server = GameServer(args.host, args.port, args.time_budget, args.depth)
+    print(f"Serving on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
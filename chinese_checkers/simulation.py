@@ -0,0 +1,245 @@
+import argparse
+import time
+from typing import Tuple, List, Optional, Sequence
+from .board import CELLS, CELL_INDEX, DIRECTIONS
+from .distances import distance_tables
+from .game_record import RecordedGame, game_to_text_log
+from .game_state import GameState, PLAYER_COLORS
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the rest of the game doesn't need it
+    np = None  # type: ignore[assignment]
+
+PlayerInfo = Tuple[str, Tuple[int, int, int], bool]
+
+POLICIES = ("random", "greedy")
+NUM_OF_PIECES = 10
+# An extra cell that is always occupied stands for the cells off the board, so the tables need no bounds checks
+OFF_BOARD = len(CELLS)
+
+
+def _direction_tables() -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    :return: The neighbor of every cell in every direction and the cell a jump in every direction lands on,
+    both OFF_BOARD if it is off the board.
+    """
+    neighbors = np.full((len(CELLS) + 1, len(DIRECTIONS)), OFF_BOARD, dtype=np.int64)
+    for index, (row, col) in enumerate(CELLS):
+        for d, (d_row, d_col) in enumerate(DIRECTIONS):
+            neighbors[index, d] = CELL_INDEX.get((row + d_row, col + d_col), OFF_BOARD)
+    landings = neighbors[neighbors[:, np.arange(len(DIRECTIONS))], np.arange(len(DIRECTIONS))]
+    return neighbors, landings
+
+
+class BatchSimulation:
+    """
+    A class that plays many computer games in lockstep, every step plays one ply of every unfinished game.
+    The boards are rows of numpy arrays, so the moves of all the games are generated and chosen together:
+    every row of self.occupied is a board (with the OFF_BOARD cell last) and
+    self.positions[game, player] holds the cell indices of a player's pieces.
+    The players are "Computer 1", "Computer 2"... in the colors and turn order GameState gives them.
+    """
+
+    def __init__(self, num_of_games: int, num_of_players: int = 2, policy: str = "greedy", max_plies: int = 1000,
+                 seed: Optional[int] = None) -> None:
+        """
+        A constructor for a BatchSimulation object, all the games start from the starting position.
+        :param num_of_games: The number of games to play together.
+        :param num_of_players: The number of players of every game.
+        :param policy: "random" plays a random legal move, "greedy" the move that gets the piece closest to
+        the far corner of its target, with random tie breaks.
+        :param max_plies: The number of plies after which an unfinished game stops.
+        :param seed: The seed of the random choices, the games are the same for the same seed.
+        """
+        if np is None:
+            raise ImportError("BatchSimulation needs numpy")
+        if policy not in POLICIES:
+            raise ValueError(f"Invalid policy: {policy}")
+        state = GameState()
+        self.players_info: List[PlayerInfo] = [(f"Computer {i + 1}", PLAYER_COLORS[i], True)
+                                               for i in range(num_of_players)]
+        state.setup_players(self.players_info)
+        players = [player for player in state.get_players().values() if player is not None]
+        self.num_of_games = num_of_games
+        self.num_of_players = num_of_players
+        self.policy = policy
+        self.max_plies = max_plies
+        self.rng = np.random.default_rng(seed)
+        self.neighbors, self.landings = _direction_tables()
+        # The distances to the far corner of the targets, rows of players without targets are all zero
+        self.distances = np.zeros((num_of_players, len(CELLS) + 1), dtype=np.float64)
+        self.targets = np.zeros((num_of_players, len(CELLS) + 1), dtype=bool)
+        start = np.zeros((num_of_players, NUM_OF_PIECES), dtype=np.int64)
+        for i, player in enumerate(players):
+            target_locs = player.get_target_locs()
+            if target_locs:
+                self.distances[i, :-1] = distance_tables(target_locs).to_apex
+                self.targets[i, [CELL_INDEX[loc] for loc in target_locs]] = True
+            start[i] = sorted(CELL_INDEX[loc] for loc in player.get_pieces())
+        self.positions = np.repeat(start[None], num_of_games, axis=0)
+        self.occupied = np.zeros((num_of_games, len(CELLS) + 1), dtype=bool)
+        self.occupied[:, start.ravel()] = True
+        self.occupied[:, OFF_BOARD] = True
+        self.turns = np.zeros(num_of_games, dtype=np.int64)
+        self.plies = np.zeros(num_of_games, dtype=np.int64)
+        self.winners = np.full(num_of_games, -1, dtype=np.int64)
+        # The number of players in a row that passed their turn, a game ends when all of them passed
+        self.passes = np.zeros(num_of_games, dtype=np.int64)
+        self.moves = np.zeros((num_of_games, max_plies, 2), dtype=np.uint8)
+
+    def active_games(self) -> "np.ndarray":
+        """
+        :return: The indices of the games that have no winner, have not reached max_plies
+        and where not all the players passed in a row.
+        """
+        return np.nonzero((self.winners < 0) & (self.plies < self.max_plies) &
+                          (self.passes < self.num_of_players))[0]
+
+    def destinations(self, games: "np.ndarray") -> "np.ndarray":
+        """
+        This function finds the destinations of the pieces of the player to move in some games.
+        A piece steps to an empty neighbor or jumps over a neighbor to the empty cell behind it, repeatedly.
+        The jumps of all the pieces of all the games are followed together, one jump further every round,
+        until no piece reaches a new cell.
+        :param games: The indices of the games.
+        :return: A boolean array [game, piece, cell] of the cells every piece can move to.
+        """
+        rows = np.arange(len(games))
+        occupied = self.occupied[games]
+        sources = self.positions[games, self.turns[games]]
+        # The cells are the first axis while the jumps are followed, so every jump direction moves whole rows
+        cell_occupied = occupied.T[:, :, None]
+        # A jump in a direction is open if the cell it jumps over is occupied and the landing cell is empty
+        open_jumps = [cell_occupied[self.neighbors[:-1, d]] & ~cell_occupied[self.landings[:-1, d]]
+                      for d in range(len(DIRECTIONS))]
+        reached = np.zeros((len(CELLS) + 1, len(games), NUM_OF_PIECES), dtype=bool)
+        reached[sources, rows[:, None], np.arange(NUM_OF_PIECES)[None, :]] = True
+        while True:
+            next_reached = reached.copy()
+            for d in range(len(DIRECTIONS)):
+                # Every cell is the landing of at most one jump in a direction, except OFF_BOARD which is never used
+                next_reached[self.landings[:-1, d]] |= reached[:-1] & open_jumps[d]
+            if np.array_equal(next_reached, reached):
+                break
+            reached = next_reached
+        steps = self.neighbors[sources]
+        reached[steps, rows[:, None, None], np.arange(NUM_OF_PIECES)[None, :, None]] = True
+        reached = reached.transpose(1, 2, 0)
+        return reached & ~occupied[:, None, :]
+
+    def choose_moves(self, games: "np.ndarray", destinations: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        This function picks a move in every game with the policy of the simulation.
+        :param games: The indices of the games.
+        :param destinations: The destinations of the pieces in those games.
+        :return: The index of the chosen piece and the chosen destination in every game.
+        """
+        scores = self.rng.random(destinations.shape)
+        if self.policy == "greedy":
+            distances = self.distances[self.turns[games]]
+            sources = self.positions[games, self.turns[games]]
+            gains = np.take_along_axis(distances, sources, axis=1)[:, :, None] - distances[:, None, :]
+            scores = scores * 0.5 + gains  # The gains are whole numbers, so the random part only breaks ties
+        scores[~destinations] = -np.inf
+        flat = scores.reshape(len(games), -1).argmax(axis=1)
+        return flat // (len(CELLS) + 1), flat % (len(CELLS) + 1)
+
+    def step(self) -> int:
+        """
+        This function plays one ply of every unfinished game.
+        A player without legal moves passes its turn, and a game where all the players passed in a row
+        ends without a winner.
+        :return: The number of games that were not finished before the step.
+        """
+        games = self.active_games()
+        num_of_active = len(games)
+        if num_of_active == 0:
+            return 0
+        destinations = self.destinations(games)
+        can_move = destinations.reshape(len(games), -1).any(axis=1)
+        pieces, targets = self.choose_moves(games, destinations)
+        movers = self.turns[games]
+        self.passes[games] = np.where(can_move, 0, self.passes[games] + 1)
+        games, movers, pieces, targets = games[can_move], movers[can_move], pieces[can_move], targets[can_move]
+        sources = self.positions[games, movers, pieces]
+        self.occupied[games, sources] = False
+        self.occupied[games, targets] = True
+        self.positions[games, movers, pieces] = targets
+        self.moves[games, self.plies[games]] = np.stack((sources, targets), axis=1)
+        self.plies[games] += 1
+        won = self.targets[movers[:, None], self.positions[games, movers]].all(axis=1)
+        self.winners[games[won]] = movers[won]
+        active = self.active_games()
+        self.turns[active] = (self.turns[active] + 1) % self.num_of_players
+        return num_of_active
+
+    def run(self) -> None:
+        """
+        This function plays all the games until they are won, reach max_plies or all their players are blocked.
+        """
+        while self.step():
+            pass
+
+    def recorded_games(self, start_time: Optional[int] = None) -> List[RecordedGame]:
+        """
+        :param start_time: The start time of all the games, in seconds since the epoch, the current time if None.
+        :return: Every game as a RecordedGame, that can be written as a binary record, to an archive or as a
+        text log that Game can load.
+        """
+        start_time = int(time.time()) if start_time is None else start_time
+        games = []
+        for game in range(self.num_of_games):
+            moves = [(int(src), int(dst)) for src, dst in self.moves[game, :self.plies[game]]]
+            messages = [(len(moves), "Game Over")] if self.winners[game] >= 0 else []
+            games.append(RecordedGame(list(self.players_info), moves, messages, start_time))
+        return games
+
+    def write_archive(self, archive_file: str) -> None:
+        """
+        This function writes all the games to an archive.
+        :param archive_file: The name of the archive file.
+        """
+        from .archive import ArchiveWriter
+        writer = ArchiveWriter(archive_file)
+        for game in self.recorded_games():
+            writer.add_game(game)
+        writer.close()
+
+    def write_text_logs(self, log_files: Sequence[str]) -> None:
+        """
+        This function writes every game as a text log file, that Game can load.
+        :param log_files: The names of the log files, one for every game.
+        """
+        for game, log_file in zip(self.recorded_games(), log_files):
+            game_to_text_log(game, log_file)
+
+
+def main() -> None:
+    """
+    Plays a batch of computer games from the command line and prints how they ended.
+    """
+    parser = argparse.ArgumentParser(description="Play many computer games together with simple policies.")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--players", type=int, default=2, help="number of players of every game")
+    parser.add_argument("--policy", choices=POLICIES, default="greedy", help="how the computers choose moves")
+    parser.add_argument("--max-plies", type=int, default=1000, help="plies after which a game stops")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random choices")
+    parser.add_argument("--archive", default=None, help="an archive file to write the games to")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    simulation = BatchSimulation(args.games, args.players, args.policy, args.max_plies, args.seed)
+    simulation.run()
+    elapsed = time.perf_counter() - start
+    won = simulation.winners >= 0
+    print(f"{args.games} games in {elapsed:.1f}s, {int(simulation.plies.sum())} plies")
+    for i, (name, _, _) in enumerate(simulation.players_info):
+        print(f"{name}: {int((simulation.winners == i).sum())} wins")
+    print(f"Unfinished: {int((~won).sum())}")
+    if args.archive is not None:
+        simulation.write_archive(args.archive)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence
+from .endgame import Tablebase
+from .game_state import GameState, GameConfig
+
+
+class GameRecord(NamedTuple):
+    """
+    The result of a single self-play game.
+    """
+    game_id: int
+    num_of_players: int
+    seed: int
+    winner: Optional[str]
+    winner_seat: Optional[int]
+    plies: int
+    mean_move_time: float
+    max_move_time: float
+
+
+def play_game(game_id: int, config: GameConfig, seed: int) -> GameRecord:
+    """
+    This function plays a full computer game without a window and returns its result.
+    It runs inside a worker process, every game gets its own board and a seeded random generator.
+    :param game_id: The number of the game in the tournament.
+    :param config: The settings of the game, all the players should be computers.
+    :param seed: The seed of the random generator of the game.
+    :return: A GameRecord object.
+    """
+    random.seed(seed)
+    config.seed = seed
+    state = GameState(config)
+    winner = state.run()
+    seats = list(state.get_players())
+    move_times = state.move_times or [0.0]
+    return GameRecord(game_id, config.num_of_players, seed,
+                      winner.get_name() if winner is not None else None,
+                      seats.index(winner.get_name()) if winner is not None else None,
+                      state.ply, sum(move_times) / len(move_times), max(move_times))
+
+
+def run_tournament(num_of_games: int, player_counts: Sequence[int] = (2,), workers: Optional[int] = None,
+                   time_budget: float = 0.1, max_depth: int = 2, max_plies: Optional[int] = 1000,
+                   seed: int = 0, opening_book: Optional[str] = None,
+                   endgame_tables: Optional[str] = None) -> List[GameRecord]:
+    """
+    This function plays many self-play games in parallel, on a pool of worker processes.
+    :param num_of_games: The number of games to play for every number of players.
+    :param player_counts: The numbers of players to play games with, e.g. (2, 3, 4, 6).
+    :param workers: The number of worker processes, the number of CPUs by default.
+    :param time_budget: The number of seconds a computer may think about a move.
+    :param max_depth: The deepest search of the computers, in plies.
+    :param max_plies: The number of moves after which a game is stopped without a winner.
+    :param seed: The seed the seeds of the games are derived from.
+    :param opening_book: The name of an opening book file for the computers, None to always search.
+    :param endgame_tables: The directory of the endgame tables of the computers, None to not use them.
+    :return: The records of the games, in the order they were scheduled.
+    """
+    game_ids: List[int] = []
+    configs: List[GameConfig] = []
+    seeds: List[int] = []
+    for num_of_players in player_counts:
+        for _ in range(num_of_games):
+            game_ids.append(len(game_ids))
+            configs.append(GameConfig(num_of_players, time_budget=time_budget, max_depth=max_depth,
+                                      max_plies=max_plies, opening_book=opening_book,
+                                      endgame_tables=endgame_tables))
+            seeds.append(seed + len(seeds))
+    if endgame_tables is not None:
+        # The tables are built once here, instead of by every worker that needs them at the same time
+        tablebase = Tablebase(endgame_tables)
+        for num_of_players in player_counts:
+            for player in GameState(GameConfig(num_of_players)).get_players().values():
+                if player is not None:
+                    tablebase.get_table(player.get_target_locs())
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(play_game, game_ids, configs, seeds))
+
+
+def main() -> None:
+    """
+    Runs a tournament from the command line and prints a summary of the results.
+    """
+    parser = argparse.ArgumentParser(description="Play self-play games between computer players in parallel.")
+    parser.add_argument("--games", type=int, default=10, help="games to play for every number of players")
+    parser.add_argument("--players", type=int, nargs="+", default=[2], help="numbers of players, e.g. 2 3 4 6")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, all the CPUs by default")
+    parser.add_argument("--time-budget", type=float, default=0.1, help="seconds per computer move")
+    parser.add_argument("--depth", type=int, default=2, help="deepest search in plies")
+    parser.add_argument("--max-plies", type=int, default=1000, help="moves after which a game is stopped")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--book", default=None, help="an opening book file for the computers")
+    parser.add_argument("--endgame", default=None, help="the directory of the endgame tables of the computers")
+    parser.add_argument("--output", default=None, help="a file to write one JSON record per game to")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    records = run_tournament(args.games, args.players, args.workers, args.time_budget, args.depth,
+                             args.max_plies, args.seed, args.book, args.endgame)
+    elapsed = time.perf_counter() - start
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            for record in records:
+                file.write(json.dumps(record._asdict()) + "\n")
+    for num_of_players in args.players:
+        games = [record for record in records if record.num_of_players == num_of_players]
+        seat_wins = [sum(record.winner_seat == seat for record in games) for seat in range(num_of_players)]
+        unfinished = sum(record.winner is None for record in games)
+        mean_plies = sum(record.plies for record in games) / len(games)
+        print(f"{num_of_players} players: wins per seat {seat_wins}, unfinished {unfinished}, "
+              f"mean plies {mean_plies:.1f}")
+    print(f"{len(records)} games in {elapsed:.1f}s on {args.workers or os.cpu_count()} workers "
+          f"({len(records) / elapsed:.2f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from typing import Tuple, List, Optional
+
+Coordinates = Tuple[int, int]
+Move = Tuple[Coordinates, Coordinates]
+# (key, depth, score, flag, best move)
+Entry = Tuple[int, int, int, int, Optional[Move]]
+
+# What the stored score means.
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TranspositionTable:
+    """
+    A bounded table of search results keyed by the Zobrist key of a position.
+    Every slot has two tiers: a depth-preferred entry that keeps the deepest result,
+    and an always-replace entry that keeps the most recent one.
+    """
+
+    def __init__(self, size: int = 1 << 16) -> None:
+        """
+        A constructor for a TranspositionTable object.
+        :param size: The number of slots, rounded up to a power of two.
+        """
+        self.size = 1 << max(0, size - 1).bit_length()
+        self.__mask = self.size - 1
+        self.__deep: List[Optional[Entry]] = [None] * self.size
+        self.__recent: List[Optional[Entry]] = [None] * self.size
+
+    def store(self, key: int, depth: int, score: int, flag: int, move: Optional[Move]) -> None:
+        """
+        This function saves the result of a search.
+        :param key: The key of the position.
+        :param depth: The depth the position was searched to.
+        :param score: The score of the position.
+        :param flag: EXACT, LOWER_BOUND or UPPER_BOUND.
+        :param move: The best move found, None if there is none.
+        """
+        slot = key & self.__mask
+        entry = (key, depth, score, flag, move)
+        deep = self.__deep[slot]
+        if deep is None or deep[0] == key or depth >= deep[1]:
+            self.__deep[slot] = entry
+        else:
+            self.__recent[slot] = entry
+
+    def lookup(self, key: int) -> Optional[Entry]:
+        """
+        This function finds the saved result of a position.
+        :param key: The key of the position.
+        :return: The (key, depth, score, flag, move) entry, None if the position is not in the table.
+        """
+        slot = key & self.__mask
+        deep = self.__deep[slot]
+        if deep is not None and deep[0] == key:
+            return deep
+        recent = self.__recent[slot]
+        if recent is not None and recent[0] == key:
+            return recent
+        return None
+
+    def clear(self) -> None:
+        """
+        This function removes all the entries of the table.
+        """
+        self.__deep = [None] * self.size
+        self.__recent = [None] * self.size
+
+    def __len__(self) -> int:
+        """
+        :return: The number of entries in the table.
+        """
+        return sum(entry is not None for entry in self.__deep) + sum(entry is not None for entry in self.__recent)
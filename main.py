@@ -1,49 +1,75 @@
 import os.path
 import pygame
 import sys
-from chinese_checkers.constants import WIDTH, HEIGHT
+from chinese_checkers.constants import WIDTH, HEIGHT, COMPUTER_TICK_MS, IDLE_TIMEOUT_MS
 from chinese_checkers.game import Game
+from chinese_checkers.ai_worker import AI_MOVE_EVENT
 
 
 def main() -> None:
-
-
-    run = True
-    clock = pygame.time.Clock()
-
+    """
+    The main loop of the game. It sleeps until an event comes, the computers search for their moves
+    on a worker thread that posts them as events, and their moves are played on a tick,
+    so an idle window uses almost no CPU and the window keeps responding while a computer thinks.
+    """
+    # Mouse motion would wake the loop up for nothing
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
     game = Game(WIN)
-
+    game.update()
+    game.think_in_background()
+    next_computer_turn = pygame.time.get_ticks() + COMPUTER_TICK_MS
+    computer_move = None
+    run = True
     while run:
-        clock.tick(FPS)
-        play_again = True
-        while play_again:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    run = False
-                    if game.log_file is not None:
-                        game.log_game_end("Quit Game")
+        if computer_move is not None:
+            timeout = max(1, next_computer_turn - pygame.time.get_ticks())
+        else:
+            timeout = IDLE_TIMEOUT_MS
+        # Wake up when the buffered log lines are due, so they reach the file while the window is idle
+        log_due_in = game.tick_log()
+        if log_due_in is not None:
+            timeout = min(timeout, max(1, int(log_due_in * 1000) + 1))
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.QUIT:
+            run = False
+            game.stop_thinking()
+            if game.log_file is not None:
+                game.log_game_end("Quit Game")
+            game.close_log()
+            break
+        if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+            game.redraw()
+        elif event.type == pygame.MOUSEBUTTONDOWN and not game.is_computer_turn():
+            game.play(event)  # Pass the event to the game to handle
+            game.think_in_background()
+            next_computer_turn = pygame.time.get_ticks() + COMPUTER_TICK_MS
+        elif event.type == AI_MOVE_EVENT:
+            computer_move = event
+        if computer_move is not None and pygame.time.get_ticks() >= next_computer_turn:
+            game.play(computer_move)
+            computer_move = None
+            game.think_in_background()
+            next_computer_turn = pygame.time.get_ticks() + COMPUTER_TICK_MS
+        if game.is_end_game():
+            game.stop_thinking()
+            counter = 0
+            answer = ""
+            while counter < 1:
+                answer = input("Do you want to play again? (y/n): ")
+                if answer.lower() != "y" and answer.lower() != "n":
+                    print("Invalid input. Please enter 'y' or 'n'")
+                    continue
                 else:
-                    game.play(event)  # Pass the event to the game to handle
-                    if game.is_end_game():
-                        counter = 0
-                        answer = ""
-                        while counter < 1:
-                            answer = input("Do you want to play again? (y/n): ")
-                            if answer.lower() != "y" and answer.lower() != "n":
-                                print("Invalid input. Please enter 'y' or 'n'")
-                                continue
-                            else:
-                                counter += 1
-                        if answer.lower() == "y":
-                            game = Game(WIN)
-                            play_again = True
-                        elif answer.lower() == "n":
-                            play_again = False
-                            run = False
-                            break
-                        break
-
-            game.update()  # Update the game state and draw the board
+                    counter += 1
+            game.close_log()
+            if answer.lower() == "y":
+                game = Game(WIN)
+                game.update()
+                game.think_in_background()
+                next_computer_turn = pygame.time.get_ticks() + COMPUTER_TICK_MS
+                computer_move = None
+            elif answer.lower() == "n":
+                run = False
 
     pygame.quit()
     sys.exit()
@@ -77,7 +103,5 @@ if __name__ == "__main__":
         WIN = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Chinese Checkers")
 
-        FPS = 60
-
         main()
 